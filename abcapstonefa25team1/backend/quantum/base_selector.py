@@ -0,0 +1,180 @@
+# Project: PSU Abington Fall 2025 Capstone
+# Purpose Details: Base selection engine for Shor's algorithm
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: 10/17/26
+# Last Date Changed: 10/17/26
+# Revision: 0.1.0
+import logging
+import math
+import random
+from typing import Dict, List, Optional, Set
+
+
+def jacobi(a: int, n: int) -> int:
+    """
+    Jacobi symbol (a/n) for odd n > 0.
+
+    Args:
+        a: Integer on top
+        n: Odd positive modulus
+
+    Returns:
+        -1, 0 or 1
+    """
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+class BaseSelector:
+    def __init__(self, pool_limit: int = 4096, small_order_bound: int = 16):
+        """
+        Hands out bases for Shor's algorithm without replacement, best first.
+
+        Candidates are ranked by the Jacobi symbol (a/N): bases with (a/N) = -1,
+        whose order is guaranteed to be even, come before those with (a/N) = 1.
+        A base with (a/N) = 0 shares a factor with N, which gcd(a, N) would
+        reveal without any period finding, so it is left out of the pool.
+        Bases whose order is small enough to find classically are dropped
+        when that order is odd or gives a^(r/2) ≡ -1 (mod N). Failed bases
+        are remembered per N.
+
+        Args:
+            pool_limit: Maximum number of candidate bases ranked per N
+            small_order_bound: Largest order looked for classically while screening
+        """
+        self.logger = logging.getLogger("sred_cli.base_selector.BaseSelector")
+        self.pool_limit = pool_limit
+        self.small_order_bound = small_order_bound
+
+        self.failed: Dict[int, Set[int]] = {}
+        self.avoided_simulations = 0
+        self._pools: Dict[int, List[int]] = {}
+
+    def next_base(self, N: int) -> Optional[int]:
+        """
+        Return the most promising untried base for N.
+
+        Args:
+            N: The number being factored (odd, composite)
+
+        Returns:
+            A base a with 2 <= a <= N - 2 and gcd(a, N) = 1, or None if N has
+            no usable bases
+        """
+        if N < 5:
+            return None
+
+        for _ in range(2):
+            pool = self._pools.get(N)
+            if pool is None:
+                pool = self._pools[N] = self._build_pool(N)
+
+            failed = self.failed.setdefault(N, set())
+            while pool:
+                a = pool.pop()
+                if a in failed:
+                    self.avoided_simulations += 1
+                    continue
+                if self._is_known_bad(a, N):
+                    self.avoided_simulations += 1
+                    failed.add(a)
+                    self.logger.debug(f"Skipping a = {a}: its order is known to be useless")
+                    continue
+                return a
+
+            # Every base has been tried, so start over rather than give up
+            self.logger.debug(f"All bases for N = {N} have failed, forgetting them")
+            self.failed.pop(N, None)
+            self._pools.pop(N, None)
+        return None
+
+    def take(self, N: int, count: int) -> List[int]:
+        """
+        Return up to `count` distinct bases for N, best first.
+
+        Args:
+            N: The number being factored
+            count: Number of bases wanted
+
+        Returns:
+            List of distinct bases
+        """
+        bases: List[int] = []
+        while len(bases) < count:
+            a = self.next_base(N)
+            if a is None or a in bases:
+                break
+            bases.append(a)
+        return bases
+
+    def record_failure(self, N: int, a: int, r: Optional[int] = None) -> None:
+        """
+        Remember that base a did not factor N.
+
+        When the period r is known, bases that are certain to fail the same
+        way are retired too: every power of a when r is odd, and every
+        generator of <a> when a^(r/2) ≡ -1 (mod N).
+
+        Args:
+            N: The number being factored
+            a: The base that failed
+            r: The period found for a, if any
+        """
+        failed = self.failed.setdefault(N, set())
+        failed.add(a)
+        if r is None or r > self.pool_limit:
+            return
+
+        odd = r % 2 == 1
+        if not odd and pow(a, r // 2, N) != N - 1:
+            return
+
+        x = 1
+        for j in range(1, r):
+            x = (x * a) % N
+            if odd or math.gcd(j, r) == 1:
+                failed.add(x)
+
+    def _build_pool(self, N):
+        """Candidate bases for N ranked so that the best one is popped first."""
+        if N - 3 > self.pool_limit:
+            candidates = random.sample(range(2, N - 1), self.pool_limit)
+        else:
+            candidates = list(range(2, N - 1))
+            random.shuffle(candidates)
+
+        failed = self.failed.get(N, set())
+        ranked = []
+        for a in candidates:
+            if a in failed:
+                continue
+            symbol = jacobi(a, N)
+            if symbol == 0:
+                continue  # shares a factor with N, not a base for period finding
+            ranked.append((symbol, a))
+
+        # Tier 0: (a/N) = -1 (even order); tier 1: (a/N) = 1
+        ranked.sort(key=lambda item: item[0])
+        return [a for _, a in reversed(ranked)]
+
+    def _is_known_bad(self, a, N):
+        """True if a has a small order that is odd or gives a^(r/2) ≡ -1 (mod N)."""
+        if math.gcd(a, N) != 1:
+            return False
+        x = 1
+        for r in range(1, self.small_order_bound + 1):
+            x = (x * a) % N
+            if x == 1:
+                return r % 2 == 1 or pow(a, r // 2, N) == N - 1
+        return False
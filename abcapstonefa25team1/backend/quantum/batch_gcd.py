@@ -0,0 +1,143 @@
+# Project: PSU Abington Fall 2025 Capstone
+# Purpose Details: Bernstein batch GCD over many RSA moduli, Shor for the rest
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: 10/17/26
+# Last Date Changed: 10/17/26
+# Revision: 0.1.0
+import logging
+import math
+import random
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from abcapstonefa25team1.backend.quantum.classical_shors import Classical_Shors
+
+
+def product_tree(values: Sequence[int]) -> List[List[int]]:
+    """
+    Levels of the product tree: level 0 is the input, each next level
+    multiplies neighbouring pairs, and the last level holds the full product.
+
+    Args:
+        values: The leaves.
+    Returns:
+        The list of levels, leaves first.
+    """
+    levels = [list(values)]
+    while len(levels[-1]) > 1:
+        prev = levels[-1]
+        levels.append([prev[i] * prev[i + 1] if i + 1 < len(prev) else prev[i] for i in range(0, len(prev), 2)])
+    return levels
+
+
+def batch_gcd(moduli: Sequence[int]) -> List[int]:
+    """
+    gcd(N_i, prod_{j != i} N_j) for every modulus at once (Bernstein).
+
+    The product P of all moduli is reduced down the product tree modulo the
+    squares of the nodes, which leaves P mod N_i^2 at each leaf; then
+    gcd(N_i, (P mod N_i^2) / N_i) is the gcd of N_i with the other moduli.
+
+    Args:
+        moduli: Distinct moduli.
+    Returns:
+        One gcd per modulus, in input order (1 when it shares no prime).
+    """
+    if len(moduli) < 2:
+        return [1] * len(moduli)
+    tree = product_tree(moduli)
+    remainders = tree[-1]
+    for level in reversed(tree[:-1]):
+        remainders = [remainders[i // 2] % (x * x) for i, x in enumerate(level)]
+    return [math.gcd(r // n, n) for r, n in zip(remainders, moduli)]
+
+
+class BatchGCD:
+    STAGES = ("batch-gcd", "shor")
+
+    def __init__(
+        self,
+        fallback: Optional[Callable[[int], Optional[Tuple[int, int]]]] = None,
+        pairwise_samples: int = 200,
+    ):
+        """
+        Args:
+            fallback: Factoring routine for moduli that share no prime with
+                another one, returning (p, q) or None. Defaults to
+                Classical_Shors().shors_classical.
+            pairwise_samples: Pairs timed to estimate the cost of the naive
+                all-pairs gcd the batch GCD replaces.
+        """
+        self.logger = logging.getLogger("sred_cli.batch_gcd.BatchGCD")
+        self.logger.debug("Creating an instance of logger for BatchGCD")
+        self.fallback = fallback or Classical_Shors().shors_classical
+        self.pairwise_samples = pairwise_samples
+
+        # Filled by factor(): seconds and moduli factored per stage, plus estimates
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    def factor(self, moduli: Sequence[int]) -> Dict[int, Optional[Tuple[int, int, str]]]:
+        """
+        Factor many moduli: shared primes first via batch GCD, then the
+        fallback engine on whatever is left.
+
+        Args:
+            moduli: RSA moduli (duplicates are factored once).
+        Returns:
+            {N: (p, q, stage)} with stage "batch-gcd" or "shor", or
+            {N: None} when a modulus could not be factored.
+        """
+        unique = list(dict.fromkeys(moduli))
+        results: Dict[int, Optional[Tuple[int, int, str]]] = {}
+
+        start = time.perf_counter()
+        gcds = batch_gcd(unique)
+        for n, g in zip(unique, gcds):
+            if g == n:
+                # Both primes shared (with different moduli): split pairwise
+                g = next((d for m in unique if m != n and 1 < (d := math.gcd(n, m)) < n), 1)
+            if 1 < g < n:
+                results[n] = (g, n // g, "batch-gcd")
+        gcd_seconds = time.perf_counter() - start
+        self.logger.debug(f"Batch GCD split {len(results)} of {len(unique)} moduli in {gcd_seconds:.6f}s")
+
+        start = time.perf_counter()
+        remaining = [n for n in unique if n not in results]
+        for n in remaining:
+            factors = self.fallback(n)
+            results[n] = (factors[0], factors[1], "shor") if factors else None
+        shor_seconds = time.perf_counter() - start
+
+        shor_solved = sum(1 for n in remaining if results[n] is not None)
+        self.stats = {
+            "batch-gcd": {
+                "moduli": len(unique),
+                "factored": len(unique) - len(remaining),
+                "seconds": gcd_seconds,
+                "pairwise_estimate": self._pairwise_estimate(unique),
+            },
+            "shor": {
+                "moduli": len(remaining),
+                "factored": shor_solved,
+                "seconds": shor_seconds,
+                # What running the engine on every modulus would have cost
+                "all_moduli_estimate": shor_seconds / len(remaining) * len(unique) if remaining else 0.0,
+            },
+        }
+        return results
+
+    def _pairwise_estimate(self, moduli):
+        """
+        Seconds the naive gcd over all k(k-1)/2 pairs would take, extrapolated
+        from `pairwise_samples` random pairs.
+        """
+        k = len(moduli)
+        pairs = k * (k - 1) // 2
+        if pairs == 0:
+            return 0.0
+        samples = [random.sample(moduli, 2) for _ in range(min(pairs, self.pairwise_samples))]
+        start = time.perf_counter()
+        for a, b in samples:
+            math.gcd(a, b)
+        return (time.perf_counter() - start) / len(samples) * pairs
@@ -0,0 +1,119 @@
+# Project: PSU Abington Fall 2025 Capstone
+# Purpose Details: LRU + on-disk (QPY) cache of transpiled Shor circuits
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: 10/17/26
+# Last Date Changed: 10/17/26
+# Revision: 0.1.0
+import logging
+import os
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+import qiskit
+from qiskit import QuantumCircuit, qpy
+
+
+class CircuitCache:
+    def __init__(self, max_entries: int = 32, cache_dir: Optional[str] = None):
+        """
+        Bounded in-memory LRU cache of transpiled circuits with an optional
+        on-disk QPY layer underneath it.
+
+        Args:
+            max_entries: Maximum number of circuits kept in memory (0 disables the memory layer)
+            cache_dir: Directory for QPY files, or None to keep the cache in memory only
+        """
+        self.logger = logging.getLogger("sred_cli.circuit_cache.CircuitCache")
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._entries: "OrderedDict[Tuple[Hashable, ...], QuantumCircuit]" = OrderedDict()
+
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[QuantumCircuit]:
+        """
+        Look up a transpiled circuit, checking memory first and then disk.
+
+        Args:
+            key: Cache key, e.g. (N, a, n_count, method, device)
+
+        Returns:
+            The cached circuit, or None on a miss
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.logger.debug(f"Circuit cache hit (memory) for {key}")
+            return self._entries[key]
+
+        path = self._disk_path(key)
+        if path and os.path.exists(path):
+            try:
+                with open(path, "rb") as f:
+                    circuit = qpy.load(f)[0]
+            except Exception as e:
+                # A stale or truncated file is just a miss
+                self.logger.debug(f"Ignoring unreadable QPY file {path}: {e}")
+            else:
+                self.hits += 1
+                self.disk_hits += 1
+                self._remember(key, circuit)
+                self.logger.debug(f"Circuit cache hit (disk) for {key}")
+                return circuit
+
+        self.misses += 1
+        self.logger.debug(f"Circuit cache miss for {key}")
+        return None
+
+    def put(self, key: Tuple[Hashable, ...], circuit: QuantumCircuit) -> None:
+        """
+        Store a transpiled circuit in memory and, if enabled, on disk.
+
+        Args:
+            key: Cache key, e.g. (N, a, n_count, method, device)
+            circuit: Transpiled circuit to store
+        """
+        self._remember(key, circuit)
+
+        path = self._disk_path(key)
+        if path:
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    qpy.dump(circuit, f)
+                os.replace(tmp_path, path)  # atomic, so readers never see half a file
+            except Exception as e:
+                self.logger.debug(f"Could not write QPY file {path}: {e}")
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def clear(self) -> None:
+        """Drop every in-memory entry and reset the counters (disk files are kept)."""
+        self._entries.clear()
+        self.hits = self.misses = self.disk_hits = 0
+
+    def _remember(self, key, circuit):
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = circuit
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self.logger.debug(f"Evicted {evicted} from circuit cache")
+
+    def _disk_path(self, key) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        # QPY files are tied to the qiskit version that transpiled them
+        name = "_".join(str(part) for part in key)
+        return os.path.join(
+            self.cache_dir, f"shor_{name}_qiskit{qiskit.__version__}.qpy"
+        )
@@ -8,29 +8,74 @@
 import logging
 import random
 import math
-from typing import Optional, Tuple
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+from abcapstonefa25team1.backend.utils.integer_roots import perfect_power
+from abcapstonefa25team1.backend.utils.primality import is_prime, order_from_multiple, small_primes
 
 
 class Classical_Shors:
-    def __init__(self):
+    ORDER_ENGINES = ("bsgs", "bruteforce")
+    # Factoring tiers, cheapest first; "order" is the Shor-style order finding
+    TIERS = ("trial", "rho", "p-1", "order")
+
+    def __init__(
+        self,
+        order_engine: str = "bsgs",
+        tiers: Sequence[str] = TIERS,
+        rho_iterations: int = 1 << 20,
+        pm1_bound: int = 10000,
+    ):
+        """
+        Args:
+            order_engine: "bsgs" for baby-step giant-step order finding, or
+                "bruteforce" for the reference loop over every power of a
+            tiers: Factoring tiers to run, in order (a subset of TIERS)
+            rho_iterations: Iteration budget of the Pollard rho (Brent) tier
+            pm1_bound: Smoothness bound B1 of the Pollard p-1 tier
+        """
         self.logger = logging.getLogger("sred_cli.classical_shors.Classical_Shors")
         self.logger.debug("Creating an instance of logger for Shor's Classical")
 
+        if order_engine not in self.ORDER_ENGINES:
+            raise ValueError(f"Unknown order finding engine: {order_engine}")
+        self.order_engine = order_engine
+        unknown = [tier for tier in tiers if tier not in self.TIERS]
+        if unknown:
+            raise ValueError(f"Unknown factoring tier(s): {', '.join(unknown)}")
+        self.tiers = tuple(tiers)
+        self.rho_iterations = rho_iterations
+        self.pm1_bound = pm1_bound
+
+        # Tier that produced the last factorization and seconds spent per tier
+        self.last_tier: Optional[str] = None
+        self.tier_timings: Dict[str, float] = {}
+
+        # lcm of the orders found so far per N; a^L ≡ 1 lets the order be reduced from L
+        self._order_multiples: Dict[int, int] = {}
+
     def shors_classical(self, N: int, tries: int = 10) -> Optional[Tuple[int, int]]:
         """
-        Attempt to factor N using the classical analog of Shor's algorithm.
-        Tries up to `tries` random choices of a.
+        Attempt to factor N, running the configured tiers cheapest first:
+        trial division, Pollard rho (Brent), Pollard p-1 and finally the
+        classical analog of Shor's algorithm with up to `tries` random bases.
+        The tier that succeeded is left in last_tier and the seconds spent
+        in each tier that ran in tier_timings.
         Returns a tuple (p, q) of non-trivial factors if found, otherwise None.
 
         Args:
             N: The integer to be factored (must be greater than 1).
-            tries: Maximum number of random attempts to find factors. Defaults to 10.
+            tries: Maximum number of random attempts of the order finding tier. Defaults to 10.
 
         Returns:
             A tuple containing two non-trivial factors (p, q)
             of N if successful; otherwise, None.
         """
+        self.last_tier = None
+        self.tier_timings = {}
         if N % 2 == 0:
+            self.last_tier = "trial"
             return (2, N // 2)
         if N <= 3:
             return None
@@ -39,15 +84,41 @@ class Classical_Shors:
         if pp is not None:
             base, k = pp
             self.logger.debug(f"N = {N} is a perfect power: {base}^{k}")
+            self.last_tier = "power"
             return (base, N // base)
         if self._is_prime(N):
             return None
 
-        # quick small-factor trial division
-        small = self._trial_division(N, limit=1000)
-        if small:
-            return (small, N // small)
+        for tier in self.tiers:
+            start = time.perf_counter()
+            if tier == "trial":
+                factor = self._trial_division(N, limit=1000)
+            elif tier == "rho":
+                factor = self._pollard_brent(N, self.rho_iterations)
+            elif tier == "p-1":
+                factor = self._pollard_pm1(N, self.pm1_bound)
+            else:
+                factor = self._factor_by_order(N, tries)
+            self.tier_timings[tier] = time.perf_counter() - start
+            self.logger.debug(f"Tier {tier}: {factor} in {self.tier_timings[tier]:.6f}s")
+            if factor:
+                self.last_tier = tier
+                return (factor, N // factor)
 
+        # failed after tries
+        self.logger.debug("Failed to find factor with given tries")
+        return None
+
+    def _factor_by_order(self, N: int, tries: int) -> Optional[int]:
+        """
+        Order finding tier: a non-trivial factor from the order of random bases.
+
+        Args:
+            N: The odd composite to factor.
+            tries: Maximum number of random bases.
+        Returns:
+            A non-trivial factor of N, or None after `tries` bases.
+        """
         for attempt in range(1, tries + 1):
             a = random.randrange(2, N - 1)
             g = math.gcd(a, N)
@@ -56,10 +127,10 @@ class Classical_Shors:
                 self.logger.debug(
                     f"Attempt {attempt}: gcd({a}, {N}) = {g} -> found factor"
                 )
-                return (g, N // g)
+                return g
 
-            # find order r of a mod N (classical brute-force replacement for quantum subroutine)
-            r = self._order_bruteforce(a, N, max_iterations=N)
+            # find order r of a mod N (classical replacement for quantum subroutine)
+            r = self.find_order(a, N)
             if r is None:
                 self.logger.debug(
                     f"Attempt {attempt}: no order found within bound for a={a}"
@@ -82,20 +153,97 @@ class Classical_Shors:
             q = math.gcd(ar2 - 1, N)
             if 1 < p < N:
                 self.logger.debug(f"Found factors: {p} and {N // p}")
-                return (p, N // p)
+                return p
             if 1 < q < N:
                 self.logger.debug(f"Found factors: {q} and {N // q}")
-                return (q, N // q)
+                return q
             # otherwise try again
             self.logger.debug("GCDs gave trivial factors, try again")
+        return None
 
-        # failed after tries
-        self.logger.debug("Failed to find factor with given tries")
+    def _pollard_brent(self, n: int, max_iterations: int, batch: int = 128) -> Optional[int]:
+        """
+        Pollard's rho with Brent's cycle detection on f(y) = y^2 + c mod n.
+
+        Differences |x - y| are multiplied together and one gcd is taken per
+        `batch` steps; if a batch overshoots (gcd == n) it is replayed one
+        step at a time. A walk that only yields n restarts with a new c.
+        Finds a prime factor p in about sqrt(p) steps.
+
+        Args:
+            n: The odd composite to factor.
+            max_iterations: Total number of f evaluations allowed.
+            batch: Steps per gcd.
+        Returns:
+            A non-trivial factor of n, or None when the budget runs out.
+        """
+        spent = 0
+        while spent < max_iterations:
+            c = random.randrange(1, n - 1)
+            y = random.randrange(0, n)
+            g = r = q = 1
+            x = ys = y
+            while g == 1 and spent < max_iterations:
+                x = y
+                for _ in range(r):
+                    y = (y * y + c) % n
+                k = 0
+                while k < r and g == 1:
+                    ys = y
+                    for _ in range(min(batch, r - k)):
+                        y = (y * y + c) % n
+                        q = q * abs(x - y) % n
+                    g = math.gcd(q, n)
+                    k += batch
+                spent += 2 * r
+                r *= 2
+            if g == 1:
+                break
+            if g == n:
+                # Replay the last batch one step at a time
+                while True:
+                    ys = (ys * ys + c) % n
+                    g = math.gcd(abs(x - ys), n)
+                    if g > 1:
+                        break
+            if g < n:
+                self.logger.debug(f"Pollard rho: {g} after {spent} steps")
+                return g
+        return None
+
+    def _pollard_pm1(self, n: int, bound: int) -> Optional[int]:
+        """
+        Pollard's p-1 (stage 1): finds p when p - 1 is `bound`-smooth.
+
+        Raises 2 to every prime power up to bound, taking a gcd every 64
+        primes, so a factor is caught before all factors of n become smooth.
+
+        Args:
+            n: The odd composite to factor.
+            bound: Smoothness bound B1.
+        Returns:
+            A non-trivial factor of n, or None.
+        """
+        a = 2
+        primes = small_primes(bound)
+        for i, p in enumerate(primes, 1):
+            pk = p
+            while pk * p <= bound:
+                pk *= p
+            a = pow(a, pk, n)
+            if i % 64 == 0 or i == len(primes):
+                g = math.gcd(a - 1, n)
+                if g == n:
+                    return None
+                if g > 1:
+                    self.logger.debug(f"Pollard p-1: {g} with B1={p}")
+                    return g
         return None
 
     def _is_power(self, n: int) -> Optional[Tuple[int, int]]:
         """
-        Return (b, k) if n == b**k for k>=2, else None. Quick detection of perfect powers.
+        Return (b, k) if n == b**k for k>=2, else None. Exact for any size of n
+        (integer roots, see backend/utils/integer_roots.py).
 
         Args:
             N: The integer to check.
@@ -103,15 +251,10 @@ class Classical_Shors:
         Returns:
             A tuple (b, k) if n is a perfect power, otherwise None.
         """
-        if n <= 1:
-            return None
-        max_k = int(math.log2(n)) + 1
-        for k in range(2, max_k + 1):
-            b = round(n ** (1.0 / k))
-            if b > 1 and b**k == n:
-                self.logger.debug(f"Is Power: {b}, {k}")
-                return (b, k)
-        return None
+        pp = perfect_power(n)
+        if pp is not None:
+            self.logger.debug(f"Is Power: {pp[0]}, {pp[1]}")
+        return pp
 
     def _trial_division(self, n: int, limit: int = 1000) -> Optional[int]:
         """
@@ -139,13 +282,7 @@ class Classical_Shors:
         Checks if a number n is prime.
         Returns True if n is prime, False otherwise.
         """
-        if n <= 1:
-            return False
-        # Check divisibility up to sqrt(n)
-        for i in range(2, int(n**0.5) + 1):
-            if n % i == 0:
-                return False
-        return True
+        return is_prime(n)
 
     def _order_bruteforce(
         self, a: int, N: int, max_iterations: int = 0
@@ -173,3 +310,73 @@ class Classical_Shors:
             if cur == 1:
                 return r
         return None
+
+    def find_order(self, a: int, N: int) -> Optional[int]:
+        """
+        Find the multiplicative order of a modulo N with the configured engine.
+
+        Orders found for N are combined into a common multiple L. A base with
+        a^L ≡ 1 (mod N) has its order read off L's divisors without a search.
+
+        Args:
+            a: The base integer.
+            N: The modulus.
+        Returns:
+            The multiplicative order r, or None if gcd(a, N) != 1.
+        """
+        if math.gcd(a, N) != 1:
+            return None
+        if self.order_engine == "bruteforce":
+            return self._order_bruteforce(a, N, max_iterations=N)
+
+        multiple = self._order_multiples.get(N)
+        if multiple is not None and pow(a, multiple, N) == 1:
+            r = order_from_multiple(a, N, multiple)
+            self.logger.debug(f"Order of {a} reduced from known multiple {multiple}: {r}")
+            return r
+
+        r = self._order_bsgs(a, N)
+        if r is not None:
+            self._order_multiples[N] = math.lcm(multiple or 1, r)
+        return r
+
+    def _order_bsgs(self, a: int, N: int, bound: Optional[int] = None) -> Optional[int]:
+        """
+        Find the multiplicative order of a modulo N by baby-step giant-step,
+        in O(sqrt(bound)) multiplications and memory.
+
+        Writing r = i*m + j with 0 <= j < m, a^r ≡ 1 becomes a^j ≡ a^(-i*m):
+        the baby steps store a^j and the giant steps walk a^(-i*m).
+
+        Args:
+            a: The base integer.
+            N: The modulus.
+            bound: Largest order searched for. Defaults to N.
+        Returns:
+            The multiplicative order r if r <= bound, otherwise None.
+        """
+        if math.gcd(a, N) != 1:
+            return None
+        if bound is None:
+            bound = N
+        m = math.isqrt(bound - 1) + 1
+
+        # Baby steps: a^j for 0 <= j < m, keeping the smallest j per value
+        baby: Dict[int, int] = {}
+        cur = 1
+        for j in range(m):
+            if j > 0 and cur == 1:
+                return j
+            baby.setdefault(cur, j)
+            cur = (cur * a) % N
+
+        # Giant steps: a^(-i*m) for i = 1..m; the first match gives the smallest r
+        giant = pow(a, -m, N)
+        cur = 1
+        for i in range(1, m + 1):
+            cur = (cur * giant) % N
+            j = baby.get(cur)
+            if j is not None:
+                r = i * m + j
+                return r if r <= bound else None
+        return None
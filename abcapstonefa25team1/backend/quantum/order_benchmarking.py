@@ -0,0 +1,98 @@
+# Project: PSU Abington Fall 2025 Capstone
+# Purpose Details: Benchmark of the classical order finding engines in Classical_Shors
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: 10/17/26
+# Last Date Changed: 10/17/26
+# Revision: 0.1.0
+import logging
+import math
+import random
+from typing import Dict, List, Sequence
+
+from abcapstonefa25team1.backend.quantum.classical_shors import Classical_Shors
+from abcapstonefa25team1.backend.utils.benchmarking import benchmark_function
+
+logger = logging.getLogger("sred_cli.order_benchmarking")
+
+
+def random_semiprime(bits: int, rng: random.Random) -> int:
+    """
+    Product of two random primes of about bits / 2 bits each.
+
+    Args:
+        bits: Target size of the product in bits
+        rng: Random number generator
+
+    Returns:
+        An odd semiprime N with N < 2^bits
+    """
+    checker = Classical_Shors()
+    half = bits // 2
+    primes = []
+    while len(primes) < 2:
+        candidate = rng.randrange(2 ** (half - 1) + 1, 2**half, 2)
+        if checker._is_prime(candidate) and candidate not in primes:
+            primes.append(candidate)
+    return primes[0] * primes[1]
+
+
+def benchmark_order_engines(
+    bit_sizes: Sequence[int] = (16, 20, 24, 28, 32, 36, 40),
+    bases_per_size: int = 3,
+    bruteforce_max_bits: int = 24,
+    seed: int = 488,
+) -> List[Dict]:
+    """
+    Time every order finding engine on random semiprimes of growing size.
+
+    The brute-force engine needs up to N multiplications per base, so it is
+    only run up to bruteforce_max_bits; where both engines run their orders
+    are checked against each other.
+
+    Args:
+        bit_sizes: Sizes of N in bits
+        bases_per_size: Number of random bases timed per N
+        bruteforce_max_bits: Largest size the brute-force reference is run on
+        seed: Seed for the moduli and bases
+
+    Returns:
+        One row per (size, engine) with the modulus, the orders and the total time
+    """
+    rng = random.Random(seed)
+    rows = []
+    for bits in bit_sizes:
+        N = random_semiprime(bits, rng)
+        bases = []
+        while len(bases) < bases_per_size:
+            a = rng.randrange(2, N - 1)
+            if math.gcd(a, N) == 1:
+                bases.append(a)
+
+        reference = None
+        for engine in Classical_Shors.ORDER_ENGINES:
+            if engine == "bruteforce" and bits > bruteforce_max_bits:
+                continue
+            orders = []
+
+            def run():
+                # A fresh instance per engine so no known order multiple carries over
+                shor = Classical_Shors(order_engine=engine)
+                orders[:] = [shor.find_order(a, N) for a in bases]
+
+            seconds = benchmark_function(run)
+            if reference is None:
+                reference = list(orders)
+            elif orders != reference:
+                raise AssertionError(f"Order engines disagree for N = {N}: {reference} != {orders}")
+
+            rows.append(
+                {"bits": bits, "N": N, "engine": engine, "orders": list(orders), "seconds": seconds}
+            )
+            logger.info(f"{bits:3d} bits  N = {N:<14d} {engine:<11s} {seconds:10.6f}s")
+    return rows
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    benchmark_order_engines()
@@ -0,0 +1,182 @@
+# Project: PSU Abington Fall 2025 Capstone
+# Purpose Details: Batched continued-fraction post-processing for quantum period finding
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: 10/17/26
+# Last Date Changed: 10/17/26
+# Revision: 0.1.0
+import logging
+import math
+from itertools import combinations
+from typing import Dict, List, Mapping, Tuple
+
+import numpy as np
+
+from abcapstonefa25team1.backend.utils.primality import order_from_multiple
+
+
+def parse_counts(counts: Mapping[str, int], n_count: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parse measurement bitstrings into one integer array.
+
+    Args:
+        counts: Measurement counts keyed by n_count-bit strings
+        n_count: Number of counting qubits
+
+    Returns:
+        (values, weights) arrays with one entry per distinct outcome
+    """
+    keys = list(counts)
+    weights = np.fromiter(counts.values(), dtype=np.int64, count=len(keys))
+    if not keys:
+        return np.zeros(0, dtype=np.int64), weights
+    if n_count > 62:
+        return np.array([int(key, 2) for key in keys], dtype=object), weights
+
+    bits = np.frombuffer("".join(keys).encode("ascii"), dtype=np.uint8)
+    bits = bits.reshape(len(keys), n_count).astype(np.int64) - ord("0")
+    place_values = np.int64(1) << np.arange(n_count - 1, -1, -1, dtype=np.int64)
+    return bits @ place_values, weights
+
+
+def convergent_denominators(values: np.ndarray, n_count: int, N: int) -> np.ndarray:
+    """
+    Denominator of the last continued-fraction convergent of value / 2^n_count
+    that does not exceed N, for every value at once.
+
+    Args:
+        values: Measured integers, all non-zero
+        n_count: Number of counting qubits
+        N: Largest denominator allowed
+
+    Returns:
+        Array of denominators (at least 1)
+    """
+    # Stay in int64 while every intermediate product fits, else use Python ints
+    dtype = np.int64 if (N + 1) << n_count < 2**62 else object
+    size = len(values)
+    num = values.astype(dtype)
+    den = np.full(size, 2**n_count, dtype=dtype)
+
+    # k_{-2} = 1, k_{-1} = 0 and k_j = q_j * k_{j-1} + k_{j-2}
+    k_prev = np.ones(size, dtype=dtype)
+    k_curr = np.zeros(size, dtype=dtype)
+    best = np.ones(size, dtype=dtype)
+    done = np.zeros(size, dtype=bool)
+
+    while not done.all():
+        divisor = np.where(done, 1, den)
+        quotient = num // divisor
+        k_next = quotient * k_curr + k_prev
+        accept = ~done & (k_next <= N)
+
+        best = np.where(accept, k_next, best)
+        k_prev = np.where(accept, k_curr, k_prev)
+        k_curr = np.where(accept, k_next, k_curr)
+        remainder = num - quotient * divisor
+        num = np.where(accept, divisor, num)
+        den = np.where(accept, remainder, den)
+        done = done | ~accept | (den == 0)
+
+    return best
+
+
+class PeriodPostProcessor:
+    def __init__(self, lcm_candidates: int = 8):
+        """
+        Turns counting-register measurements into ranked period candidates.
+
+        All outcomes are parsed and expanded into continued fractions as
+        arrays. Measurements s / r with gcd(s, r) > 1 only give a divisor of
+        r, so LCMs of pairs of the most frequent unverified denominators are
+        tried as well. Every verified candidate is reduced to the order of a,
+        which is memoized per (a, N).
+
+        Args:
+            lcm_candidates: Number of unverified denominators combined pairwise
+        """
+        self.logger = logging.getLogger(
+            "sred_cli.period_postprocessing.PeriodPostProcessor"
+        )
+        self.lcm_candidates = lcm_candidates
+
+        self._checked: Dict[Tuple[int, int], Dict[int, bool]] = {}
+        self._orders: Dict[Tuple[int, int], int] = {}
+
+    def rank(
+        self, N: int, a: int, n_count: int, counts: Mapping[str, int]
+    ) -> List[Tuple[int, float]]:
+        """
+        Rank the periods supported by a set of measurements.
+
+        Args:
+            N: Modulus
+            a: Base
+            n_count: Number of counting qubits
+            counts: Measurement counts keyed by n_count-bit strings
+
+        Returns:
+            List of (r, confidence) pairs, best first, where confidence is the
+            fraction of shots whose denominator is a non-trivial divisor of r
+        """
+        values, weights = parse_counts(counts, n_count)
+        total = int(weights.sum())
+        nonzero = values != 0
+        values, weights = values[nonzero], weights[nonzero]
+        if total == 0 or len(values) == 0:
+            return []
+
+        denominators = convergent_denominators(values, n_count, N)
+        support: Dict[int, int] = {}
+        for d, w in zip(denominators.tolist(), weights.tolist()):
+            if d > 1:
+                support[d] = support.get(d, 0) + w
+
+        periods = set()
+        unverified = []
+        for d in support:
+            if d < N and self._verify(N, a, d):
+                periods.add(self._reduce(N, a, d))
+            else:
+                unverified.append(d)
+
+        # Partial results: s / r with gcd(s, r) > 1 leaves a divisor of r
+        unverified.sort(key=lambda d: support[d], reverse=True)
+        for d1, d2 in combinations(unverified[: self.lcm_candidates], 2):
+            multiple = math.lcm(d1, d2)
+            if multiple < N and self._verify(N, a, multiple):
+                periods.add(self._reduce(N, a, multiple))
+
+        ranked = []
+        for r in periods:
+            consistent = sum(w for d, w in support.items() if r % d == 0)
+            ranked.append((r, consistent / total))
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+
+        self.logger.debug(
+            f"{len(support)} distinct denominators for N = {N}, a = {a}: "
+            f"candidates {ranked[:5]}"
+        )
+        return ranked
+
+    def _verify(self, N, a, r):
+        """Memoized check of a^r ≡ 1 (mod N)."""
+        order = self._orders.get((a, N))
+        if order is not None:
+            return r % order == 0
+
+        checked = self._checked.setdefault((a, N), {})
+        if r not in checked:
+            checked[r] = pow(a, r, N) == 1
+        return checked[r]
+
+    def _reduce(self, N, a, r):
+        """Smallest divisor of a verified period r that is still a period, i.e. the order of a."""
+        order = self._orders.get((a, N))
+        if order is not None:
+            return order
+
+        r = order_from_multiple(a, N, r)
+        self._orders[(a, N)] = r
+        self._checked.pop((a, N), None)
+        return r
@@ -0,0 +1,107 @@
+# Project: PSU Abington Fall 2025 Capstone
+# Purpose Details: NumPy simulator for the period-finding circuit of Shor's algorithm
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: 10/17/26
+# Last Date Changed: 10/17/26
+# Revision: 0.1.0
+import logging
+from typing import Dict, Optional
+
+import numpy as np
+
+
+class PermutationSimulator:
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Simulates the period-finding circuit without building any gates.
+
+        After the Hadamards every counting state |k⟩ has the same amplitude,
+        and each controlled U^(2^i) only permutes basis states. The joint state
+        is therefore Σ_k |k⟩|y_k⟩ / √M, and the array y_k (one entry per
+        counting state) stores it exactly. Controlled multiplications become
+        vectorized index permutations of that array. The inverse QFT of the
+        counting register becomes one FFT per distinct auxiliary value.
+
+        Args:
+            seed: Seed for the shot sampler
+        """
+        self.logger = logging.getLogger(
+            "sred_cli.permutation_simulator.PermutationSimulator"
+        )
+        self.rng = np.random.default_rng(seed)
+
+    def distribution(self, N: int, a: int, n_count: int) -> np.ndarray:
+        """
+        Exact measurement distribution of the counting register.
+
+        Args:
+            N: Modulus
+            a: Base
+            n_count: Number of counting qubits
+
+        Returns:
+            Array of 2^n_count probabilities indexed by the measured integer
+        """
+        size = 2**n_count
+        states = np.arange(size, dtype=np.int64)
+
+        # Auxiliary register starts in |1⟩ for every counting state
+        aux = np.ones(size, dtype=np.int64)
+        for i in range(n_count):
+            multiplier = pow(a, 2**i, N)
+            if multiplier == 1:
+                continue
+            # U^(2^i)|y⟩ = |y * a^(2^i) mod N⟩ as a lookup table over y < N
+            permutation = (np.arange(N, dtype=np.int64) * multiplier) % N
+            controlled = ((states >> i) & 1).astype(bool)
+            aux[controlled] = permutation[aux[controlled]]
+
+        # Measuring the auxiliary register leaves one branch per distinct value;
+        # numpy's forward FFT has the sign convention of the inverse QFT
+        probabilities = np.zeros(size)
+        values, branch = np.unique(aux, return_inverse=True)
+        for index in range(len(values)):
+            amplitudes = np.fft.fft((branch == index).astype(np.complex128))
+            probabilities += np.abs(amplitudes) ** 2
+        probabilities /= float(size) ** 2
+
+        self.logger.debug(
+            f"Simulated N = {N}, a = {a}: {len(values)} auxiliary branches"
+        )
+        return probabilities
+
+    def sample(self, probabilities: np.ndarray, n_count: int, shots: int) -> Dict[str, int]:
+        """
+        Draw shots from a distribution in the same format as Aer's get_counts().
+
+        Args:
+            probabilities: Distribution returned by distribution()
+            n_count: Number of counting qubits (bitstring width)
+            shots: Number of shots
+
+        Returns:
+            Dictionary mapping bitstrings to counts
+        """
+        # Guard against rounding drift before handing the vector to multinomial
+        probabilities = probabilities / probabilities.sum()
+        outcomes = self.rng.multinomial(shots, probabilities)
+        return {
+            format(int(value), f"0{n_count}b"): int(outcomes[value])
+            for value in np.flatnonzero(outcomes)
+        }
+
+    def run(self, N: int, a: int, n_count: int, shots: int = 2048) -> Dict[str, int]:
+        """
+        Simulate the circuit and sample it.
+
+        Args:
+            N: Modulus
+            a: Base
+            n_count: Number of counting qubits
+            shots: Number of shots
+
+        Returns:
+            Dictionary mapping bitstrings to counts
+        """
+        return self.sample(self.distribution(N, a, n_count), n_count, shots)
@@ -87,6 +87,8 @@ class ShorsBenchmark:
 
         execution_time = end_time - start_time
         success = result is not None
+        simulations = shor.simulations_run
+        shots = shor.shots_run
 
         # Get circuit metrics
         try:
@@ -104,6 +106,12 @@ class ShorsBenchmark:
             "execution_time": execution_time,
             "success": success,
             "factors": result if success else None,
+            # "numpy" for every N whose circuit is too wide for Aer (all N above 63 in full mode)
+            "backend": shor.simulation_backend(N),
+            "simulations": simulations,
+            "shots": shots,
+            # Successful runs per simulated circuit; 0 simulations means a classical shortcut
+            "success_per_simulation": round(success / simulations, 3) if simulations else None,
             "cpu_usage_delta": round(cpu_after - cpu_before, 2),
             "mem_usage_mb": round(mem_after - mem_before, 2),
             "gpu_mem_used_mb": round(gpu_after - gpu_before, 2),
@@ -165,8 +173,19 @@ class ShorsBenchmark:
             else:
                 qubits = gates = depth = 0
 
+            n_runs = [r for r in all_runs if r["N"] == N]
+            total_sims = sum(r["simulations"] for r in n_runs)
+            total_shots = sum(r["shots"] for r in n_runs)
+            total_successes = sum(r["success"] for r in n_runs if r["simulations"])
+            per_sim = total_successes / total_sims if total_sims else 0
+
             self.logger.info(Fore.CYAN + f"\nSUMMARY for N = {N}:")
             self.logger.info(Fore.WHITE + f"  Circuit: {qubits} qubits, {gates} gates, depth {depth}")
+            self.logger.info(
+                Fore.WHITE
+                + f"  Simulations: {total_sims} | Shots: {total_shots} | "
+                + f"Success rate per simulation: {per_sim:.2f}"
+            )
             self.logger.info(
                 Fore.WHITE
                 + f"  CPU Avg: {cpu_avg:.2f}s | GPU Avg: {gpu_avg:.2f}s | "
@@ -5,21 +5,106 @@
 # Date Developed: 10/22/25
 # Last Date Changed: 11/11/25
 # Revision: 0.1.0
-from qiskit import QuantumCircuit, QuantumRegister, transpile
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister, transpile
 from qiskit_aer import AerSimulator
-from qiskit.circuit.library import QFT
+from qiskit.circuit.library import QFT, QFTGate
+import functools
+import itertools
 import math
-from fractions import Fraction
 import random
 import logging
+import os
+import multiprocessing
+from typing import Optional
+
+from abcapstonefa25team1.backend.quantum.base_selector import BaseSelector
+from abcapstonefa25team1.backend.quantum.circuit_cache import CircuitCache
+from abcapstonefa25team1.backend.utils.integer_roots import perfect_power
+from abcapstonefa25team1.backend.utils.primality import is_prime
+from abcapstonefa25team1.backend.quantum.period_postprocessing import (
+    PeriodPostProcessor,
+)
+from abcapstonefa25team1.backend.quantum.permutation_simulator import (
+    PermutationSimulator,
+)
 
 
 class Quantum_Shors:
-    def __init__(self):
+    PERIOD_FINDING_MODES = ("full", "semiclassical")
+    BACKENDS = ("aer", "numpy")
+
+    def __init__(
+        self,
+        cache_size: int = 32,
+        cache_dir: Optional[str] = None,
+        mode: str = "full",
+        backend: str = "aer",
+        max_shots: int = 2048,
+    ):
+        """
+        Args:
+            cache_size: Number of transpiled circuits kept in the in-memory LRU cache
+            cache_dir: Optional directory for QPY-serialized circuits shared between runs
+            mode: "full" for a counting register of n_count qubits, or "semiclassical"
+                for a single recycled control qubit (Kitaev / semiclassical QFT)
+            backend: "aer" to transpile and run the circuit on AerSimulator, or
+                "numpy" to simulate the modular exponentiation as a permutation
+                of the counting-register states (no circuit is built)
+            max_shots: Most shots spent on one period finding run
+        """
         self.logger = logging.getLogger("sred_cli.quantum_shors.Quantum_Shors")
         self.logger.debug("Creating an instance of logger for Shor's Quantum")
         
         self.use_gpu = False    # Default to CPU
+        self.simulator_method = "statevector"
+        self.max_qubits = 26    # 2^26 amplitudes is ~1 GiB of statevector
+        self.simulations_run = 0
+        self._oversized = set()  # N values already warned about falling back to numpy
+
+        # Adaptive shots: stop once the best period is backed by min_support shots
+        self.max_shots = max_shots
+        self.shot_batch = 64
+        self.min_support = 8
+        self.max_batches = 8  # each batch is a separate Aer run in semiclassical mode
+        self.shots_run = 0
+        self.last_shots_used = 0
+
+        if mode not in self.PERIOD_FINDING_MODES:
+            raise ValueError(f"Unknown period finding mode: {mode}")
+        self.mode = mode
+
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown simulation backend: {backend}")
+        self.backend = backend
+        self.permutation_simulator = PermutationSimulator()
+
+        # Turns measurement counts into ranked periods, memoized per (a, N)
+        self.period_postprocessor = PeriodPostProcessor()
+        self.last_period_candidates = []
+        self.last_period = None  # period found by the last shors_quantum call
+
+        # Transpiled circuits keyed by (N, a, n_count, method, device, mode)
+        self.cache_size = cache_size
+        self.cache_dir = cache_dir
+        self.circuit_cache = CircuitCache(max_entries=cache_size, cache_dir=cache_dir)
+
+        # Ranks untried bases and remembers failed ones per N across calls
+        self.base_selector = BaseSelector()
+
+    @property
+    def cache_hits(self) -> int:
+        """Number of circuit cache hits (memory or disk) on this instance"""
+        return self.circuit_cache.hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Number of circuits that had to be built and transpiled"""
+        return self.circuit_cache.misses
+
+    @property
+    def simulations_avoided(self) -> int:
+        """Number of bases the base selector screened out before simulation"""
+        return self.base_selector.avoided_simulations
 
     def enable_gpu(self, enable: bool = True):
         """Enable or disable GPU acceleration for AerSimulator.
@@ -45,31 +130,28 @@ class Quantum_Shors:
         Returns:
             Tuple of factors if successful, None otherwise
         """
+        self.last_period = None
+
         # Step 1: Classical pre-checks
         if N % 2 == 0:
             self.logger.debug(f"{N} is even. Factors: 2 and {N // 2}")
             return (2, N // 2)
 
-        # Check if N is a prime power
-        for p in range(2, int(N**0.5) + 1):
-            if N % p == 0:
-                k = N
-                count = 0
-                while k % p == 0:
-                    k //= p
-                    count += 1
-                if k == 1:
-                    self.logger.debug(f"{N} = {p}^{count}")
-                    return (p, N // p)
-
         # Check if N is prime
         if self.is_prime(N):
             self.logger.debug(f"{N} is prime")
             return None
 
-        # Step 2: Choose random a
+        # Check if N is a perfect power (exact integer roots, no factor scan)
+        power = perfect_power(N)
+        if power is not None:
+            base, k = power
+            self.logger.debug(f"{N} = {base}^{k}")
+            return (base, N // base)
+
+        # Step 2: Choose the most promising untried a
         if a is None:
-            a = random.randint(2, N - 1)
+            a = self.base_selector.next_base(N) or random.randint(2, N - 1)
 
             self.logger.debug(f"\nFactoring N = {N} with base a = {a}")
 
@@ -83,14 +165,17 @@ class Quantum_Shors:
         self.logger.debug("\nStarting quantum period finding...")
 
         r = self.quantum_period_finding(N, a)
+        self.last_period = r
         self.logger.debug(r)
 
         if r is None:
             self.logger.debug("Period finding failed")
+            self.base_selector.record_failure(N, a)
             return None
 
         if r % 2 != 0:
-            self.logger.debug("Period is odd (r = {r}), trying different 'a'")
+            self.logger.debug(f"Period is odd (r = {r}), trying different 'a'")
+            self.base_selector.record_failure(N, a, r)
             return None
 
         # Step 4: Use period to find factors
@@ -101,6 +186,7 @@ class Quantum_Shors:
         x = pow(a, r // 2, N)
         if x == N - 1:
             self.logger.debug("a^(r/2) ≡ -1 (mod N), trying different 'a'")
+            self.base_selector.record_failure(N, a, r)
             return None
 
         # Compute potential factors
@@ -120,20 +206,12 @@ class Quantum_Shors:
             return (factor2, N // factor2)
 
         self.logger.debug("Failed to find non-trivial factors")
+        self.base_selector.record_failure(N, a, r)
         return None
 
     def is_prime(self, n):
-        """Simple primality test"""
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
-        for i in range(3, int(n**0.5) + 1, 2):
-            if n % i == 0:
-                return False
-        return True
+        """Primality test (small-prime sieve + Miller-Rabin)"""
+        return is_prime(n)
 
     def quantum_period_finding(self, N, a):
         """
@@ -146,91 +224,246 @@ class Quantum_Shors:
 
         Returns:
             The period r, or None if not found
+
+        Raises:
+            ValueError: If N is too large for any backend within max_qubits
         """
         # Determine number of qubits needed
-        n_count = max(8, 2 * math.ceil(math.log2(N)))  # Counting qubits (at least 8)
+        n_count = self.counting_qubits(N)
 
         self.logger.debug(f"Using {n_count} counting qubits")
-        self.logger.debug("Building quantum circuit...")
 
-        # Create the quantum circuit
-        qc = self.create_shor_circuit(N, a, n_count)
+        backend = self.simulation_backend(N, n_count)
+        if backend is None:
+            raise ValueError(
+                f"Period finding for N = {N} needs {n_count} counting qubits, more "
+                f"than the {self.max_qubits} this simulator is allowed"
+            )
 
-        self.logger.debug(
-            f"Circuit created with {qc.num_qubits} qubits and {qc.size()} gates"
+        if backend == "numpy":
+            self.logger.debug("Running permutation simulation...")
+            sample = self._numpy_sampler(N, a, n_count)
+        else:
+            sample = self._aer_sampler(N, a, n_count)
+
+        # Small batches first, at most max_batches of them; double the batch
+        # while no period is verified
+        counts = {}
+        candidates = []
+        shots_used = 0
+        batch = self.shot_batch
+        for _ in range(self.max_batches):
+            if shots_used >= self.max_shots:
+                break
+            batch = min(batch, self.max_shots - shots_used)
+            for bitstring, count in sample(batch).items():
+                counts[bitstring] = counts.get(bitstring, 0) + count
+            shots_used += batch
+
+            # Continued fractions over all outcomes at once, verified and ranked
+            candidates = self.period_postprocessor.rank(N, a, n_count, counts)
+            if candidates and candidates[0][1] * shots_used >= self.min_support:
+                break
+            if not candidates:
+                batch *= 2
+
+        self.last_shots_used = shots_used
+        self.shots_run += shots_used
+        self.last_period_candidates = candidates
+        self.logger.debug(f"Used {shots_used} of {self.max_shots} shots")
+
+        # Show top 10 measurements
+        sorted_counts = sorted(counts.items(), key=lambda x: x[1], reverse=True)
+        self.logger.debug("\nTop measurement results:")
+        for bitstring, count in sorted_counts[:10]:
+            measured_value = int(bitstring, 2)
+            self.logger.debug(
+                f"  {bitstring} (decimal {measured_value:4d}): {count:4d} times"
+            )
+
+        if candidates:
+            self.logger.debug("\nPeriod candidates:")
+            for r, confidence in candidates[:5]:
+                self.logger.debug(
+                    f"  r = {r}: confidence {confidence:.3f}, verification: {a}^{r} mod {N} = {pow(a, r, N)}"
+                )
+            return candidates[0][0]
+
+        return None
+
+    def counting_qubits(self, N):
+        """Number of counting qubits (bits of phase) used to find periods mod N"""
+        return max(8, 2 * math.ceil(math.log2(N)))  # at least 8
+
+    def simulation_backend(self, N, n_count=None, warn=True):
+        """
+        Backend that period finding for N actually runs on. An Aer circuit
+        wider than max_qubits falls back to the numpy permutation simulator,
+        which samples the same ideal distribution from the counting register
+        alone. In full mode that is every N above 63, including all moduli
+        the CLI accepts, so the circuit is only simulated for small N.
+
+        Args:
+            N: Modulus
+            n_count: Number of counting qubits (derived from N if None)
+            warn: Log the numpy fallback (once per N)
+
+        Returns:
+            "aer" or "numpy", or None if even the counting register exceeds max_qubits
+        """
+        if n_count is None:
+            n_count = self.counting_qubits(N)
+
+        if self.backend == "aer":
+            n_qubits = self.count_qubits_needed(N, n_count)
+            if n_qubits <= self.max_qubits:
+                return "aer"
+            if warn and N not in self._oversized:
+                self._oversized.add(N)
+                self.logger.warning(
+                    f"Period finding for N = {N} needs {n_qubits} qubits in {self.mode} "
+                    f"mode, more than the {self.max_qubits} Aer is allowed; "
+                    f"simulating it with the numpy backend instead (the circuit is not run)"
+                )
+
+        # Only the counting register is stored, one auxiliary value per state
+        if n_count > self.max_qubits:
+            return None
+        return "numpy"
+
+    def _numpy_sampler(self, N, a, n_count):
+        """
+        Simulate the period-finding circuit once with the permutation simulator
+
+        Args:
+            N: Modulus
+            a: Base
+            n_count: Number of counting qubits
+
+        Returns:
+            Function mapping a number of shots to measurement counts
+        """
+        probabilities = self.permutation_simulator.distribution(N, a, n_count)
+        self.simulations_run += 1
+        return lambda shots: self.permutation_simulator.sample(
+            probabilities, n_count, shots
         )
-        self.logger.debug(f"Circuit depth: {qc.depth()}")
 
-        # Simulate the circuit
+    def _aer_sampler(self, N, a, n_count):
+        """
+        Transpile (or reuse) the period-finding circuit for AerSimulator.
+
+        The full circuit measures only at the end, so Aer draws every shot
+        from one final statevector: it is simulated once for the whole shot
+        budget and the recorded shots are handed out batch by batch. The
+        semiclassical circuit measures mid-circuit, so each batch is a run
+        of its own and is counted as one simulation.
+
+        Args:
+            N: Modulus
+            a: Base
+            n_count: Number of counting qubits
+
+        Returns:
+            Function mapping a number of shots to measurement counts
+        """
+        device = "GPU" if self.use_gpu else "CPU"
+        options = {}
+        if self.mode == "semiclassical":
+            # Shots that measured the same bits so far share one statevector
+            options["shot_branching_enable"] = True
         if self.use_gpu:
-            simulator = AerSimulator(method="statevector", device="GPU")
+            simulator = AerSimulator(
+                method=self.simulator_method, device="GPU", **options
+            )
             self.logger.debug("Using GPU-accelerated AerSimulator")
         else:
-            simulator = AerSimulator(method="statevector")
+            simulator = AerSimulator(method=self.simulator_method, **options)
             self.logger.debug("Using CPU AerSimulator")
-        qc.measure_all()
-
-        # Transpile the circuit to decompose into basic gates
 
-        self.logger.debug("Transpiling circuit...")
-        transpiled_qc = transpile(qc, simulator, optimization_level=2)
+        transpiled_qc = self.get_transpiled_circuit(N, a, n_count, simulator, device)
 
         self.logger.debug(f"Transpiled depth: {transpiled_qc.depth()}")
         self.logger.debug("Running simulation...")
 
-        result = simulator.run(transpiled_qc, shots=2048).result()
-        counts = result.get_counts()
+        if self.mode == "semiclassical":
+            def sample(shots):
+                self.simulations_run += 1
+                return simulator.run(transpiled_qc, shots=shots).result().get_counts()
 
-        # Show top 10 measurements
-        sorted_counts = sorted(counts.items(), key=lambda x: x[1], reverse=True)
-        self.logger.debug("\nTop measurement results:")
-        for bitstring, count in sorted_counts[:10]:
-            measured_value = int(bitstring, 2)
-            self.logger.debug(
-                f"  {bitstring} (decimal {measured_value:4d}): {count:4d} times"
-            )
+            return sample
 
-        # Process measurement results to find period
-        candidates = {}
+        memory = (
+            simulator.run(transpiled_qc, shots=self.max_shots, memory=True)
+            .result()
+            .get_memory()
+        )
+        self.simulations_run += 1
+        recorded = iter(memory)
 
-        for bitstring, count in counts.items():
-            measured_value = int(bitstring, 2)
+        def sample(shots):
+            counts = {}
+            for bitstring in itertools.islice(recorded, shots):
+                counts[bitstring] = counts.get(bitstring, 0) + 1
+            return counts
 
-            if measured_value == 0:
-                continue
+        return sample
 
-            # Use continued fractions to find r
-            phase = measured_value / (2**n_count)
-            frac = Fraction(phase).limit_denominator(N)
-            r = frac.denominator
+    def get_transpiled_circuit(self, N, a, n_count, simulator, device="CPU"):
+        """
+        Return the measured, transpiled Shor circuit for (N, a), building and
+        transpiling it only on a cache miss.
 
-            # Verify this is the correct period
-            if r > 0 and r < N and pow(a, r, N) == 1:
-                if r in candidates:
-                    candidates[r] += count
-                else:
-                    candidates[r] = count
+        Args:
+            N: Modulus
+            a: Base
+            n_count: Number of counting qubits
+            simulator: AerSimulator the circuit is transpiled for
+            device: "CPU" or "GPU", part of the cache key
 
-        if candidates:
-            self.logger.debug("\nPeriod candidates:")
-            for r, count in sorted(
-                candidates.items(), key=lambda x: x[1], reverse=True
-            )[:5]:
-                self.logger.debug(
-                    f"  r = {r}: {count} measurements, verification: {a}^{r} mod {N} = {pow(a, r, N)}"
-                )
+        Returns:
+            Transpiled QuantumCircuit ready to run on the simulator
+        """
+        key = (N, a, n_count, self.simulator_method, device, self.mode)
+        transpiled_qc = self.circuit_cache.get(key)
+        if transpiled_qc is not None:
+            self.logger.debug(f"Reusing cached transpiled circuit for {key}")
+            return transpiled_qc
 
-        # Return the most frequently measured valid period
-        if candidates:
-            best_r = max(candidates.items(), key=lambda x: x[1])[0]
-            return best_r
+        self.logger.debug("Building quantum circuit...")
 
-        return None
+        # Create the quantum circuit
+        if self.mode == "semiclassical":
+            qc = self.create_semiclassical_shor_circuit(N, a, n_count)
+        else:
+            qc = self.create_shor_circuit(N, a, n_count)
+
+            # Only the counting register carries the phase estimate
+            meas = ClassicalRegister(n_count, "meas")
+            qc.add_register(meas)
+            qc.measure(qc.qregs[0], meas)
+
+        self.logger.debug(
+            f"Circuit created with {qc.num_qubits} qubits and {qc.size()} gates"
+        )
+        self.logger.debug(f"Circuit depth: {qc.depth()}")
+
+        # Transpile the circuit to decompose into basic gates
+
+        self.logger.debug("Transpiling circuit...")
+        transpiled_qc = transpile(qc, simulator, optimization_level=2)
+
+        self.circuit_cache.put(key, transpiled_qc)
+        return transpiled_qc
 
     def create_shor_circuit(self, N, a, n_count):
         """
         Create quantum circuit for Shor's algorithm with full modular exponentiation
 
+        The modular exponentiation uses Beauregard's construction: QFT-based
+        (Draper) adders build a controlled modular multiplier, so the oracle
+        needs 2n + 2 work qubits and O(n^3) gates for an n-bit N.
+
         Args:
             N: Number to factor
             a: Base for modular exponentiation
@@ -240,13 +473,15 @@ class Quantum_Shors:
             QuantumCircuit implementing Shor's algorithm
         """
         # Calculate number of qubits needed
-        n_auxiliary = math.ceil(math.log2(N)) + 1  # Extra qubit for overflow
+        n_bits = N.bit_length()
 
         # Create quantum registers
         qr_count = QuantumRegister(n_count, "count")
-        qr_aux = QuantumRegister(n_auxiliary, "aux")
+        qr_aux = QuantumRegister(n_bits, "aux")  # holds a^x mod N
+        qr_work = QuantumRegister(n_bits + 1, "work")  # Fourier-space accumulator
+        qr_flag = QuantumRegister(1, "flag")  # overflow flag of the modular adder
 
-        qc = QuantumCircuit(qr_count, qr_aux)
+        qc = QuantumCircuit(qr_count, qr_aux, qr_work, qr_flag)
 
         # Step 1: Initialize counting register to superposition
         qc.h(qr_count)
@@ -258,7 +493,9 @@ class Quantum_Shors:
         # For each counting qubit, apply controlled U^(2^i) where U|y⟩ = |ay mod N⟩
         for i in range(n_count):
             power = 2**i
-            self.controlled_modular_multiplication(qc, qr_count[i], qr_aux, a, power, N)
+            self.controlled_modular_multiplication(
+                qc, qr_count[i], qr_aux, qr_work, qr_flag[0], a, power, N
+            )
 
         # Step 4: Apply inverse QFT to counting register
         qft_gate = QFT(n_count, inverse=True)
@@ -269,18 +506,89 @@ class Quantum_Shors:
 
         return qc
 
+    def create_semiclassical_shor_circuit(self, N, a, n_count):
+        """
+        Create a period-finding circuit that uses one recycled control qubit
+        (Kitaev's semiclassical inverse QFT).
+
+        Round k applies controlled U^(2^(n_count-1-k)), undoes the phases of the
+        k bits already measured with classically controlled rotations and
+        measures bit k of the same integer the full counting register would
+        produce, least significant bit first.
+
+        Args:
+            N: Number to factor
+            a: Base for modular exponentiation
+            n_count: Number of bits of phase to measure
+
+        Returns:
+            QuantumCircuit with an n_count-bit classical register "meas"
+        """
+        n_bits = N.bit_length()
+
+        qr_control = QuantumRegister(1, "control")
+        qr_aux = QuantumRegister(n_bits, "aux")
+        qr_work = QuantumRegister(n_bits + 1, "work")
+        qr_flag = QuantumRegister(1, "flag")
+        meas = ClassicalRegister(n_count, "meas")
+
+        qc = QuantumCircuit(qr_control, qr_aux, qr_work, qr_flag, meas)
+        control = qr_control[0]
+
+        # Auxiliary register starts in |1⟩
+        qc.x(qr_aux[0])
+
+        for k in range(n_count):
+            if k > 0:
+                qc.reset(control)
+            qc.h(control)
+
+            self.controlled_modular_multiplication(
+                qc, control, qr_aux, qr_work, qr_flag[0], a, 2 ** (n_count - 1 - k), N
+            )
+
+            # Inverse QFT rotations, driven by the bits measured so far
+            for j in range(k):
+                with qc.if_test((meas[j], 1)):
+                    qc.p(-math.pi / 2 ** (k - j), control)
+
+            qc.h(control)
+            qc.measure(control, meas[k])
+
+        return qc
+
+    def count_qubits_needed(self, N, n_count):
+        """
+        Number of qubits the period-finding circuit for N uses in the current mode
+
+        Args:
+            N: Number to factor
+            n_count: Number of counting qubits (bits of phase)
+
+        Returns:
+            Qubit count
+        """
+        workspace = 2 * N.bit_length() + 2  # aux, work and flag registers
+        if self.mode == "semiclassical":
+            return 1 + workspace
+        return n_count + workspace
+
     def controlled_modular_multiplication(
-        self, qc, control_qubit, target_register, a, power, N
+        self, qc, control_qubit, target_register, work_register, flag_qubit, a, power, N
     ):
         """
-        Apply controlled modular multiplication: |x⟩|y⟩ -> |x⟩|y * a^power mod N⟩
+        Apply controlled modular multiplication: |c⟩|y⟩ -> |c⟩|y * a^power mod N⟩
 
-        This implements the quantum modular exponentiation using quantum arithmetic.
+        The target is multiplied in place by computing y * m into the (zeroed)
+        work register, swapping it with the target and then uncomputing
+        y with the multiplier by m^-1, where m = a^power mod N.
 
         Args:
             qc: Quantum circuit
             control_qubit: Control qubit
-            target_register: Register holding the value to multiply
+            target_register: Register holding the value to multiply (n qubits)
+            work_register: Scratch register of n + 1 qubits, |0⟩ before and after
+            flag_qubit: Scratch qubit, |0⟩ before and after
             a: Base
             power: Exponent (typically 2^i)
             N: Modulus
@@ -292,153 +600,109 @@ class Quantum_Shors:
         if multiplier == 1:
             return
 
-        # For small N, we can use a lookup table approach
-        # This creates a controlled permutation of the basis states
-        n_qubits = len(target_register)
-
-        # Build the permutation that maps |y⟩ -> |y * multiplier mod N⟩
-        # We only apply this when the control qubit is |1⟩
-
-        # For efficiency with small N, we use controlled swaps to implement the permutation
-        # This is a simplified but correct approach for small moduli
-
-        if N < 2**n_qubits:
-            # Create permutation mapping
-            permutation = {}
-            for y in range(2**n_qubits):
-                if y < N:
-                    new_y = (y * multiplier) % N
-                    permutation[y] = new_y
-                else:
-                    permutation[y] = y  # Values >= N remain unchanged
-
-            # Implement the permutation using controlled operations
-            # This is done by decomposing the permutation into swaps
-            self.apply_controlled_permutation(
-                qc, control_qubit, target_register, permutation
-            )
+        inverse = pow(multiplier, -1, N)
+
+        self.controlled_multiply_add(
+            qc, control_qubit, target_register, work_register, flag_qubit, multiplier, N
+        )
+        for target_qubit, work_qubit in zip(target_register, work_register):
+            qc.cswap(control_qubit, target_qubit, work_qubit)
 
-    def apply_controlled_permutation(
-        self, qc, control_qubit, target_register, permutation
+        # Uncompute the work register with the inverse of c-MULT(m^-1)
+        undo = qc.copy_empty_like()
+        self.controlled_multiply_add(
+            undo, control_qubit, target_register, work_register, flag_qubit, inverse, N
+        )
+        qc.compose(undo.inverse(), inplace=True)
+
+    def controlled_multiply_add(
+        self, qc, control_qubit, x_register, work_register, flag_qubit, multiplier, N
     ):
         """
-        Apply a controlled permutation to the target register
-
-        This uses a simplified approach suitable for small registers.
-        For larger systems, more sophisticated techniques would be needed.
+        Apply |c⟩|x⟩|b⟩ -> |c⟩|x⟩|b + c * multiplier * x mod N⟩
 
         Args:
             qc: Quantum circuit
             control_qubit: Control qubit
-            target_register: Target qubits to permute
-            permutation: Dictionary mapping old values to new values
+            x_register: Register holding x (n qubits)
+            work_register: Register holding b < N (n + 1 qubits)
+            flag_qubit: Scratch qubit, |0⟩ before and after
+            multiplier: Classical constant to multiply by
+            N: Modulus
         """
-        n_qubits = len(target_register)
-        n_states = 2**n_qubits
-
-        # For very small registers, we can implement directly with multi-controlled gates
-        # For larger registers, this becomes impractical
-
-        if n_qubits <= 4:  # Direct implementation for small registers
-            # Decompose permutation into cycles
-            visited = set()
-
-            for start in range(n_states):
-                if start in visited or permutation[start] == start:
-                    continue
-
-                # Follow the cycle
-                cycle = []
-                current = start
-                while current not in visited:
-                    cycle.append(current)
-                    visited.add(current)
-                    current = permutation[current]
-
-                # Implement the cycle using controlled swaps
-                if len(cycle) > 1:
-                    self.implement_cycle(qc, control_qubit, target_register, cycle)
-        else:
-            # For larger registers, use a more efficient method
-            # Implement using controlled increment/decrement operations
-            # This is still approximate but more scalable
-            pass
+        qc.append(QFTGate(len(work_register)), work_register)
+        for i, x_qubit in enumerate(x_register):
+            addend = (multiplier * 2**i) % N
+            self.phi_add_mod(
+                qc, [control_qubit, x_qubit], work_register, flag_qubit, addend, N
+            )
+        qc.append(QFTGate(len(work_register)).inverse(), work_register)
 
-    def implement_cycle(self, qc, control_qubit, target_register, cycle):
+    def phi_add_mod(self, qc, controls, work_register, flag_qubit, value, N):
         """
-        Implement a permutation cycle using controlled multi-qubit operations
+        Doubly-controlled modular addition in Fourier space:
+        |φ(b)⟩ -> |φ(b + value mod N)⟩ when both controls are |1⟩
 
         Args:
             qc: Quantum circuit
-            control_qubit: Control qubit
-            target_register: Target register
-            cycle: List of values in the cycle
+            controls: The two control qubits
+            work_register: Register holding φ(b) with b < N (n + 1 qubits)
+            flag_qubit: Scratch qubit, |0⟩ before and after
+            value: Classical constant with 0 <= value < N
+            N: Modulus
         """
-        # For each adjacent pair in the cycle, implement a controlled swap
-        for i in range(len(cycle) - 1):
-            val1 = cycle[i]
-            val2 = cycle[i + 1]
-
-            # Create a controlled swap that swaps |val1⟩ ↔ |val2⟩
-            self.controlled_swap_states(qc, control_qubit, target_register, val1, val2)
-
-    def controlled_swap_states(
-        self, qc, control_qubit, target_register, state1, state2
-    ):
+        qft = QFTGate(len(work_register))
+        top = work_register[-1]
+
+        self.phi_add(qc, work_register, value, controls)
+        self.phi_add(qc, work_register, -N)
+
+        # b + value - N < 0 sets the top bit; remember that in the flag
+        qc.append(qft.inverse(), work_register)
+        qc.cx(top, flag_qubit)
+        qc.append(qft, work_register)
+        self.phi_add(qc, work_register, N, [flag_qubit])
+
+        # Reset the flag by comparing against value again
+        self.phi_add(qc, work_register, -value, controls)
+        qc.append(qft.inverse(), work_register)
+        qc.x(top)
+        qc.cx(top, flag_qubit)
+        qc.x(top)
+        qc.append(qft, work_register)
+        self.phi_add(qc, work_register, value, controls)
+
+    def phi_add(self, qc, work_register, value, controls=()):
         """
-        Swap two specific basis states in a controlled manner
+        Draper adder: add a classical constant to a register held in Fourier space
 
         Args:
             qc: Quantum circuit
-            control_qubit: Control qubit
-            target_register: Target register
-            state1, state2: The two states to swap (as integers)
+            work_register: Register holding φ(b)
+            value: Classical constant to add (may be negative)
+            controls: Optional control qubits
         """
-        n_qubits = len(target_register)
-
-        # Convert states to binary
-        bits1 = [(state1 >> i) & 1 for i in range(n_qubits)]
-        bits2 = [(state2 >> i) & 1 for i in range(n_qubits)]
-
-        # Find which bits differ
-        diff_bits = [i for i in range(n_qubits) if bits1[i] != bits2[i]]
-
-        if not diff_bits:
-            return
-
-        # Apply X gates to create the right conditions
-        for i in range(n_qubits):
-            if bits1[i] == 0:
-                qc.x(target_register[i])
-
-        # Multi-controlled NOT on the differing bits
-        if len(diff_bits) == 1:
-            # Simple case: single bit difference
-            controls = [control_qubit] + [
-                target_register[i] for i in range(n_qubits) if i not in diff_bits
-            ]
-            qc.mcx(controls, target_register[diff_bits[0]])
-        else:
-            # Multiple bits differ - need multiple controlled operations
-            for bit_idx in diff_bits:
-                controls = [control_qubit] + [
-                    target_register[i] for i in range(n_qubits) if i != bit_idx
-                ]
-                qc.mcx(controls, target_register[bit_idx])
-
-        # Undo the X gates
-        for i in range(n_qubits):
-            if bits1[i] == 0:
-                qc.x(target_register[i])
-
-    def run_shors_algorithm(self, N, max_attempts=10):
+        modulus = 2 ** len(work_register)
+        for j, qubit in enumerate(work_register):
+            angle = 2 * math.pi * ((value * 2**j) % modulus) / modulus
+            if angle == 0:
+                continue
+            if not controls:
+                qc.p(angle, qubit)
+            elif len(controls) == 1:
+                qc.cp(angle, controls[0], qubit)
+            else:
+                qc.mcp(angle, list(controls), qubit)
+
+    def run_shors_algorithm(self, N, max_attempts=10, parallel=False, workers=None):
         """
         Run Shor's algorithm with multiple attempts if needed
 
         Args:
             N: Number to factor
             max_attempts: Maximum number of attempts with different 'a' values
-            verbose: Print information
+            parallel: Try distinct bases concurrently on a process pool
+            workers: Number of worker processes in parallel mode (defaults to the CPU count)
 
         Returns:
             Tuple of factors if successful
@@ -448,6 +712,9 @@ class Quantum_Shors:
         self.logger.debug(f"Attempting to factor N = {N}")
         self.logger.debug("=" * 70)
 
+        if parallel:
+            return self._run_parallel(N, max_attempts, workers)
+
         for attempt in range(max_attempts):
             if attempt > 0:
                 self.logger.debug(f"\n--- Attempt {attempt + 1} ---")
@@ -455,11 +722,114 @@ class Quantum_Shors:
             result = self.shors_quantum(N)
 
             if result is not None:
+                self._log_run_stats()
                 return result
 
             self.logger.debug(f"\nFailed to factor {N} after {max_attempts} attempts")
+        self._log_run_stats()
         return None
 
+    def _run_parallel(self, N, max_attempts, workers=None):
+        """
+        Dispatch distinct random bases to a process pool and return the first
+        non-trivial factorization, cancelling whatever work is left.
+
+        Args:
+            N: Number to factor
+            max_attempts: Number of distinct bases to try
+            workers: Number of worker processes (defaults to the CPU count)
+
+        Returns:
+            Tuple of factors if successful, None otherwise
+        """
+        # Even and prime N are settled classically, no need to spin up a pool
+        if N % 2 == 0 or self.is_prime(N):
+            return self.shors_quantum(N)
+
+        # Workers only log their errors, so an oversized N is reported here
+        if self.simulation_backend(N) is None:
+            raise ValueError(
+                f"Period finding for N = {N} needs {self.counting_qubits(N)} counting "
+                f"qubits, more than the {self.max_qubits} this simulator is allowed"
+            )
+
+        workers = workers or os.cpu_count() or 1
+        bases = self.base_selector.take(N, max_attempts)
+        self.logger.debug(f"Trying bases {bases} on {workers} worker processes")
+
+        config = self._worker_config()
+        # Forking a process that already ran Aer can deadlock its OpenMP threads;
+        # a Pool (unlike ProcessPoolExecutor) can terminate simulations in flight
+        pool = multiprocessing.get_context("spawn").Pool(processes=workers)
+        try:
+            attempts = pool.imap_unordered(
+                functools.partial(_parallel_shors_attempt, config, N), bases
+            )
+            for _ in bases:
+                try:
+                    a, result, r = next(attempts)
+                except Exception as e:
+                    self.logger.debug(f"A worker failed: {e}")
+                    continue
+
+                if result is not None and 1 < result[0] < N:
+                    self.logger.debug(f"Base a = {a} produced factors {result}")
+                    self._log_run_stats()
+                    return result
+                self.logger.debug(f"Base a = {a} did not produce factors")
+                self.base_selector.record_failure(N, a, r)
+        finally:
+            # Stop the attempts still running once a factor is found
+            pool.terminate()
+            pool.join()
+
+        self.logger.debug(f"\nFailed to factor {N} after {len(bases)} parallel attempts")
+        self._log_run_stats()
+        return None
+
+    def _log_run_stats(self):
+        self.logger.debug(
+            f"Circuit cache: {self.cache_hits} hits, {self.cache_misses} misses; "
+            f"{self.shots_run} shots over {self.simulations_run} simulations; "
+            f"{self.simulations_avoided} simulations avoided by base screening"
+        )
+
+    def _worker_config(self):
+        """Settings a worker process needs to rebuild an equivalent instance"""
+        return {
+            "use_gpu": self.use_gpu,
+            "simulator_method": self.simulator_method,
+            "max_qubits": self.max_qubits,
+            "max_shots": self.max_shots,
+            "shot_batch": self.shot_batch,
+            "min_support": self.min_support,
+            "max_batches": self.max_batches,
+            "mode": self.mode,
+            "backend": self.backend,
+            "cache_size": self.cache_size,
+            "cache_dir": self.cache_dir,
+        }
+
+
+def _parallel_shors_attempt(config, N, a):
+    """Process pool entry point: one Shor attempt with a fixed base, returned as (a, factors, period)"""
+    shor = Quantum_Shors(
+        cache_size=config["cache_size"],
+        cache_dir=config["cache_dir"],
+        mode=config["mode"],
+        backend=config["backend"],
+        max_shots=config["max_shots"],
+    )
+    shor.enable_gpu(config["use_gpu"])
+    shor.simulator_method = config["simulator_method"]
+    shor.max_qubits = config["max_qubits"]
+    shor.shot_batch = config["shot_batch"]
+    shor.min_support = config["min_support"]
+    shor.max_batches = config["max_batches"]
+    shor._oversized.add(N)  # the parent has already warned about a numpy fallback
+    result = shor.shors_quantum(N, a)
+    return a, result, shor.last_period
+
 
 # Example usage and testing
 # if __name__ == "__main__":
@@ -9,38 +9,118 @@
 import random  # for generating random primes and keys
 import math  # for gcd calculation
 import logging  # for logging debug information
-from typing import Tuple, Optional  # type hints for clarity
+import os  # CPU count for the process pool
+import threading  # guards the shared lookup table cache
+import time  # measures the per-block cost before choosing a pool
+import multiprocessing  # spawn context for the process pool
+from concurrent.futures import ProcessPoolExecutor  # parallel block processing
+from collections import OrderedDict  # LRU cache of lookup tables
+from typing import Iterable, Iterator, NamedTuple, Tuple, Optional, Union  # type hints for clarity
+
+from abcapstonefa25team1.backend.rsa import packing
+from abcapstonefa25team1.backend.rsa.ciphertext import Ciphertext
+from abcapstonefa25team1.backend.utils.primality import is_prime, random_prime, small_primes
+
+
+class CRTPrivateKey(NamedTuple):
+    """
+    Private key kept together with its factors for Chinese Remainder decryption.
+    dp = d mod (p - 1), dq = d mod (q - 1) and qinv = q^-1 mod p.
+    """
+
+    d: int
+    n: int
+    p: int
+    q: int
+    dp: int
+    dq: int
+    qinv: int
 
 
 class RSA:
-    def __init__(self):
+    # Tables of x^k mod n for every x < n, shared by all instances, keyed by (k, n)
+    TABLE_MAX_MODULUS = 1 << 16
+    TABLE_CACHE_SIZE = 16
+    # Measured cost of spawning one worker process, and blocks timed to
+    # estimate the serial cost before choosing a pool
+    POOL_STARTUP_SECONDS = 0.3
+    PARALLEL_SAMPLE_BLOCKS = 64
+    _tables: "OrderedDict[Tuple[int, int], list[int]]" = OrderedDict()
+    _tables_lock = threading.Lock()
+
+    def __init__(self, use_tables: bool = True):
         # Set up a logger for debugging RSA operations
         self.logger = logging.getLogger("sred_cli.rsa_encrypt.RSA")
         self.logger.debug("Creating an instance of logger for RSA encryption")
 
+        # Replace per-block pow() with lookups when the modulus is small enough
+        self.use_tables = use_tables
+
+    @classmethod
+    def cached_tables(cls) -> list:
+        """
+        Returns the (exponent, n) keys of the cached lookup tables, least
+        recently used first.
+        """
+        with cls._tables_lock:
+            return list(cls._tables)
+
+    @classmethod
+    def clear_tables(cls) -> None:
+        """Drops every cached lookup table, e.g. to release their memory."""
+        with cls._tables_lock:
+            cls._tables.clear()
+
     def derive_private_key_from_factors(
-        self, p: int, q: int, e: int
-    ) -> Optional[Tuple[int, int]]:
+        self, p: int, q: int, e: int, crt: bool = False
+    ) -> Optional[Union[Tuple[int, int], CRTPrivateKey]]:
         """
         Derives the private key from prime factors p, q and public exponent e.
         Returns a tuple (N, d) where:
             N = p * q
             d = modular inverse of e modulo phi(N)
+        With crt=True a CRTPrivateKey is returned instead, which keeps p and q
+        so decrypt can work modulo each prime.
         Returns None if modular inverse does not exist.
+        Raises ValueError when p == q: phi(p^2) is not (p - 1)^2 and q has
+        no inverse modulo p, so no RSA key exists for a square modulus.
         """
+        if p == q:
+            raise ValueError(f"Modulus {p * q} = {p}^2 is not a product of two distinct primes")
         N = p * q  # modulus
         phi = (p - 1) * (q - 1)  # Euler's totient function
         d = self._modinv(e, phi)  # compute modular inverse
         if d is None:
             return None
+        if crt:
+            return self._crt_private_key(d, p, q)
         return (N, d)  # return modulus and private exponent
 
-    def encrypt(self, message: str, public_key: tuple[int, int]) -> list[int]:
+    def encrypt(
+        self,
+        message: str,
+        public_key: tuple[int, int],
+        compact: bool = False,
+        packed: bool = False,
+    ) -> Union[list[int], Ciphertext]:
         """
         Encrypts a message string using the provided public key (e, n).
-        Returns a list of integers representing the ciphertext.
+        Returns a list of integers representing the ciphertext, or a
+        Ciphertext (one NumPy array) when compact=True.
+        With packed=True the message is UTF-8 encoded and packed several
+        bytes per block (see encrypt_bytes); decrypt it with packed=True.
         """
         e, n = public_key
+        if packed:
+            blocks = self.encrypt_bytes(message.encode("utf-8"), public_key)
+            return Ciphertext(blocks, n) if compact else blocks
+        if compact:
+            return self._encrypt_compact(message, e, n)
+
+        table = self._lookup_table(e, n, len(message))
+        if table is not None:
+            return self._encrypt_with_table(message, table, n)
+
         ciphertext = []
         for char in message:
             m_int = ord(char)  # convert character to integer
@@ -51,37 +131,226 @@ class RSA:
             ciphertext.append(c_int)
         return ciphertext
 
-    def decrypt(self, cipher_blocks: list[int], private_key: tuple[int, int]) -> str:
+    def decrypt(
+        self,
+        cipher_blocks: Union[list[int], Ciphertext],
+        private_key: Union[tuple[int, int], CRTPrivateKey],
+        packed: bool = False,
+    ) -> str:
         """
         Decrypts a list of integers (cipher_blocks) using private key (d, n).
+        A CRTPrivateKey is decrypted with two half-size exponentiations per block.
+        A Ciphertext is decrypted in place through the lookup table when possible.
+        packed=True reverses encrypt(..., packed=True).
         Returns the decrypted message as a string.
         """
+        if packed:
+            return self.decrypt_bytes(cipher_blocks, private_key).decode("utf-8")
+        if isinstance(cipher_blocks, Ciphertext):
+            d, n = (private_key.d, private_key.n) if isinstance(private_key, CRTPrivateKey) else private_key
+            table = self._lookup_table(d, n, len(cipher_blocks))
+            if table is not None and n <= 256:
+                return cipher_blocks.tobytes().translate(self._decrypt_translation(table, n)).decode("latin-1")
+            if table is not None:
+                return "".join(map(chr, cipher_blocks.lookup(table).tolist()))
+            cipher_blocks = cipher_blocks.tolist()
+
+        if isinstance(private_key, CRTPrivateKey):
+            table = self._lookup_table(private_key.d, private_key.n, len(cipher_blocks))
+            if table is None:
+                return "".join(chr(self._decrypt_block_crt(c, private_key)) for c in cipher_blocks)
+            return self._decrypt_with_table(cipher_blocks, table, private_key.n)
+
         d, n = private_key
+        table = self._lookup_table(d, n, len(cipher_blocks))
+        if table is not None:
+            return self._decrypt_with_table(cipher_blocks, table, n)
+
         message = ""
         for c in cipher_blocks:
             m_int = pow(c, d, n)  # RSA decryption: m = c^d mod n
             message += chr(m_int)  # convert integer back to character
         return message
 
-    def generate_keys(self, primes_range=(12, 100), n_range=(123, 255)) -> tuple:
+    def encrypt_bytes(self, data: bytes, public_key: tuple[int, int]) -> list[int]:
+        """
+        Encrypts arbitrary bytes, packing floor(log256 n) bytes into each block,
+        so a larger modulus needs proportionally fewer blocks and pow() calls.
+        Requires n >= 256. Returns the list of cipher blocks.
+        """
+        e, n = public_key
+        return self._encrypt_ints(packing.pack(data, n), e, n)
+
+    def decrypt_bytes(
+        self,
+        cipher_blocks: Union[list[int], Ciphertext],
+        private_key: Union[tuple[int, int], CRTPrivateKey],
+    ) -> bytes:
+        """
+        Decrypts blocks produced by encrypt_bytes and unpacks the original bytes.
+        """
+        n = private_key.n if isinstance(private_key, CRTPrivateKey) else private_key[1]
+        return packing.unpack(self._decrypt_ints(cipher_blocks, private_key), n)
+
+    def encrypt_bytes_stream(
+        self, chunks: Iterable[bytes], public_key: tuple[int, int]
+    ) -> Iterator[list[int]]:
+        """
+        encrypt_bytes over a stream of byte chunks; the blocks equal those of
+        encrypt_bytes on the whole input.
+        """
+        e, n = public_key
+        for blocks in packing.pack_stream(chunks, n):
+            yield self._encrypt_ints(blocks, e, n)
+
+    def decrypt_bytes_stream(
+        self,
+        block_chunks: Iterable[list[int]],
+        private_key: Union[tuple[int, int], CRTPrivateKey],
+    ) -> Iterator[bytes]:
+        """
+        Decrypts chunks of blocks from encrypt_bytes(_stream), yielding plaintext bytes.
+        """
+        n = private_key.n if isinstance(private_key, CRTPrivateKey) else private_key[1]
+        decrypted = (self._decrypt_ints(blocks, private_key) for blocks in block_chunks)
+        yield from packing.unpack_stream(decrypted, n)
+
+    def encrypt_stream(
+        self, chunks: Iterable[str], public_key: tuple[int, int]
+    ) -> Iterator[list[int]]:
+        """
+        Encrypts text chunk by chunk, yielding the ciphertext blocks of each chunk.
+        Only one chunk is held in memory at a time.
+        """
+        for chunk in chunks:
+            yield self.encrypt(chunk, public_key)
+
+    def decrypt_stream(
+        self,
+        block_chunks: Iterable[list[int]],
+        private_key: Union[tuple[int, int], CRTPrivateKey],
+    ) -> Iterator[str]:
+        """
+        Decrypts chunks of cipher blocks, yielding the plaintext of each chunk.
+        """
+        for blocks in block_chunks:
+            yield self.decrypt(blocks, private_key)
+
+    def encrypt_parallel(
+        self,
+        message: str,
+        public_key: tuple[int, int],
+        workers: Optional[int] = None,
+        chunk_size: int = 65536,
+        min_seconds: Optional[float] = None,
+    ) -> list[int]:
+        """
+        Encrypts a message on a process pool, chunk_size characters per task,
+        and reassembles the blocks in order. Messages that the lookup table
+        handles, or whose measured serial cost is below min_seconds (by
+        default the cost of starting the workers), are encrypted serially.
+        """
+        e, n = public_key
+        chunks = [message[i : i + chunk_size] for i in range(0, len(message), chunk_size)]
+        results = self._map_chunks(
+            _encrypt_chunk, chunks, public_key, e, n, len(message), workers, min_seconds,
+            lambda sample: self._encrypt_ints([ord(char) for char in sample], e, n),
+        )
+        if results is None:
+            return self.encrypt(message, public_key)
+        return [c for blocks in results for c in blocks]
+
+    def decrypt_parallel(
+        self,
+        cipher_blocks: list[int],
+        private_key: Union[tuple[int, int], CRTPrivateKey],
+        workers: Optional[int] = None,
+        chunk_size: int = 65536,
+        min_seconds: Optional[float] = None,
+    ) -> str:
+        """
+        Decrypts cipher blocks on a process pool, chunk_size blocks per task,
+        and joins the plaintext in order. Inputs that the lookup table
+        handles, or whose measured serial cost is below min_seconds, are
+        decrypted serially.
+        """
+        if isinstance(private_key, CRTPrivateKey):
+            d, n = private_key.d, private_key.n
+        else:
+            d, n = private_key
+        chunks = [cipher_blocks[i : i + chunk_size] for i in range(0, len(cipher_blocks), chunk_size)]
+        results = self._map_chunks(
+            _decrypt_chunk, chunks, private_key, d, n, len(cipher_blocks), workers, min_seconds,
+            lambda sample: self._decrypt_ints(sample, private_key),
+        )
+        if results is None:
+            return self.decrypt(cipher_blocks, private_key)
+        return "".join(results)
+
+    def _map_chunks(self, func, chunks, key, exponent, n, size, workers, min_seconds, sample):
+        """
+        Runs func(chunk, key, use_tables) for every chunk on a process pool, in order.
+        Returns None when the serial path should be used instead: when the
+        lookup table applies (a table lookup or bytes.translate beats any pool),
+        or when sample(), timed on the first blocks, puts the serial pow() cost
+        below min_seconds.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers < 2 or len(chunks) < 2:
+            return None
+        workers = min(workers, len(chunks))
+
+        if self._lookup_table(exponent, n, size) is not None:
+            return None
+
+        probe = chunks[0][: self.PARALLEL_SAMPLE_BLOCKS]
+        start = time.perf_counter()
+        sample(probe)
+        serial_seconds = (time.perf_counter() - start) / max(1, len(probe)) * size
+        if min_seconds is None:
+            min_seconds = self.POOL_STARTUP_SECONDS * workers
+        if serial_seconds < min_seconds:
+            self.logger.debug(f"Serial estimate {serial_seconds:.3f}s is below {min_seconds:.3f}s, not using a pool")
+            return None
+
+        self.logger.debug(f"Processing {len(chunks)} chunks on {workers} worker processes")
+        # Spawned workers are safe to start from threads (e.g. the GUI worker thread)
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            n_chunks = len(chunks)
+            return list(
+                pool.map(func, chunks, [key] * n_chunks, [self.use_tables] * n_chunks)
+            )
+
+    def generate_keys(
+        self, primes_range=(12, 100), n_range=(123, 255), crt=False, bits=None, e=65537
+    ) -> tuple:
         """
         Generates RSA keys ensuring modulus n is within a valid byte-sized range.
+        With bits set, a modulus of exactly that many bits is built from two
+        random large primes instead (primes_range and n_range are ignored)
+        and the public exponent is e.
 
         Returns:
             (public_key, private_key, (p, q))
+            private_key is (d, n), or a CRTPrivateKey when crt=True
 
         Constraints:
             n = p * q such that n_range[0] <= n <= n_range[1]
             e coprime with φ(n)
         """
-        primes = [p for p in range(*primes_range) if self._is_prime(p)]
+        if bits is not None:
+            return self._generate_large_keys(bits, e, crt)
+
+        lo, hi = primes_range
+        primes = [p for p in small_primes(hi - 1) if p >= lo]
         if len(primes) < 2:
             raise ValueError(f"Not enough primes found in range {primes_range}")
 
         # Keep trying random pairs until valid n is found
         for _ in range(1000):  # hard safety limit
-            p = random.choice(primes)
-            q = random.choice([x for x in primes if x != p])
+            p, q = random.sample(primes, 2)
             n = p * q
 
             # Enforce modulus constraints
@@ -89,15 +358,20 @@ class RSA:
                 continue
 
             phi = (p - 1) * (q - 1)
-            e_candidates = [x for x in range(3, phi, 2) if math.gcd(x, phi) == 1]
-            if not e_candidates:
+            if phi <= 4:
                 continue
 
-            e = random.choice(e_candidates)
+            # Rejection sampling: a uniform odd e in [3, phi) coprime with phi,
+            # without listing every candidate
+            e = random.randrange(3, phi, 2)
+            while math.gcd(e, phi) != 1:
+                e = random.randrange(3, phi, 2)
             d = self._modinv(e, phi)
             if d is None:
                 continue
 
+            if crt:
+                return ((e, n), self._crt_private_key(d, p, q), (p, q))
             return ((e, n), (d, n), (p, q))  # success
 
         # If we exhausted attempts
@@ -105,6 +379,170 @@ class RSA:
             f"Failed to generate valid RSA key within {n_range} after multiple attempts"
         )
 
+    def _generate_large_keys(self, bits, e, crt):
+        """
+        Keys with an exactly `bits`-bit modulus from two random primes of
+        about bits / 2 bits each. Primes with gcd(e, p - 1) != 1 are skipped
+        during the search, so e always has an inverse modulo phi.
+
+        The prime searches dominate: in CPython, 1024-bit keys take about
+        0.05 s and 2048-bit keys about 0.3 s (occasionally over 1 s). 4096-bit
+        keys take about 3 s on average and sometimes over 15 s, because every
+        2048-bit candidate test costs ~30 ms. Use KeyPool to generate large
+        keys ahead of time.
+        """
+        if bits < 32:
+            raise ValueError("Use primes_range/n_range for moduli below 32 bits")
+        if e < 3 or e % 2 == 0:
+            raise ValueError(f"Public exponent e={e} must be odd and at least 3")
+
+        def usable(candidate):
+            return math.gcd(e, candidate - 1) == 1
+
+        p = random_prime(bits - bits // 2, condition=usable)
+        q = random_prime(bits // 2, condition=usable)
+        while q == p:
+            q = random_prime(bits // 2, condition=usable)
+        self.logger.debug(f"Generated {bits}-bit modulus from {p.bit_length()} and {q.bit_length()} bit primes")
+
+        n = p * q
+        d = self._modinv(e, (p - 1) * (q - 1))
+        if crt:
+            return ((e, n), self._crt_private_key(d, p, q), (p, q))
+        return ((e, n), (d, n), (p, q))
+
+    def _lookup_table(self, exponent, n, count):
+        """
+        Returns the cached table of x^exponent mod n for x < n, building it
+        when it pays off (at least n / 4 blocks to process), or None to use pow().
+        """
+        if not self.use_tables or n > self.TABLE_MAX_MODULUS:
+            return None
+        key = (exponent, n)
+        with self._tables_lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self._tables.move_to_end(key)
+                return table
+        if count * 4 < n:
+            return None
+
+        self.logger.debug(f"Building lookup table for exponent {exponent}, n={n}")
+        table = [pow(x, exponent, n) for x in range(n)]
+        with self._tables_lock:
+            self._tables[key] = table
+            self._tables.move_to_end(key)
+            while len(self._tables) > self.TABLE_CACHE_SIZE:
+                self._tables.popitem(last=False)
+        return table
+
+    def _encrypt_ints(self, values, e, n):
+        """
+        c = m^e mod n for every message block m, through the lookup table when possible.
+        """
+        table = self._lookup_table(e, n, len(values))
+        if table is not None:
+            return [table[m] for m in values]
+        return [pow(m, e, n) for m in values]
+
+    def _decrypt_ints(self, cipher_blocks, private_key):
+        """
+        m = c^d mod n for every cipher block, as a list of ints.
+        """
+        if isinstance(cipher_blocks, Ciphertext):
+            cipher_blocks = cipher_blocks.tolist()
+        if isinstance(private_key, CRTPrivateKey):
+            d, n = private_key.d, private_key.n
+        else:
+            d, n = private_key
+        table = self._lookup_table(d, n, len(cipher_blocks))
+        if table is not None:
+            return [table[c % n] for c in cipher_blocks]
+        if isinstance(private_key, CRTPrivateKey):
+            return [self._decrypt_block_crt(c, private_key) for c in cipher_blocks]
+        return [pow(c, d, n) for c in cipher_blocks]
+
+    def _encrypt_compact(self, message, e, n):
+        """
+        Encrypts straight into a Ciphertext; with n <= 256 and a lookup table
+        the translated bytes are wrapped without building any Python ints.
+        """
+        Ciphertext.block_size_for(n)  # reject moduli the container cannot hold
+        table = self._lookup_table(e, n, len(message))
+        if table is not None and n <= 256:
+            data = self._translate_message(message, table, n)
+            if data is not None:
+                return Ciphertext.frombuffer(data, n)
+        return Ciphertext(self.encrypt(message, (e, n)), n)
+
+    def _translate_message(self, message, table, n):
+        """
+        Encrypts a message for n <= 256 with bytes.translate.
+        Returns None if some character does not fit the modulus.
+        """
+        try:
+            data = message.encode("latin-1")
+        except UnicodeEncodeError:
+            return None
+        if data and max(data) >= n:
+            return None
+        return data.translate(bytes(table) + bytes(256 - n))
+
+    def _decrypt_translation(self, table, n):
+        """
+        256-byte translation for n <= 256 that maps every byte c to table[c % n].
+        """
+        return bytes(table[c % n] for c in range(256))
+
+    def _encrypt_with_table(self, message, table, n):
+        """
+        Encrypts with a lookup table; bytes.translate does the work when n <= 256.
+        """
+        if n <= 256:
+            data = self._translate_message(message, table, n)
+            if data is not None:
+                return list(data)
+
+        ciphertext = []
+        for char in message:
+            m_int = ord(char)
+            if m_int >= n:
+                raise ValueError(f"Character '{char}' integer {m_int} >= modulus n={n}")
+            ciphertext.append(table[m_int])
+        return ciphertext
+
+    def _decrypt_with_table(self, cipher_blocks, table, n):
+        """
+        Decrypts with a lookup table; bytes.translate does the work when n <= 256.
+        """
+        if n <= 256 and all(0 <= c < 256 for c in cipher_blocks):
+            return bytes(cipher_blocks).translate(self._decrypt_translation(table, n)).decode("latin-1")
+        return "".join([chr(table[c % n]) for c in cipher_blocks])
+
+    def _crt_private_key(self, d, p, q):
+        """
+        Builds the CRT form of private exponent d for n = p * q.
+        """
+        return CRTPrivateKey(
+            d=d,
+            n=p * q,
+            p=p,
+            q=q,
+            dp=d % (p - 1),
+            dq=d % (q - 1),
+            qinv=pow(q, -1, p),
+        )
+
+    def _decrypt_block_crt(self, c, key):
+        """
+        Decrypts one block with Garner's recombination:
+        m = m2 + q * (qinv * (m1 - m2) mod p), m1 = c^dp mod p, m2 = c^dq mod q
+        """
+        m1 = pow(c, key.dp, key.p)
+        m2 = pow(c, key.dq, key.q)
+        h = (key.qinv * (m1 - m2)) % key.p
+        return m2 + h * key.q
+
     def _modinv(self, a, m):
         """
         Computes modular inverse of a modulo m using Extended Euclidean Algorithm.
@@ -122,10 +560,14 @@ class RSA:
         Checks if a number n is prime.
         Returns True if n is prime, False otherwise.
         """
-        if n <= 1:
-            return False
-        # Check divisibility up to sqrt(n)
-        for i in range(2, int(n**0.5) + 1):
-            if n % i == 0:
-                return False
-        return True
+        return is_prime(n)
+
+
+def _encrypt_chunk(chunk, public_key, use_tables):
+    """Process pool entry point: encrypt one chunk of text"""
+    return RSA(use_tables=use_tables).encrypt(chunk, public_key)
+
+
+def _decrypt_chunk(blocks, private_key, use_tables):
+    """Process pool entry point: decrypt one chunk of cipher blocks"""
+    return RSA(use_tables=use_tables).decrypt(blocks, private_key)
@@ -0,0 +1,91 @@
+# Project: TEAM 1
+# Purpose Details: Decrypts many .enc files under one private key on a process pool
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: 10/17/2026
+# Last Date Changed: 10/17/2026
+# Revision: Initial version
+
+import logging  # for logging debug information
+import multiprocessing  # spawn context for the process pool
+import os  # CPU count and file sizes
+import time  # per-file timings
+from concurrent.futures import ProcessPoolExecutor, as_completed  # parallel files
+from typing import Iterable, Iterator, NamedTuple, Optional, Tuple, Union  # type hints for clarity
+
+from abcapstonefa25team1.backend.rsa.RSA_encrypt import RSA, CRTPrivateKey
+from abcapstonefa25team1.backend.utils.enc_container import read_header
+from abcapstonefa25team1.backend.utils.read_write import read_encrypted_binary, write_binary_chunks
+
+logger = logging.getLogger("sred_cli.batch_decrypt")
+
+
+class FileResult(NamedTuple):
+    input_path: str
+    output_path: str
+    bytes_in: int
+    bytes_out: int
+    seconds: float
+    error: Optional[str] = None
+
+
+def decrypt_file(
+    input_path: str,
+    output_path: str,
+    private_key: Union[Tuple[int, int], CRTPrivateKey],
+    e: Optional[int] = None,
+) -> FileResult:
+    """
+    Decrypts one .enc file (container or legacy) to output_path.
+    Packed containers are unpacked to their original bytes, anything else
+    is written as UTF-8 text. Errors are returned in the result, not raised,
+    so one bad file does not stop a batch.
+    """
+    start = time.perf_counter()
+    n = private_key.n if isinstance(private_key, CRTPrivateKey) else private_key[1]
+    try:
+        header = read_header(input_path)
+        blocks = read_encrypted_binary(input_path, n, e=e)
+        rsa = RSA()
+        if header is not None and header.packed:
+            data = rsa.decrypt_bytes(blocks, private_key)
+        else:
+            data = rsa.decrypt(blocks, private_key).encode("utf-8")
+        write_binary_chunks(output_path, [data])
+    except Exception as err:
+        return FileResult(input_path, output_path, 0, 0, time.perf_counter() - start, str(err))
+    return FileResult(
+        input_path, output_path, os.path.getsize(input_path), len(data), time.perf_counter() - start
+    )
+
+
+def decrypt_files(
+    jobs: Iterable[Tuple[str, str]],
+    private_key: Union[Tuple[int, int], CRTPrivateKey],
+    e: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> Iterator[FileResult]:
+    """
+    Decrypts (input_path, output_path) pairs under one key, yielding each
+    result as it completes. Files are spread over a process pool of
+    `workers` processes (defaults to the CPU count); a single file or a
+    single worker is decrypted in this process.
+    """
+    jobs = list(jobs)
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers < 2:
+        for input_path, output_path in jobs:
+            yield decrypt_file(input_path, output_path, private_key, e)
+        return
+
+    logger.debug(f"Decrypting {len(jobs)} files on {workers} worker processes")
+    # Spawned workers are safe to start from any thread
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        futures = [
+            pool.submit(decrypt_file, input_path, output_path, private_key, e)
+            for input_path, output_path in jobs
+        ]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,102 @@
+# Project: TEAM 1
+# Purpose Details: Compact NumPy-backed container for RSA cipher blocks
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: 10/17/2026
+# Last Date Changed: 10/17/2026
+# Revision: Initial version
+
+from typing import Iterable, Iterator, Union  # type hints for clarity
+
+import numpy as np  # fixed-width big-endian block storage
+
+
+class Ciphertext:
+    """
+    Cipher blocks of one modulus n stored in a single NumPy array.
+
+    Each block is an unsigned big-endian integer of (n.bit_length() + 7) // 8
+    bytes, the layout write_encrypted_binary uses, so tobytes() is the file
+    content and frombuffer() wraps file content without one Python int per block.
+    Moduli of up to 8 bytes are supported.
+    """
+
+    MAX_BLOCK_SIZE = 8
+
+    def __init__(self, values: Union[np.ndarray, Iterable[int]], n: int):
+        self.n = n
+        self.block_size = self.block_size_for(n)
+        # Storage width: the smallest NumPy unsigned type that holds one block
+        self.width = next(w for w in (1, 2, 4, 8) if w >= self.block_size)
+        self.values = np.asarray(values, dtype=f">u{self.width}")
+
+    @classmethod
+    def block_size_for(cls, n: int) -> int:
+        """
+        Bytes per block for modulus n; raises ValueError when n needs more than 8.
+        """
+        block_size = max(1, (n.bit_length() + 7) // 8)
+        if block_size > cls.MAX_BLOCK_SIZE:
+            raise ValueError(f"Modulus n={n} needs {block_size}-byte blocks, at most 8 are supported")
+        return block_size
+
+    @classmethod
+    def frombuffer(cls, data: Union[bytes, bytearray, memoryview], n: int) -> "Ciphertext":
+        """
+        Wraps raw block bytes. When the block size is 1, 2, 4 or 8 bytes the
+        array is a read-only view of data (no copy).
+        """
+        block_size = cls.block_size_for(n)
+        if len(data) % block_size != 0:
+            raise ValueError("Cipher length is not a multiple of block size.")
+
+        ciphertext = cls.__new__(cls)
+        ciphertext.n = n
+        ciphertext.block_size = block_size
+        ciphertext.width = next(w for w in (1, 2, 4, 8) if w >= block_size)
+        if ciphertext.width == block_size:
+            ciphertext.values = np.frombuffer(data, dtype=f">u{block_size}")
+        else:
+            # 3, 5, 6 and 7 byte blocks are left-padded with zero bytes
+            raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, block_size)
+            padded = np.zeros((len(raw), ciphertext.width), dtype=np.uint8)
+            padded[:, ciphertext.width - block_size :] = raw
+            ciphertext.values = padded.view(f">u{ciphertext.width}").ravel()
+        return ciphertext
+
+    def tobytes(self) -> bytes:
+        """
+        The blocks as fixed-width big-endian bytes (the .enc file layout).
+        """
+        if self.width == self.block_size:
+            return self.values.tobytes()
+        raw = self.values.view(np.uint8).reshape(-1, self.width)
+        return raw[:, self.width - self.block_size :].tobytes()
+
+    def tolist(self) -> list[int]:
+        return self.values.tolist()
+
+    def lookup(self, table: list[int]) -> np.ndarray:
+        """
+        Maps every block c to table[c % n] with one fancy-indexing operation.
+        """
+        return np.asarray(table, dtype=np.int64)[self.values % self.n]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.values.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Ciphertext(self.values[index], self.n)
+        return int(self.values[index])
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Ciphertext):
+            return self.n == other.n and np.array_equal(self.values, other.values)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Ciphertext(n={self.n}, blocks={len(self)})"
@@ -0,0 +1,174 @@
+# Project: TEAM 1
+# Purpose Details: Pool of pre-generated RSA keypairs refilled in the background
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: 10/17/2026
+# Last Date Changed: 10/17/2026
+# Revision: Initial version
+
+import logging  # for logging debug information
+import threading  # background refill thread
+from collections import deque  # FIFO of ready keypairs per size
+from typing import Optional  # type hints for clarity
+
+from abcapstonefa25team1.backend.rsa.RSA_encrypt import RSA
+
+
+class KeyPool:
+    """
+    Keeps up to `size` ready keypairs per key size and tops them up on a
+    daemon thread, so get() normally returns at once.
+
+    A key size is the `bits` argument of RSA.generate_keys; None stands for
+    the default small keys (n <= 255). Sizes are filled once they have been
+    requested through get() or warm(). When a size has no key ready, get()
+    generates one synchronously and counts a miss.
+
+    The pool only pays off in a long-running process such as the GUI; the
+    CLI needs one key per process and generates it directly.
+    """
+
+    def __init__(self, size: int = 4, rsa: Optional[RSA] = None, crt: bool = False):
+        # Set up a logger for debugging the key pool
+        self.logger = logging.getLogger("sred_cli.key_pool.KeyPool")
+        self.logger.debug("Creating an instance of logger for KeyPool")
+
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+        self.size = size
+        self.crt = crt
+        self.rsa = rsa or RSA()
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+
+        self._keys: dict[Optional[int], deque] = {}
+        self._lock = threading.Condition()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def get(self, bits: Optional[int] = None) -> tuple:
+        """
+        Returns (public_key, private_key, (p, q)) as RSA.generate_keys does,
+        from the pool when one is ready. Each key is handed out only once.
+        """
+        with self._lock:
+            keys = self._register(bits)
+            if keys:
+                self.hits += 1
+                key = keys.popleft()
+            else:
+                self.misses += 1
+                key = None
+            self._lock.notify()
+
+        if key is None:
+            self.logger.debug(f"Key pool miss for bits={bits}, generating synchronously")
+            key = self._generate(bits)
+        return key
+
+    def warm(self, *bit_sizes: Optional[int]) -> None:
+        """
+        Starts filling the given sizes (the default small keys if none are given)
+        in the background without taking a key.
+        """
+        with self._lock:
+            for bits in bit_sizes or (None,):
+                self._register(bits)
+            self._lock.notify()
+
+    def available(self, bits: Optional[int] = None) -> int:
+        """Number of keys of this size ready right now."""
+        with self._lock:
+            return len(self._keys.get(bits, ()))
+
+    def stats(self) -> dict:
+        """
+        Hit/miss counters and the number of ready keys per size.
+        """
+        with self._lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / requests if requests else 0.0,
+                "generated": self.generated,
+                "available": {bits: len(keys) for bits, keys in self._keys.items()},
+            }
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the refill thread once it finishes the key it is working on.
+        """
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _register(self, bits):
+        # Caller holds the lock; starts the refill thread on first use
+        keys = self._keys.setdefault(bits, deque())
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(target=self._refill, name="KeyPool-refill", daemon=True)
+            self._thread.start()
+        return keys
+
+    def _next_size(self):
+        # Caller holds the lock; the emptiest size is refilled first
+        short = [(len(keys), bits) for bits, keys in self._keys.items() if len(keys) < self.size]
+        if not short:
+            return False, None
+        return True, min(short, key=lambda item: item[0])[1]
+
+    def _refill(self):
+        while True:
+            with self._lock:
+                while not self._closed and not self._next_size()[0]:
+                    self._lock.wait()
+                if self._closed:
+                    return
+                _, bits = self._next_size()
+
+            # Generated outside the lock, so get() is never blocked by a refill
+            try:
+                key = self._generate(bits)
+            except Exception as err:
+                self.logger.error(f"Key pool refill failed for bits={bits}: {err}")
+                with self._lock:
+                    self._keys.pop(bits, None)
+                continue
+
+            with self._lock:
+                self._keys.setdefault(bits, deque()).append(key)
+
+    def _generate(self, bits):
+        if bits is None:
+            key = self.rsa.generate_keys(crt=self.crt)
+        else:
+            key = self.rsa.generate_keys(bits=bits, crt=self.crt)
+        with self._lock:
+            self.generated += 1
+        return key
+
+
+_default_pool: Optional[KeyPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def default_pool() -> KeyPool:
+    """
+    The process-wide KeyPool shared by the frontends.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = KeyPool()
+        return _default_pool
@@ -0,0 +1,133 @@
+# Project: TEAM 1
+# Purpose Details: Packs plaintext bytes into multi-byte RSA message blocks
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: 10/17/2026
+# Last Date Changed: 10/17/2026
+# Revision: Initial version
+
+from typing import Iterable, Iterator  # type hints for clarity
+
+import numpy as np  # fast conversion for 1, 2, 4 and 8 byte blocks
+
+# Appended to every message before the zero fill, so the original length is
+# recoverable even when the data itself ends in zero bytes (ISO/IEC 7816-4)
+PAD_MARKER = 0x80
+
+
+def bytes_per_block(n: int) -> int:
+    """
+    Largest k with 256^k <= n, i.e. floor(log256 n): every k-byte block is
+    then an integer below n. 0 for moduli below 256.
+    """
+    return (n.bit_length() - 1) // 8 if n > 0 else 0
+
+
+def _check_modulus(n: int) -> int:
+    k = bytes_per_block(n)
+    if k == 0:
+        raise ValueError(f"Modulus n={n} is too small to pack bytes, it must be at least 256")
+    return k
+
+
+def _to_ints(data: bytes, k: int) -> list[int]:
+    # data is a whole number of k-byte blocks
+    if k in (1, 2, 4, 8):
+        return np.frombuffer(data, dtype=f">u{k}").tolist()
+    return [int.from_bytes(data[i : i + k], "big") for i in range(0, len(data), k)]
+
+
+def _to_bytes(values: list[int], k: int) -> bytes:
+    try:
+        if k in (1, 2, 4, 8):
+            if values and max(values) >= 1 << (8 * k):
+                raise OverflowError
+            return np.asarray(values, dtype=np.uint64).astype(f">u{k}").tobytes()
+        return b"".join(m.to_bytes(k, "big") for m in values)
+    except OverflowError:
+        raise ValueError("Decrypted block does not fit the packing width (wrong key?)") from None
+
+
+def pad(data: bytes, k: int) -> bytes:
+    """
+    data followed by 0x80 and enough zeros to fill a whole number of k-byte blocks.
+    """
+    return data + bytes([PAD_MARKER]) + bytes(-(len(data) + 1) % k)
+
+
+def unpad(data: bytes, k: int) -> bytes:
+    """
+    Inverse of pad(); the padding always lies within the last k bytes.
+    """
+    tail = data[-k:].rstrip(b"\0")
+    if not tail or tail[-1] != PAD_MARKER:
+        raise ValueError("Invalid block padding (wrong key or truncated ciphertext?)")
+    return data[: len(data) - k] + tail[:-1]
+
+
+def pack(data: bytes, n: int) -> list[int]:
+    """
+    Splits data into padded k-byte big-endian blocks, k = bytes_per_block(n).
+
+    Args:
+    data (bytes): Plaintext bytes.
+    n (int): RSA modulus, at least 256.
+
+    Returns:
+    list[int]: Message blocks, each below n.
+    """
+    k = _check_modulus(n)
+    return _to_ints(pad(bytes(data), k), k)
+
+
+def unpack(blocks: Iterable[int], n: int) -> bytes:
+    """
+    Inverse of pack().
+
+    Args:
+    blocks (iterable[int]): Decrypted message blocks.
+    n (int): RSA modulus used by pack().
+
+    Returns:
+    bytes: The original plaintext bytes.
+    """
+    k = _check_modulus(n)
+    data = _to_bytes(list(blocks), k)
+    if not data:
+        raise ValueError("No blocks to unpack")
+    return unpad(data, k)
+
+
+def pack_stream(chunks: Iterable[bytes], n: int) -> Iterator[list[int]]:
+    """
+    pack() over a stream of byte chunks. Bytes that do not fill a whole block
+    are carried into the next chunk, and only the end of the stream is padded,
+    so the blocks equal pack(b"".join(chunks), n).
+    """
+    k = _check_modulus(n)
+    carry = b""
+    for chunk in chunks:
+        data = carry + chunk
+        cut = len(data) - len(data) % k
+        carry = data[cut:]
+        if cut:
+            yield _to_ints(data[:cut], k)
+    yield _to_ints(pad(carry, k), k)
+
+
+def unpack_stream(block_chunks: Iterable[list[int]], n: int) -> Iterator[bytes]:
+    """
+    unpack() over a stream of decrypted block chunks. The last block is held
+    back until the stream ends, since it is the one that carries the padding.
+    """
+    k = _check_modulus(n)
+    held = b""
+    for blocks in block_chunks:
+        data = held + _to_bytes(list(blocks), k)
+        if len(data) > k:
+            yield data[:-k]
+            data = data[-k:]
+        held = data
+    if not held:
+        raise ValueError("No blocks to unpack")
+    yield unpad(held, k)
@@ -0,0 +1,354 @@
+# -----------------------------------------------------------
+# Project: PSU Abington Fall 2025 Capstone
+# Purpose Details: Versioned, self-describing .enc container format
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: October 17, 2026
+# Last Date Changed: October 17, 2026
+# Revision: 1.0 - Initial version, header + per-chunk CRC32 table
+#           2.0 - u16 block size for moduli of 2048 bits and more
+# -----------------------------------------------------------
+#
+# Layout (all integers big-endian):
+#
+#   header   magic "SRED" | version u8 | flags u8 | block size u16 |
+#            modulus fingerprint 8 bytes | public exponent u64 (0 = unknown) |
+#            block count u64 | blocks per chunk u32 | CRC32 of the above u32
+#   data     block count fixed-width blocks, contiguous (same bytes as the
+#            legacy headerless format, so the data region can be memory-mapped)
+#   trailer  one CRC32 u32 per chunk of `blocks per chunk` blocks
+#
+# Flags: bit 0 (FLAG_PACKED) marks blocks that hold several plaintext bytes
+# each (backend/rsa/packing.py) rather than one character.
+#
+# Version 1 files (block size u8, flags u16, otherwise the same 40 bytes) are
+# still read.
+#
+# Chunk k starts at HEADER_SIZE + k * chunk_blocks * block_size, so readers can
+# seek to any chunk and verify it on its own.
+
+import hashlib
+import os
+import struct
+import zlib
+from typing import Iterator, NamedTuple, Optional
+
+MAGIC = b"SRED"
+VERSION = 2
+FLAG_PACKED = 0x0001
+DEFAULT_CHUNK_BLOCKS = 65536
+
+_HEADER = struct.Struct(">4sBBH8sQQI")  # version 1 swaps block size and flags
+MAX_BLOCK_SIZE = 0xFFFF
+_CRC = struct.Struct(">I")
+HEADER_SIZE = _HEADER.size + _CRC.size
+
+
+def modulus_fingerprint(n):
+    """
+    First 8 bytes of SHA-256 over the big-endian bytes of modulus n.
+
+    Args:
+    n (int): RSA modulus.
+
+    Returns:
+    bytes: 8-byte fingerprint.
+    """
+    return hashlib.sha256(n.to_bytes(max(1, (n.bit_length() + 7) // 8), "big")).digest()[:8]
+
+
+class ContainerHeader(NamedTuple):
+    block_size: int
+    fingerprint: bytes
+    exponent: int
+    block_count: int
+    chunk_blocks: int
+    version: int = VERSION
+    flags: int = 0
+
+    @property
+    def packed(self):
+        return bool(self.flags & FLAG_PACKED)
+
+    @property
+    def data_size(self):
+        return self.block_count * self.block_size
+
+    @property
+    def chunk_count(self):
+        return -(-self.block_count // self.chunk_blocks)
+
+    @property
+    def file_size(self):
+        return HEADER_SIZE + self.data_size + self.chunk_count * _CRC.size
+
+    def chunk_span(self, k):
+        """(byte offset, byte length) of chunk k within the file."""
+        first = k * self.chunk_blocks
+        count = min(self.chunk_blocks, self.block_count - first)
+        return HEADER_SIZE + first * self.block_size, count * self.block_size
+
+    def pack(self):
+        fields = _HEADER.pack(
+            MAGIC, VERSION, self.flags, self.block_size, self.fingerprint,
+            self.exponent, self.block_count, self.chunk_blocks,
+        )
+        return fields + _CRC.pack(zlib.crc32(fields))
+
+    def check_key(self, n=None, e=None):
+        """
+        Raise ValueError if the file was not written for modulus n (and exponent e).
+
+        Args:
+        n (int, optional): Modulus the caller is about to use.
+        e (int, optional): Public exponent the caller expects.
+        """
+        if n is not None:
+            block_size = (n.bit_length() + 7) // 8
+            if block_size != self.block_size or modulus_fingerprint(n) != self.fingerprint:
+                raise ValueError(f"Encrypted file was not written for modulus n={n}")
+        if e is not None and self.exponent and e != self.exponent:
+            raise ValueError(f"Encrypted file was written for exponent e={self.exponent}, not {e}")
+
+
+def parse_header(data):
+    """
+    Parse a container header.
+
+    Args:
+    data (bytes): The first HEADER_SIZE bytes of a file.
+
+    Returns:
+    ContainerHeader | None: None when data does not start with the magic (a legacy file).
+
+    Raises:
+    ValueError: For a damaged header or an unsupported version.
+    """
+    if len(data) < HEADER_SIZE or data[:4] != MAGIC:
+        return None
+    fields, (crc,) = data[: _HEADER.size], _CRC.unpack(data[_HEADER.size : HEADER_SIZE])
+    if zlib.crc32(fields) != crc:
+        raise ValueError("Encrypted file header is corrupted (checksum mismatch)")
+    _, version, first, second, fingerprint, exponent, block_count, chunk_blocks = _HEADER.unpack(fields)
+    if version == 1:
+        block_size, flags = first, second
+    elif version == VERSION:
+        flags, block_size = first, second
+    else:
+        raise ValueError(f"Unsupported .enc container version {version}")
+    return ContainerHeader(block_size, fingerprint, exponent, block_count, chunk_blocks, version, flags)
+
+
+def read_header(file_path):
+    """
+    Read the container header of a file.
+
+    Args:
+    file_path (str | Path): File to inspect.
+
+    Returns:
+    ContainerHeader | None: None for legacy headerless files.
+    """
+    with open(file_path, "rb") as f:
+        return parse_header(f.read(HEADER_SIZE))
+
+
+class ContainerWriter:
+    """
+    Writes a container incrementally; the block count and CRC table are
+    filled in on close(), so the number of blocks need not be known up front.
+    """
+
+    def __init__(self, file_path, n, e=None, chunk_blocks=DEFAULT_CHUNK_BLOCKS, flags=0):
+        self.block_size = (n.bit_length() + 7) // 8
+        # Checked before the file is created, the header is only written on close()
+        if self.block_size > MAX_BLOCK_SIZE:
+            raise ValueError(f"Modulus of {n.bit_length()} bits is too large for an .enc container")
+        if not 0 <= (e or 0) < 1 << 64:
+            raise ValueError(f"Public exponent e={e} does not fit an .enc container")
+        if not 0 < chunk_blocks < 1 << 32:
+            raise ValueError(f"Invalid number of blocks per chunk: {chunk_blocks}")
+        self.flags = flags
+        self.fingerprint = modulus_fingerprint(n)
+        self.exponent = e or 0
+        self.chunk_blocks = chunk_blocks
+        self.block_count = 0
+        self._chunk_bytes = chunk_blocks * self.block_size
+        self._crc = 0  # running CRC32 and size of the chunk being written
+        self._filled = 0
+        self._crcs = []
+        self.file_path = file_path
+        self._file = open(file_path, "wb")
+        self._file.write(bytes(HEADER_SIZE))  # placeholder until close()
+
+    def write(self, data):
+        """
+        Append raw fixed-width block bytes.
+
+        Args:
+        data (bytes): A whole number of blocks.
+        """
+        if len(data) % self.block_size:
+            raise ValueError("Data is not a whole number of blocks")
+        self._file.write(data)
+        self.block_count += len(data) // self.block_size
+
+        # CRCs are computed over fixed chunk boundaries, whatever the write sizes
+        view = memoryview(data)
+        while view:
+            take = min(len(view), self._chunk_bytes - self._filled)
+            self._crc = zlib.crc32(view[:take], self._crc)
+            self._filled += take
+            view = view[take:]
+            if self._filled == self._chunk_bytes:
+                self._crcs.append(self._crc)
+                self._crc, self._filled = 0, 0
+
+    def close(self):
+        if self._file.closed:
+            return
+        try:
+            if self._filled:
+                self._crcs.append(self._crc)
+                self._crc, self._filled = 0, 0
+            self._file.write(b"".join(_CRC.pack(crc) for crc in self._crcs))
+            header = ContainerHeader(
+                self.block_size, self.fingerprint, self.exponent, self.block_count, self.chunk_blocks,
+                flags=self.flags,
+            )
+            self._file.seek(0)
+            self._file.write(header.pack())
+            self._file.close()
+        except BaseException:
+            # Never leave a file behind without its real header
+            self.abort()
+            raise
+
+    def abort(self):
+        """
+        Discards a container that could not be written completely: the file
+        is closed and removed, so no truncated file with a valid header is left.
+        """
+        if not self._file.closed:
+            self._file.close()
+        try:
+            os.remove(self.file_path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class ContainerReader:
+    """
+    Reads a container, checking the header and key up front and each chunk's
+    CRC as it is read.
+    """
+
+    def __init__(self, file_path, n=None, e=None):
+        self._file = open(file_path, "rb")
+        try:
+            header = parse_header(self._file.read(HEADER_SIZE))
+            if header is None:
+                raise ValueError(f"{file_path} is not an .enc container")
+            header.check_key(n, e)
+            if os.fstat(self._file.fileno()).st_size != header.file_size:
+                raise ValueError(f"{file_path} is truncated or has trailing data")
+        except Exception:
+            self._file.close()
+            raise
+        self.header = header
+
+        # The CRC table is small (4 bytes per chunk), so load it once
+        self._file.seek(HEADER_SIZE + header.data_size)
+        self.crcs = read_crc_table(header, self._file.read(header.chunk_count * _CRC.size))
+
+    def verify(self, k, data):
+        """Raise ValueError if data does not match the stored CRC of chunk k."""
+        if zlib.crc32(data) != self.crcs[k]:
+            raise ValueError(f"Checksum mismatch in chunk {k} of encrypted file")
+
+    def read_chunk(self, k):
+        """Bytes of chunk k (a whole number of blocks), verified."""
+        offset, length = self.header.chunk_span(k)
+        self._file.seek(offset)
+        data = self._file.read(length)
+        self.verify(k, data)
+        return data
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        for k in range(self.header.chunk_count):
+            yield self.read_chunk(k)
+
+    def read_all(self):
+        """All block bytes in one preallocated buffer, verified chunk by chunk."""
+        data = bytearray(self.header.data_size)
+        view = memoryview(data)
+        self._file.seek(HEADER_SIZE)
+        for k in range(self.header.chunk_count):
+            _, length = self.header.chunk_span(k)
+            start = k * self.header.chunk_blocks * self.header.block_size
+            self._file.readinto(view[start : start + length])
+            self.verify(k, view[start : start + length])
+        return data
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_crc_table(header, data):
+    """
+    Unpack the per-chunk CRC32 trailer.
+
+    Args:
+    header (ContainerHeader): Header of the file.
+    data (bytes): The trailer bytes.
+
+    Returns:
+    list[int]: One CRC per chunk.
+    """
+    return [crc for (crc,) in _CRC.iter_unpack(data[: header.chunk_count * _CRC.size])]
+
+
+def verify_buffer(header, buffer):
+    """
+    Check every chunk CRC of a whole container held in memory (e.g. an mmap).
+
+    Args:
+    header (ContainerHeader): Header parsed from the buffer.
+    buffer (bytes-like): The complete file content.
+
+    Raises:
+    ValueError: On the first chunk whose CRC does not match.
+    """
+    view = memoryview(buffer)
+    try:
+        crcs = read_crc_table(header, view[HEADER_SIZE + header.data_size :])
+        for k, crc in enumerate(crcs):
+            offset, length = header.chunk_span(k)
+            if zlib.crc32(view[offset : offset + length]) != crc:
+                raise ValueError(f"Checksum mismatch in chunk {k} of encrypted file")
+    finally:
+        view.release()
+
+
+def open_reader(file_path, n=None, e=None) -> Optional[ContainerReader]:
+    """
+    ContainerReader for file_path, or None when it is a legacy headerless file.
+    """
+    if read_header(file_path) is None:
+        return None
+    return ContainerReader(file_path, n, e)
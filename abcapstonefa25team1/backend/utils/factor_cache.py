@@ -0,0 +1,157 @@
+# -----------------------------------------------------------
+# Project: PSU Abington Fall 2025 Capstone
+# Purpose Details: Persistent SQLite cache of verified modulus factorizations
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: October 17, 2026
+# Last Date Changed: October 17, 2026
+# Revision: 1.0 - Initial version
+# -----------------------------------------------------------
+import logging
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 10000
+
+
+def default_cache_dir():
+    """
+    Per-user cache directory: $SRED_CACHE_DIR if set, otherwise
+    %LOCALAPPDATA%/sred on Windows and $XDG_CACHE_HOME/sred (~/.cache/sred) elsewhere.
+
+    Returns:
+    Path: The directory (not created here).
+    """
+    override = os.environ.get("SRED_CACHE_DIR")
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "sred"
+
+
+class FactorCache:
+    """
+    Factorizations of RSA moduli, keyed by N, shared by every process of
+    the user through one SQLite database in WAL mode (readers never block
+    each other or a writer). Entries are verified (p * q == N) on the way in
+    and on the way out, and the least recently used ones are dropped once
+    more than max_entries are stored. Database errors are logged and treated
+    as cache misses, so a broken cache never stops a decryption.
+    """
+
+    def __init__(self, path=None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+        path (str | Path, optional): Database file. Defaults to factors.sqlite3 in default_cache_dir().
+        max_entries (int, optional): Most factorizations kept. Defaults to 10000.
+        """
+        self.logger = logging.getLogger("sred_cli.factor_cache.FactorCache")
+        self.path = Path(path) if path else default_cache_dir() / "factors.sqlite3"
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit; a writer waits up to 5 s for another writer's lock
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS factors ("
+                " n TEXT PRIMARY KEY, p TEXT NOT NULL, q TEXT NOT NULL,"
+                " method TEXT NOT NULL, created REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS factors_last_used ON factors (last_used)")
+            self._conn = conn
+        except (OSError, sqlite3.Error) as err:
+            self.logger.warning(f"Factor cache disabled, cannot open {self.path}: {err}")
+
+    def get(self, n: int) -> Optional[Tuple[int, int, str]]:
+        """
+        Look up the factorization of n.
+
+        Args:
+        n (int): Modulus.
+
+        Returns:
+        tuple[int, int, str] | None: (p, q, method) on a verified hit, otherwise None.
+        """
+        row = None
+        if self._conn is not None:
+            try:
+                # Integers are stored as text, SQLite integers stop at 64 bits
+                row = self._conn.execute(
+                    "SELECT p, q, method FROM factors WHERE n = ?", (str(n),)
+                ).fetchone()
+            except sqlite3.Error as err:
+                self.logger.warning(f"Factor cache lookup failed: {err}")
+
+        if row is not None:
+            p, q, method = int(row[0]), int(row[1]), row[2]
+            if 1 < p < n and p * q == n:
+                self.hits += 1
+                self._execute("UPDATE factors SET last_used = ? WHERE n = ?", (time.time(), str(n)))
+                self.logger.debug(f"Factor cache hit for N={n}: {p} * {q} ({method})")
+                return p, q, method
+            self.logger.warning(f"Dropping invalid factor cache entry for N={n}")
+            self._execute("DELETE FROM factors WHERE n = ?", (str(n),))
+
+        self.misses += 1
+        return None
+
+    def put(self, n: int, p: int, q: int, method: str) -> None:
+        """
+        Store a factorization of n after checking it.
+
+        Args:
+        n (int): Modulus.
+        p (int): First factor.
+        q (int): Second factor.
+        method (str): How the factors were found, e.g. "classical:rho".
+        """
+        if not (1 < p < n and p * q == n):
+            raise ValueError(f"{p} * {q} is not a non-trivial factorization of {n}")
+        now = time.time()
+        self._execute(
+            "INSERT OR REPLACE INTO factors (n, p, q, method, created, last_used)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (str(n), str(p), str(q), method, now, now),
+        )
+        # Keep the max_entries most recently used factorizations
+        self._execute(
+            "DELETE FROM factors WHERE n IN ("
+            " SELECT n FROM factors ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def __len__(self) -> int:
+        if self._conn is None:
+            return 0
+        return self._conn.execute("SELECT COUNT(*) FROM factors").fetchone()[0]
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _execute(self, sql, params):
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(sql, params)
+        except sqlite3.Error as err:
+            self.logger.warning(f"Factor cache update failed: {err}")
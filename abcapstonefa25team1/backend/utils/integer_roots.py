@@ -0,0 +1,97 @@
+# -----------------------------------------------------------
+# Project: PSU Abington Fall 2025 Capstone
+# Purpose Details: Exact integer k-th roots and perfect power detection
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: October 17, 2026
+# Last Date Changed: October 17, 2026
+# Revision: 1.0 - Initial version, replaces the float root and O(sqrt N) scans
+# -----------------------------------------------------------
+import math
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from abcapstonefa25team1.backend.utils.primality import is_prime, small_primes
+
+# Number of prime moduli m = 1 (mod k) used to filter k-th power candidates
+RESIDUE_FILTERS = 4
+
+
+def iroot(n, k):
+    """
+    Floor of the k-th root of n, computed exactly with Newton's method on ints.
+
+    Args:
+    n (int): Non-negative radicand.
+    k (int): Root degree, at least 1.
+
+    Returns:
+    int: The largest r with r**k <= n.
+    """
+    if n < 0 or k < 1:
+        raise ValueError("iroot needs n >= 0 and k >= 1")
+    if n < 2 or k == 1:
+        return n
+    if k == 2:
+        return math.isqrt(n)
+    if k >= n.bit_length():
+        return 1  # 2**k > n
+
+    # Start above the root; the iteration then decreases to the floor
+    x = 1 << -(-n.bit_length() // k)
+    while True:
+        y = ((k - 1) * x + n // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
+
+
+@lru_cache(maxsize=None)
+def _residue_moduli(k):
+    # Small primes m = 1 (mod k): only 1/k of the units mod m are k-th powers
+    moduli = []
+    m = k + 1
+    while len(moduli) < RESIDUE_FILTERS:
+        if is_prime(m):
+            moduli.append(m)
+        m += k
+    return tuple(moduli)
+
+
+def _may_be_kth_power(n, k):
+    # Euler's criterion: a unit r mod m is a k-th power iff r^((m-1)/k) = 1
+    for m in _residue_moduli(k):
+        r = n % m
+        if r and pow(r, (m - 1) // k, m) != 1:
+            return False
+    return True
+
+
+def perfect_power(n) -> Optional[Tuple[int, int]]:
+    """
+    Express n as b**k with k >= 2 and the smallest possible base b.
+
+    Only prime exponents are tried (b**6 is (b**3)**2), each is first run
+    through residue filters modulo small primes, and iroot() is only paid
+    for exponents that pass. A root found is itself decomposed further.
+
+    Args:
+    n (int): Number to test.
+
+    Returns:
+    tuple[int, int] | None: (b, k) with n == b**k, or None if n is not a perfect power.
+    """
+    if n < 4:
+        return None
+    # An odd n has an odd base of at least 3
+    max_k = n.bit_length() if n % 2 == 0 else int(n.bit_length() / math.log2(3)) + 1
+    for k in small_primes(max_k):
+        if not _may_be_kth_power(n, k):
+            continue
+        root = iroot(n, k)
+        if root > 1 and root**k == n:
+            inner = perfect_power(root)
+            if inner is None:
+                return (root, k)
+            return (inner[0], inner[1] * k)
+    return None
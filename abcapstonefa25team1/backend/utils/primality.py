@@ -0,0 +1,212 @@
+# -----------------------------------------------------------
+# Project: PSU Abington Fall 2025 Capstone
+# Purpose Details: Shared primality testing (small-prime sieve + Miller-Rabin)
+# Course: CMPSC 488
+# Author: Team 1
+# Date Developed: October 17, 2026
+# Last Date Changed: October 17, 2026
+# Revision: 1.0 - Initial version, replaces the per-class trial division checks
+#           1.1 - random_prime for large RSA keys (windowed sieve + Miller-Rabin)
+#           1.2 - order_from_multiple, shared by the classical and quantum order finders
+# -----------------------------------------------------------
+import random
+from typing import Callable, List, Optional
+
+
+def small_primes(limit):
+    """
+    All primes up to and including limit (sieve of Eratosthenes).
+
+    Args:
+    limit (int): Upper bound of the sieve.
+
+    Returns:
+    list[int]: The primes p <= limit in increasing order.
+    """
+    if limit < 2:
+        return []
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0] = sieve[1] = 0
+    for i in range(2, int(limit**0.5) + 1):
+        if sieve[i]:
+            sieve[i * i :: i] = bytes(len(range(i * i, limit + 1, i)))
+    return [i for i, flag in enumerate(sieve) if flag]
+
+
+def order_from_multiple(a, n, multiple):
+    """
+    Multiplicative order of a modulo n from a known multiple of it (a period
+    or Carmichael's lambda), by stripping prime factors while a^r = 1 holds.
+
+    Args:
+    a (int): Base, coprime to n.
+    n (int): Modulus.
+    multiple (int): An integer L > 0 with a^L = 1 (mod n).
+
+    Returns:
+    int: The order of a modulo n.
+    """
+    r = multiple
+    remaining = multiple
+    p = 2
+    while p * p <= remaining:
+        if remaining % p == 0:
+            while remaining % p == 0:
+                remaining //= p
+            while r % p == 0 and pow(a, r // p, n) == 1:
+                r //= p
+        p += 1
+    if remaining > 1 and pow(a, r // remaining, n) == 1:
+        r //= remaining
+    return r
+
+
+SMALL_PRIME_LIMIT = 1000
+SMALL_PRIMES: List[int] = small_primes(SMALL_PRIME_LIMIT)
+
+# Miller-Rabin with these bases is exact for every n < 3.3 * 10^24 (covers 64-bit)
+DETERMINISTIC_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Independent of the global random state, so seeded key generation is unaffected
+_witness_rng = random.SystemRandom()
+
+
+def is_prime(n, rounds=20):
+    """
+    Primality test: trial division by the small-prime sieve, then Miller-Rabin.
+
+    The answer is exact for n < 2^64. Above that, `rounds` random bases are
+    tried on top of the fixed ones, so a composite passes with probability
+    below 4^-rounds.
+
+    Args:
+    n (int): Number to test.
+    rounds (int, optional): Extra random Miller-Rabin rounds for n >= 2^64. Defaults to 20.
+
+    Returns:
+    bool: True if n is (almost certainly, above 2^64) prime.
+    """
+    if n < 2:
+        return False
+    for p in SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+    if n < SMALL_PRIME_LIMIT * SMALL_PRIME_LIMIT:
+        return True  # no prime factor below sqrt(n)
+
+    if not miller_rabin(n, DETERMINISTIC_BASES):
+        return False
+    if n < 2**64:
+        return True
+    bases = [_witness_rng.randrange(2, n - 1) for _ in range(rounds)]
+    return miller_rabin(n, bases)
+
+
+def miller_rabin(n, bases):
+    """
+    Miller-Rabin strong probable prime test of an odd n > 2 to the given bases.
+
+    Args:
+    n (int): Odd number to test.
+    bases (iterable[int]): Witnesses to try.
+
+    Returns:
+    bool: False if some base proves n composite, True otherwise.
+    """
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for a in bases:
+        a %= n
+        if a in (0, 1, n - 1):
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+# Odd primes used to sieve random prime candidates before any Miller-Rabin test
+SIEVE_PRIMES: List[int] = small_primes(1 << 16)[1:]
+SIEVE_WINDOW = 4096
+
+
+def keygen_rounds(bits):
+    """
+    Random-base Miller-Rabin rounds for a random (not adversarial) candidate of
+    the given size, following FIPS 186-4 Table C.3 (error below 2^-100).
+
+    Args:
+    bits (int): Bit length of the candidate.
+
+    Returns:
+    int: Number of rounds.
+    """
+    if bits >= 1536:
+        return 3
+    if bits >= 1024:
+        return 4
+    if bits >= 512:
+        return 7
+    return 20
+
+
+def random_prime(bits, rng=None, condition: Optional[Callable[[int], bool]] = None):
+    """
+    Random prime of exactly `bits` bits with the top two bits set, so the
+    product of two such primes has exactly the sum of their bit lengths.
+
+    A random odd start is drawn and the next SIEVE_WINDOW odd numbers are
+    sieved against SIEVE_PRIMES at once; only survivors get a base-2
+    Miller-Rabin test, and only a prime then pays for the random-base rounds.
+
+    The sieve leaves about 1 in 10 odd numbers, so a prime costs on average
+    about bits / 28 base-2 tests, each a full modular exponentiation: about
+    36 for 1024 bits and 72 for 2048 bits. The count is geometric, so single
+    searches can take several times the average.
+
+    Args:
+    bits (int): Bit length of the prime, at least 8.
+    rng (random.Random, optional): Source of randomness. Defaults to SystemRandom.
+    condition (callable, optional): Extra test a candidate must pass
+        (e.g. gcd(e, p - 1) == 1), applied before Miller-Rabin.
+
+    Returns:
+    int: The prime.
+    """
+    if bits < 8:
+        raise ValueError("random_prime needs at least 8 bits")
+    rng = rng or _witness_rng
+    # A sieve prime must never equal the candidate itself
+    sieve_primes = [p for p in SIEVE_PRIMES if p < 1 << (bits - 1)]
+    rounds = keygen_rounds(bits)
+
+    while True:
+        start = rng.getrandbits(bits) | (3 << (bits - 2)) | 1
+        # sieve[i] stands for start + 2 * i
+        sieve = bytearray([1]) * SIEVE_WINDOW
+        for p in sieve_primes:
+            # start + 2i = 0 (mod p)  <=>  i = -start * 2^-1 (mod p)
+            first = (-(start % p) * ((p + 1) // 2)) % p
+            sieve[first::p] = bytes(len(range(first, SIEVE_WINDOW, p)))
+
+        for i in (i for i, flag in enumerate(sieve) if flag):
+            candidate = start + 2 * i
+            if candidate.bit_length() != bits:
+                break  # ran past the top of the range; draw a new start
+            if condition is not None and not condition(candidate):
+                continue
+            if not miller_rabin(candidate, (2,)):
+                continue
+            bases = [rng.randrange(3, candidate - 1) for _ in range(rounds)]
+            if miller_rabin(candidate, bases):
+                return candidate
@@ -1,58 +1,261 @@
-# -----------------------------------------------------------
-# Project:
-# Purpose Details: Handles reading and writing text files
-# Course: CMPSC 488
-# Author: Kamila Anarkulova
-# Date Developed: October 21, 2025
-# Last Date Changed: October 21, 2025
-# Revision: 1.0 - Initial version, created file read/write functions
-# -----------------------------------------------------------
-
-
-def read_file(file_path):
-    # Read and return text content from file
-    try:
-        # Open file in read mode with UTF-8 encoding to handle all characters
-        with open(file_path, "r", encoding="utf-8") as file:
-            data = file.read()  # Read the entire content of the file
-        return data
-
-    except FileNotFoundError:
-        # File not found – print an error message
-        print(f"Error: file {file_path} not found")
-        return None
-
-    except Exception as e:
-        # Handle any other unexpected error
-        print(f"Error reading file: {e}")
-        return None
-
-
-def write_file(file_path, data):
-    # Write(save) text content to a file.
-    try:
-        # Open file in write mode with UTF-8 encoding
-        with open(file_path, "w", encoding="ascii") as file:
-            file.writelines(data)  # Write the provided data to the file
-
-    except Exception as e:
-        # Handle unexpected write errors
-        print(f"Error writing file:{e}")
-
-
-def write_encrypted_binary(file_path, cipher_blocks, n):
-    """Write encrypted integers to file as binary (fixed block size)."""
-    block_size = (n.bit_length() + 7) // 8
-    with open(file_path, "wb") as f:
-        for c in cipher_blocks:
-            f.write(c.to_bytes(block_size, "big"))
-
-
-def read_encrypted_binary(file_path, n):
-    """Read encrypted integers from binary file."""
-    block_size = (n.bit_length() + 7) // 8
-    cipher_blocks = []
-    with open(file_path, "rb") as f:
-        while chunk := f.read(block_size):
-            cipher_blocks.append(int.from_bytes(chunk, "big"))
-    return cipher_blocks
+# -----------------------------------------------------------
+# Project:
+# Purpose Details: Handles reading and writing text files
+# Course: CMPSC 488
+# Author: Kamila Anarkulova
+# Date Developed: October 21, 2025
+# Last Date Changed: October 21, 2025
+# Revision: 1.0 - Initial version, created file read/write functions
+# -----------------------------------------------------------
+
+import mmap
+import os
+
+from abcapstonefa25team1.backend.rsa.ciphertext import Ciphertext
+from abcapstonefa25team1.backend.utils.enc_container import (
+    FLAG_PACKED,
+    HEADER_SIZE,
+    ContainerWriter,
+    open_reader,
+    parse_header,
+    verify_buffer,
+)
+
+
+def read_file(file_path):
+    # Read and return text content from file
+    try:
+        # Open file in read mode with UTF-8 encoding to handle all characters
+        with open(file_path, "r", encoding="utf-8") as file:
+            data = file.read()  # Read the entire content of the file
+        return data
+
+    except FileNotFoundError:
+        # File not found – print an error message
+        print(f"Error: file {file_path} not found")
+        return None
+
+    except Exception as e:
+        # Handle any other unexpected error
+        print(f"Error reading file: {e}")
+        return None
+
+
+def write_file(file_path, data):
+    # Write(save) text content to a file.
+    try:
+        # Open file in write mode with UTF-8 encoding
+        with open(file_path, "w", encoding="ascii") as file:
+            file.writelines(data)  # Write the provided data to the file
+
+    except Exception as e:
+        # Handle unexpected write errors
+        print(f"Error writing file:{e}")
+
+
+def _blocks_to_bytes(cipher_blocks, block_size):
+    # Fixed-width big-endian bytes of a list of ints or a Ciphertext
+    if isinstance(cipher_blocks, Ciphertext):
+        return cipher_blocks.tobytes()
+    if block_size == 1:
+        return bytes(cipher_blocks)
+    return b"".join(c.to_bytes(block_size, "big") for c in cipher_blocks)
+
+
+def _bytes_to_blocks(data, block_size):
+    # Inverse of _blocks_to_bytes, as a list of ints
+    if block_size == 1:
+        return list(data)
+    return [
+        int.from_bytes(data[i : i + block_size], "big")
+        for i in range(0, len(data), block_size)
+    ]
+
+
+def write_encrypted_binary(file_path, cipher_blocks, n, e=None, legacy=False, packed=False):
+    """
+    Write encrypted integers (list or Ciphertext) to file as binary (fixed block size).
+    The file is an .enc container with a header and chunk checksums unless legacy=True,
+    which writes the bare headerless blocks. e, when given, is recorded in the header,
+    and packed=True marks blocks from RSA.encrypt_bytes.
+    """
+    block_size = (n.bit_length() + 7) // 8
+    if legacy:
+        with open(file_path, "wb") as f:
+            if isinstance(cipher_blocks, Ciphertext):
+                # Already in file layout, one write of the whole buffer
+                f.write(cipher_blocks.tobytes())
+                return
+            for c in cipher_blocks:
+                f.write(c.to_bytes(block_size, "big"))
+        return
+    with ContainerWriter(file_path, n, e, flags=FLAG_PACKED if packed else 0) as writer:
+        writer.write(_blocks_to_bytes(cipher_blocks, block_size))
+
+
+def read_encrypted_binary(file_path, n, compact=False, e=None):
+    """
+    Read encrypted integers from binary file (as a Ciphertext when compact=True).
+    Containers are checked against n (and e) before any block is read;
+    legacy headerless files are read as before.
+    """
+    block_size = (n.bit_length() + 7) // 8
+    reader = open_reader(file_path, n, e)
+    if reader is not None:
+        with reader:
+            data = reader.read_all()
+        return Ciphertext.frombuffer(data, n) if compact else _bytes_to_blocks(data, block_size)
+
+    if compact:
+        with open(file_path, "rb") as f:
+            return Ciphertext.frombuffer(f.read(), n)
+    cipher_blocks = []
+    with open(file_path, "rb") as f:
+        while chunk := f.read(block_size):
+            cipher_blocks.append(int.from_bytes(chunk, "big"))
+    return cipher_blocks
+
+
+def read_file_chunks(file_path, chunk_size=65536):
+    """Yield the text content of a file in chunks of at most chunk_size characters."""
+    with open(file_path, "r", encoding="utf-8") as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def write_file_chunks(file_path, chunks):
+    """Write text chunks to a file as they are produced."""
+    with open(file_path, "w", encoding="ascii") as file:
+        for chunk in chunks:
+            file.write(chunk)
+
+
+def read_binary_chunks(file_path, chunk_size=65536):
+    """Yield the raw bytes of a file in chunks of at most chunk_size bytes."""
+    with open(file_path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def write_binary_chunks(file_path, chunks):
+    """Write byte chunks to a file as they are produced."""
+    with open(file_path, "wb") as file:
+        for chunk in chunks:
+            file.write(chunk)
+
+
+def write_encrypted_stream(file_path, block_chunks, n, e=None, legacy=False, packed=False):
+    """Write chunks (lists) of encrypted integers to file, same layout as write_encrypted_binary."""
+    block_size = (n.bit_length() + 7) // 8
+    if legacy:
+        try:
+            with open(file_path, "wb") as f:
+                for blocks in block_chunks:
+                    f.write(_blocks_to_bytes(blocks, block_size))
+        except BaseException:
+            # A partial headerless file cannot be told apart from a complete one
+            os.remove(file_path)
+            raise
+        return
+    with ContainerWriter(file_path, n, e, flags=FLAG_PACKED if packed else 0) as writer:
+        for blocks in block_chunks:
+            writer.write(_blocks_to_bytes(blocks, block_size))
+
+
+def read_encrypted_stream(file_path, n, chunk_blocks=65536, e=None):
+    """
+    Yield lists of up to chunk_blocks encrypted integers from a binary file.
+    Container chunks are checksummed as a whole before any of their blocks is yielded.
+    """
+    block_size = (n.bit_length() + 7) // 8
+    step = block_size * chunk_blocks
+    reader = open_reader(file_path, n, e)
+    if reader is not None:
+        with reader:
+            for data in reader.iter_chunks():
+                for i in range(0, len(data), step):
+                    yield _bytes_to_blocks(data[i : i + step], block_size)
+        return
+
+    with open(file_path, "rb") as f:
+        while data := f.read(step):
+            yield _bytes_to_blocks(data, block_size)
+
+
+def read_encrypted_preview(file_path, n, max_bytes=4096):
+    """Read only the first whole blocks (at most max_bytes) of an encrypted file as a Ciphertext."""
+    block_size = Ciphertext.block_size_for(n)
+    limit = max(block_size, max_bytes - max_bytes % block_size)
+    with open(file_path, "rb") as f:
+        header = parse_header(f.read(HEADER_SIZE))
+        if header is None:
+            f.seek(0)
+        else:
+            # A wrong key is reported here, before any decryption is attempted
+            header.check_key(n)
+            limit = min(limit, header.data_size)
+        data = f.read(limit)
+    return Ciphertext.frombuffer(data[: len(data) - len(data) % block_size], n)
+
+
+class EncryptedFileMap:
+    """
+    Memory-mapped encrypted file exposed as a Ciphertext view of its blocks.
+
+    Blocks are read from the page cache on access, so block i, slices and
+    RSA.decrypt all work on the file without reading it into a list first.
+    Use as a context manager (or call close()) to release the mapping.
+    Containers are checked against n (and e) when opened and, with
+    verify=True, every chunk checksum is checked in one pass over the map.
+    """
+
+    def __init__(self, file_path, n, e=None, verify=True):
+        self._file = open(file_path, "rb")
+        self._mmap = self._view = None
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if not size:
+                # mmap cannot map an empty file
+                self.ciphertext = Ciphertext.frombuffer(b"", n)
+                return
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            header = parse_header(self._mmap[:HEADER_SIZE])
+            if header is None:
+                self._view = memoryview(self._mmap)
+            else:
+                header.check_key(n, e)
+                if size != header.file_size:
+                    raise ValueError(f"{file_path} is truncated or has trailing data")
+                if verify:
+                    verify_buffer(header, self._mmap)
+                self._view = memoryview(self._mmap)[HEADER_SIZE : HEADER_SIZE + header.data_size]
+            self.ciphertext = Ciphertext.frombuffer(self._view, n)
+        except Exception:
+            self.close()
+            raise
+
+    def __len__(self):
+        return len(self.ciphertext)
+
+    def __getitem__(self, index):
+        return self.ciphertext[index]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Release the mapping; views taken from it must not be used afterwards."""
+        self.ciphertext = None
+        view, mapping = self._view, self._mmap
+        self._view = self._mmap = None
+        try:
+            if view is not None:
+                view.release()
+            if mapping is not None:
+                mapping.close()
+        except BufferError:
+            pass  # a slice still references the buffer; it is released with it
+        self._file.close()
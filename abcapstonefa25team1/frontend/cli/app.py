@@ -9,14 +9,230 @@
 
 import logging
 import argparse
-from abcapstonefa25team1.backend.rsa import RSA_encrypt
+import glob
+import os
+import sys
+import time
+from pathlib import Path
+from abcapstonefa25team1.backend.rsa import RSA_encrypt, packing
+from abcapstonefa25team1.backend.rsa.batch_decrypt import decrypt_files
+from abcapstonefa25team1.backend.utils.enc_container import read_header
+from abcapstonefa25team1.backend.utils.factor_cache import FactorCache
 from abcapstonefa25team1.backend.utils.read_write import (
     read_encrypted_binary,
+    read_encrypted_stream,
+    read_binary_chunks,
     read_file,
+    read_file_chunks,
+    write_binary_chunks,
     write_encrypted_binary,
+    write_encrypted_stream,
     write_file,
+    write_file_chunks,
 )
 from abcapstonefa25team1.backend.quantum import classical_shors, quantum_shors
+from abcapstonefa25team1.backend.quantum.batch_gcd import BatchGCD
+
+
+def key_bits(value):
+    """argparse type of --bits: generated moduli have at least 32 bits."""
+    bits = int(value)
+    if bits < 32:
+        raise argparse.ArgumentTypeError(f"must be at least 32, got {bits}")
+    return bits
+
+
+def factor_modulus(N, args, logger):
+    """
+    Factor N with the Shor implementation chosen on the command line,
+    checking the persistent factor cache first unless --no-cache is given.
+    Returns (p, q), or None after printing why factoring failed.
+    """
+    cache = None if args.no_cache else FactorCache()
+    try:
+        if cache is not None:
+            cached = cache.get(N)
+            if cached:
+                p, q, method = cached
+                logger.info(f"Factor cache hit: p={p}, q={q} (found by {method})")
+                return p, q
+
+        # Factor N using chosen Shor’s implementation
+        if args.classical:
+            shors = classical_shors.Classical_Shors()
+            factors = shors.shors_classical(N)
+            if not factors:
+                print("Classical Shor’s failed to factor N.")
+                return None
+            p, q = factors
+            method = f"classical:{shors.last_tier}"
+            logger.info(f"Classical Shor’s found p={p}, q={q} (tier: {shors.last_tier})")
+            logger.debug(f"Seconds per factoring tier: {shors.tier_timings}")
+        else:
+            mode = "semiclassical" if args.semiclassical else "full"
+            shors = quantum_shors.Quantum_Shors(mode=mode, backend=args.backend)
+            try:
+                factors = shors.run_shors_algorithm(
+                    N, 15, parallel=args.workers > 1, workers=args.workers
+                )
+            except ValueError as err:
+                print(f"Error: {err}")
+                return None
+            if not factors:
+                print("Quantum Shor's failed to factor N.")
+                return None
+            p, q = factors
+            # Circuits too wide for Aer are simulated with the numpy backend
+            method = f"quantum:{shors.simulation_backend(N, warn=False) or args.backend}:{mode}"
+            logger.info(f"Quantum Shor’s found p={p}, q={q}")
+
+        if cache is not None and 1 < min(p, q) and p * q == N:
+            cache.put(N, p, q, method)
+        return p, q
+    finally:
+        if cache is not None:
+            cache.close()
+
+
+def batch_output_path(input_path, output_dir):
+    """<name>.dec next to the input (or in output_dir), with the .enc suffix dropped."""
+    path = Path(input_path)
+    name = path.stem if path.suffix == ".enc" else path.name
+    return str(Path(output_dir or path.parent) / f"{name}.dec")
+
+
+def batch_decrypt(args, rsa, logger):
+    """
+    Factor N once, derive the CRT private key once and decrypt every input
+    file on a worker pool, then report the aggregate throughput.
+    """
+    N = args.modulus
+    if N < 123:
+        print("Error: Modulus must be greater than 122")
+        return
+    e = args.exponent
+
+    # Expand patterns here as well, for shells that do not (and quoted globs)
+    inputs = []
+    for pattern in args.INPUTS:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        inputs.extend(m for m in matches if m not in inputs)
+    if not inputs:
+        print("Error: No input files matched.")
+        return
+
+    # Files that cannot be decrypted under (e, N) are skipped before factoring
+    jobs = []
+    for path in inputs:
+        try:
+            if not os.path.isfile(path):
+                raise ValueError("not a file")
+            header = read_header(path)
+            if header is not None:
+                header.check_key(N, e)
+        except ValueError as err:
+            print(f"Skipping {path}: {err}")
+            continue
+        jobs.append((path, batch_output_path(path, args.output_dir)))
+    if not jobs:
+        return
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    factors = factor_modulus(N, args, logger)
+    if not factors:
+        return
+    p, q = factors
+    try:
+        priv = rsa.derive_private_key_from_factors(p, q, e, crt=True)
+    except ValueError as err:
+        print(f"Error: {err}")
+        return
+    if priv is None:
+        logger.error("Error: Failed to derive private key.")
+        return
+    factor_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    done = failed = bytes_in = bytes_out = 0
+    for result in decrypt_files(jobs, priv, e, workers=args.jobs):
+        if result.error:
+            failed += 1
+            print(f"Failed {result.input_path}: {result.error}")
+            continue
+        done += 1
+        bytes_in += result.bytes_in
+        bytes_out += result.bytes_out
+        logger.info(f"Decrypted {result.input_path} -> {result.output_path} in {result.seconds:.3f}s")
+    seconds = time.perf_counter() - start
+
+    print(f"Factored n={N} once in {factor_seconds:.3f}s (p={p}, q={q})")
+    print(
+        f"Decrypted {done} of {len(jobs)} files ({bytes_in} bytes in, {bytes_out} bytes out) "
+        f"in {seconds:.3f}s: {bytes_in / seconds / 1e6 if seconds else 0:.2f} MB/s, "
+        f"{done / seconds if seconds else 0:.1f} files/s"
+    )
+    if failed:
+        print(f"{failed} file(s) failed")
+
+
+def batch_factor(args, logger):
+    """
+    Factor every modulus given: shared primes are found for all of them at
+    once by batch GCD, the rest go through factor_modulus. Prints the
+    factors and the time and speedup of each stage.
+    """
+    moduli = list(args.MODULI)
+    if args.file:
+        try:
+            with open(args.file, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.split("#", 1)[0].strip()
+                    if line:
+                        moduli.append(int(line))
+        except (OSError, ValueError) as err:
+            print(f"Error: Failed to read moduli from {args.file}: {err}")
+            return
+    moduli = [n for n in dict.fromkeys(moduli) if n > 3]
+    if not moduli:
+        print("Error: No moduli to factor.")
+        return
+
+    batch = BatchGCD(fallback=lambda N: factor_modulus(N, args, logger))
+    results = batch.factor(moduli)
+
+    # Shared primes found by batch GCD are as good as any Shor result for later decrypts
+    if not args.no_cache:
+        with FactorCache() as cache:
+            for N, result in results.items():
+                if result is not None and result[2] == "batch-gcd":
+                    cache.put(N, result[0], result[1], "batch-gcd")
+
+    for N in moduli:
+        result = results[N]
+        if result is None:
+            print(f"{N}: not factored")
+        else:
+            print(f"{N} = {result[0]} * {result[1]} ({result[2]})")
+
+    gcd_stats, shor_stats = batch.stats["batch-gcd"], batch.stats["shor"]
+    total = gcd_stats["seconds"] + shor_stats["seconds"]
+    print()
+    print(f"{'Stage':<12}{'Moduli':>8}{'Factored':>10}{'Seconds':>12}")
+    for stage in BatchGCD.STAGES:
+        stats = batch.stats[stage]
+        print(f"{stage:<12}{stats['moduli']:>8}{stats['factored']:>10}{stats['seconds']:>12.6f}")
+    if gcd_stats["seconds"] > 0:
+        print(
+            f"Batch GCD vs all-pairs gcd (est. {gcd_stats['pairwise_estimate']:.6f}s): "
+            f"{gcd_stats['pairwise_estimate'] / gcd_stats['seconds']:.1f}x"
+        )
+    if shor_stats["moduli"] and total > 0:
+        print(
+            f"Whole batch vs Shor on every modulus (est. {shor_stats['all_moduli_estimate']:.6f}s): "
+            f"{shor_stats['all_moduli_estimate'] / total:.1f}x"
+        )
 
 
 def main():
@@ -57,24 +273,59 @@ def main():
         default=[7, 123],
         help="Public key: e n (must be greater than 122)",
     )
-
-    # Decrypt subcommand
-    decrypt_parser = sub_parser.add_parser("decrypt", help="Decrypt a file")
-    decrypt_parser.add_argument("INPUT", type=str, help="File to decrypt")
-    decrypt_parser.add_argument(
-        "--output", "-o", required=False, type=str, help="Output file name"
+    encrypt_parser.add_argument(
+        "--bits",
+        type=key_bits,
+        default=None,
+        help="Generate a new keypair with a modulus of this many bits instead of using --keys",
     )
-    decrypt_parser.add_argument(
+    encrypt_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Process the file in fixed-size chunks with constant memory",
+    )
+
+    # Options shared by the subcommands that factor n
+    factoring_parser = argparse.ArgumentParser(add_help=False)
+    factoring_parser.add_argument(
         "--classical", "-c", action="store_true", help="Use classical Shor’s algorithm"
     )
-    decrypt_parser.add_argument(
+    factoring_parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help="Worker processes for parallel quantum Shor's attempts",
+    )
+    factoring_parser.add_argument(
+        "--semiclassical",
+        "-s",
+        action="store_true",
+        help="Use one recycled control qubit for quantum period finding",
+    )
+    factoring_parser.add_argument(
+        "--backend",
+        "-b",
+        choices=quantum_shors.Quantum_Shors.BACKENDS,
+        default="aer",
+        help="Simulator for quantum period finding: qiskit Aer or a NumPy permutation simulator",
+    )
+    factoring_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always factor n, neither reading nor updating the factor cache",
+    )
+
+    # Public key options of the decrypting subcommands
+    key_parser = argparse.ArgumentParser(add_help=False)
+    key_parser.add_argument(
         "--exponent",
         "-e",
         type=int,
         default=7,
         help="Public exponent e",
     )
-    decrypt_parser.add_argument(
+    key_parser.add_argument(
         "--modulus",
         "-m",
         type=int,
@@ -82,6 +333,59 @@ def main():
         help="Public modulus n, must be greater than 122",
     )
 
+    # Decrypt subcommand
+    decrypt_parser = sub_parser.add_parser(
+        "decrypt", help="Decrypt a file", parents=[key_parser, factoring_parser]
+    )
+    decrypt_parser.add_argument("INPUT", type=str, help="File to decrypt")
+    decrypt_parser.add_argument(
+        "--output", "-o", required=False, type=str, help="Output file name"
+    )
+    decrypt_parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Process the file in fixed-size chunks with constant memory",
+    )
+
+    # Batch decrypt subcommand
+    batch_parser = sub_parser.add_parser(
+        "batch-decrypt",
+        help="Factor n once and decrypt many files under the same key",
+        parents=[key_parser, factoring_parser],
+    )
+    batch_parser.add_argument(
+        "INPUTS", nargs="+", type=str, help="Files or glob patterns to decrypt (e.g. 'data/*.enc')"
+    )
+    batch_parser.add_argument(
+        "--output-dir",
+        "-O",
+        type=str,
+        default=None,
+        help="Directory for the decrypted files (defaults to each input's directory)",
+    )
+    batch_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Worker processes decrypting files (defaults to the CPU count)",
+    )
+
+    # Batch factor subcommand
+    factor_parser = sub_parser.add_parser(
+        "batch-factor",
+        help="Factor many moduli, finding shared primes with batch GCD first",
+        parents=[factoring_parser],
+    )
+    factor_parser.add_argument("MODULI", nargs="*", type=int, help="Public moduli to factor")
+    factor_parser.add_argument(
+        "--file",
+        "-f",
+        type=str,
+        default=None,
+        help="Text file with one modulus per line (blank lines and # comments ignored)",
+    )
+
     args = parser.parse_args()
     logger = logging.getLogger("sred_cli")
     logger.setLevel(args.loglevel)
@@ -97,26 +401,62 @@ def main():
 
     # ---- Encrypt ----
     if args.command == "encrypt":
-        if args.keys:
+        if args.keys and args.bits is None:
             e, n = args.keys
             if n < 123:
                 print("Error: Modulus must be greater than 122")
                 return
             logger.info(f"Encrypting using public key (e={e}, n={n})")
         else:
-            public_key, private_key, _ = rsa.generate_keys()
+            # A one-shot process would only ever miss a KeyPool, so generate directly
+            try:
+                public_key, private_key, _ = rsa.generate_keys(bits=args.bits)
+            except ValueError as err:
+                print(f"Error: {err}")
+                return
             e, n = public_key
             logger.info(f"Generated public key: {public_key}")
             logger.info(f"Generated private key: {private_key}")
 
-        plaintext = read_file(args.INPUT)
-        if plaintext is None:
-            print("Error: Failed to read input file.")
+        # From n >= 256 on, the raw file bytes are packed several per block
+        packed = n >= 256
+        if packed:
+            logger.info(f"Packing {packing.bytes_per_block(n)} bytes per block")
+
+        if args.stream or packed:
+            if not os.path.isfile(args.INPUT):
+                print("Error: Failed to read input file.")
+                return
+
+        if args.stream:
+            if packed:
+                ciphertext_chunks = rsa.encrypt_bytes_stream(read_binary_chunks(args.INPUT), (e, n))
+            else:
+                ciphertext_chunks = rsa.encrypt_stream(read_file_chunks(args.INPUT), (e, n))
+            if args.output:
+                try:
+                    write_encrypted_stream(args.output, ciphertext_chunks, n, e, packed=packed)
+                except ValueError as err:
+                    # The partial output file has already been removed
+                    print(f"Error: {err}")
+                    return
+                print(f"Encrypted output saved to {args.output}")
+            else:
+                for blocks in ciphertext_chunks:
+                    print(blocks)
             return
 
-        ciphertext = rsa.encrypt(plaintext, (e, n))
+        if packed:
+            ciphertext = rsa.encrypt_bytes(b"".join(read_binary_chunks(args.INPUT)), (e, n))
+        else:
+            plaintext = read_file(args.INPUT)
+            if plaintext is None:
+                print("Error: Failed to read input file.")
+                return
+            ciphertext = rsa.encrypt(plaintext, (e, n))
+
         if args.output:
-            write_encrypted_binary(args.output, ciphertext, n)
+            write_encrypted_binary(args.output, ciphertext, n, e, packed=packed)
             print(f"Encrypted output saved to {args.output}")
         else:
             print(ciphertext)
@@ -130,43 +470,96 @@ def main():
 
         e = args.exponent
 
-        # Factor N using chosen Shor’s implementation
-        if args.classical:
-            shors = classical_shors.Classical_Shors()
-            factors = shors.shors_classical(N)
-            if not factors:
-                print("Classical Shor’s failed to factor N.")
+        # A container records its key, so a mismatch is reported before factoring
+        header = None
+        if os.path.isfile(args.INPUT):
+            try:
+                header = read_header(args.INPUT)
+                if header is not None:
+                    header.check_key(N, e)
+            except ValueError as err:
+                print(f"Error: {err}")
                 return
-            p, q = factors
-            logger.info(f"Classical Shor’s found p={p}, q={q}")
-        else:
-            shors = quantum_shors.Quantum_Shors()
-            factors = shors.run_shors_algorithm(N, 15)
-            if not factors:
-                print("Quantum Shor's failed to factor N.")
-                return
-            p, q = factors
-            logger.info(f"Quantum Shor’s found p={p}, q={q}")
 
-        # Derive private key from Shor's factors
-        priv = rsa.derive_private_key_from_factors(p, q, e)
+        factors = factor_modulus(N, args, logger)
+        if not factors:
+            return
+        p, q = factors
+
+        # Derive private key from Shor's factors, keeping p and q for CRT decryption
+        try:
+            priv = rsa.derive_private_key_from_factors(p, q, e, crt=True)
+        except ValueError as err:
+            print(f"Error: {err}")
+            return
         if priv is None:
             logger.error("Error: Failed to derive private key.")
             return
-        d, n = priv[1], priv[0]
+        n = priv.n
+        packed = header is not None and header.packed
+
+        if args.stream:
+            if not os.path.isfile(args.INPUT):
+                print("Error: Failed to read input file.")
+                return
+            block_chunks = read_encrypted_stream(args.INPUT, n, e=e)
+            if packed:
+                plaintext_chunks = rsa.decrypt_bytes_stream(block_chunks, priv)
+            else:
+                plaintext_chunks = rsa.decrypt_stream(block_chunks, priv)
+            if args.output:
+                if packed:
+                    write_binary_chunks(args.output, plaintext_chunks)
+                else:
+                    write_file_chunks(args.output, plaintext_chunks)
+                print(f"Decrypted output saved to {args.output}")
+            elif packed:
+                for chunk in plaintext_chunks:
+                    sys.stdout.buffer.write(chunk)
+                sys.stdout.flush()
+            else:
+                for chunk in plaintext_chunks:
+                    print(chunk, end="")
+                print()
+            return
 
-        encrypted_blocks = read_encrypted_binary(args.INPUT, n)
+        try:
+            encrypted_blocks = read_encrypted_binary(args.INPUT, n, e=e)
+        except ValueError as err:
+            print(f"Error: {err}")
+            return
         if encrypted_blocks is None:
             print("Error: Failed to read input file.")
             return
 
-        plaintext = rsa.decrypt(encrypted_blocks, (d, n))
+        if packed:
+            try:
+                data = rsa.decrypt_bytes(encrypted_blocks, priv)
+            except ValueError as err:
+                print(f"Error: {err}")
+                return
+            if args.output:
+                write_binary_chunks(args.output, [data])
+                print(f"Decrypted output saved to {args.output}")
+            else:
+                print(data.decode("utf-8", errors="replace"))
+            return
+
+        plaintext = rsa.decrypt(encrypted_blocks, priv)
         if args.output:
             write_file(args.output, plaintext)
             print(f"Decrypted output saved to {args.output}")
         else:
             print(plaintext)
 
+    # ---- Batch decrypt ----
+    elif args.command == "batch-decrypt":
+        batch_decrypt(args, rsa, logger)
+
+    # ---- Batch factor ----
+    elif args.command == "batch-factor":
+        batch_factor(args, logger)
+
 
 if __name__ == "__main__":
     main()
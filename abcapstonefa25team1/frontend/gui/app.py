@@ -6,7 +6,6 @@ from pathlib import Path
 import base64
 import binascii
 import threading
-import io
 import sys
 
 # Allow running this file directly (without -m)
@@ -16,8 +15,11 @@ if str(repoRoot) not in sys.path:
 
 # Backend imports (backend uses snake_case)
 from abcapstonefa25team1.backend.rsa.RSA_encrypt import RSA
+from abcapstonefa25team1.backend.rsa.ciphertext import Ciphertext
+from abcapstonefa25team1.backend.rsa.key_pool import default_pool
 from abcapstonefa25team1.backend.utils.read_write import (
-    read_file, write_file, write_encrypted_binary, read_encrypted_binary
+    read_file, write_file, write_encrypted_binary, read_encrypted_binary,
+    read_encrypted_preview, EncryptedFileMap
 )
 
 # CamelCase wrappers so all new code stays camelCase
@@ -27,11 +29,17 @@ def readFile(path: str) -> str:
 def writeFile(path: str, text: str) -> None:
     return write_file(path, text)
 
-def writeEncryptedBinary(path: Path, blocks, n: int) -> None:
-    return write_encrypted_binary(path, blocks, n)
+def writeEncryptedBinary(path: Path, blocks, n: int, e: int = None) -> None:
+    return write_encrypted_binary(path, blocks, n, e)
 
-def readEncryptedBinary(path: str, n: int):
-    return read_encrypted_binary(path, n)
+def readEncryptedBinary(path: str, n: int, compact: bool = False):
+    return read_encrypted_binary(path, n, compact=compact)
+
+def readEncryptedPreview(path: str, n: int, maxBytes: int = 4096):
+    return read_encrypted_preview(path, n, max_bytes=maxBytes)
+
+def mapEncryptedBinary(path: str, n: int) -> EncryptedFileMap:
+    return EncryptedFileMap(path, n)
 
 
 class App(tk.Tk):
@@ -46,6 +54,10 @@ class App(tk.Tk):
         self.publicKey = None    # (e, n)
         self.privateKey = None   # (d, n)
 
+        # Keypairs are generated in the background, so Generate Keys is instant
+        self.keyPool = default_pool()
+        self.keyPool.warm()
+
         # Root Grid Configuration
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=1)
@@ -211,20 +223,20 @@ class App(tk.Tk):
                     return
 
                 _, n = key
-                blocks = readEncryptedBinary(path, n)
+                # Only the first few KB are read for the preview
+                ciphertext = readEncryptedPreview(path, n)
+                previewBytes = len(ciphertext) * ciphertext.block_size
+                fileBytes = Path(path).stat().st_size
 
                 # Base64 preview of raw cipher bytes → show in Input
-                blockSize = (n.bit_length() + 7) // 8
-                buf = io.BytesIO()
-                for c in blocks:
-                    buf.write(int(c).to_bytes(blockSize, "big"))
-                b64 = base64.b64encode(buf.getvalue()).decode("ascii")
+                b64 = base64.b64encode(ciphertext.tobytes()).decode("ascii")
 
                 self.inputText.delete("1.0", "end")
                 self.inputText.insert("1.0", b64)
                 self.writeOutput(
                     "Selected encrypted file (.enc).\n"
-                    "A base64 preview of the raw cipher bytes is shown in Input.\n"
+                    f"A base64 preview of the first {previewBytes} of {fileBytes} "
+                    "raw cipher bytes is shown in Input.\n"
                     "Click Decrypt to recover plaintext."
                 )
                 self.updateActionStates()
@@ -250,7 +262,7 @@ class App(tk.Tk):
 
     def handleGenerateKeys(self):
         try:
-            pub, priv, (p, q) = self.rsa.generate_keys()
+            pub, priv, (p, q) = self.keyPool.get()
             self.publicKey, self.privateKey = pub, priv
             e, n = pub
             d, _ = priv
@@ -279,22 +291,21 @@ class App(tk.Tk):
         def work():
             try:
                 src = self.getInputText()
-                blocks = self.rsa.encrypt(src, self.publicKey)  # list[int]
+                # Large pow() workloads are split across a process pool; table keys stay serial
+                blocks = self.rsa.encrypt_parallel(src, self.publicKey)  # list[int]
+
+                # One fixed-width array serves both the file and the preview
+                e, n = self.publicKey
+                ciphertext = Ciphertext(blocks, n)
 
                 # Save to .enc next to selected file (if any)
                 selected = self.filePathVar.get()
                 if selected:
                     outFile = Path(selected).with_suffix(".enc")
-                    _, n = self.publicKey
-                    writeEncryptedBinary(outFile, blocks, n)
+                    writeEncryptedBinary(outFile, ciphertext, n, e)
 
                 # Base64 preview for Output
-                e, n = self.publicKey
-                blockSize = (n.bit_length() + 7) // 8
-                buf = io.BytesIO()
-                for c in blocks:
-                    buf.write(int(c).to_bytes(blockSize, "big"))
-                b64 = base64.b64encode(buf.getvalue()).decode("ascii")
+                b64 = base64.b64encode(ciphertext.tobytes()).decode("ascii")
 
                 self.writeOutput("[Encrypted base64 preview]\n\n" + b64)
             except Exception as e:
@@ -317,20 +328,17 @@ class App(tk.Tk):
 
                 selected = self.filePathVar.get()
                 if selected and selected.endswith(".enc"):
-                    blocks = readEncryptedBinary(selected, n)
+                    # Decrypt straight from the memory-mapped file
+                    with mapEncryptedBinary(selected, n) as mapped:
+                        pt = self.rsa.decrypt_parallel(mapped.ciphertext, self.privateKey)  # str
                 else:
                     if not textArea:
                         raise ValueError("No ciphertext provided.")
                     raw = base64.b64decode("".join(textArea.split()).encode("ascii"))
-                    blockSize = (n.bit_length() + 7) // 8
-                    if len(raw) % blockSize != 0:
-                        raise ValueError("Cipher length is not a multiple of block size.")
-                    blocks = [
-                        int.from_bytes(raw[i:i + blockSize], "big")
-                        for i in range(0, len(raw), blockSize)
-                    ]
-
-                pt = self.rsa.decrypt(blocks, self.privateKey)  # str
+                    # Raises if the length is not a multiple of the block size
+                    blocks = Ciphertext.frombuffer(raw, n)
+                    pt = self.rsa.decrypt_parallel(blocks, self.privateKey)  # str
+
                 self.writeOutput(pt)
             except Exception as e:
                 self.writeOutput(f"[Decrypt error]\n{e}")
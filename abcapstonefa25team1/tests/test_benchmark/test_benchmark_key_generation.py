@@ -0,0 +1,22 @@
+import statistics
+import time
+
+from abcapstonefa25team1.backend.rsa.RSA_encrypt import RSA
+
+
+def _median_seconds(rsa, bits, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        (e, n), _, _ = rsa.generate_keys(bits=bits)
+        timings.append(time.perf_counter() - start)
+        assert n.bit_length() == bits
+    return statistics.median(timings)
+
+
+def test_key_generation_envelope():
+    """Documented envelope: ~0.05 s for 1024-bit and ~0.3 s for 2048-bit keys.
+    4096-bit keys take seconds and are not timed here."""
+    rsa = RSA()
+    assert _median_seconds(rsa, 1024, runs=5) < 0.5
+    assert _median_seconds(rsa, 2048, runs=3) < 2.0
@@ -0,0 +1,14 @@
+from abcapstonefa25team1.backend.quantum.order_benchmarking import benchmark_order_engines
+
+
+def test_order_engines_agree_and_bsgs_scales():
+    rows = benchmark_order_engines(bit_sizes=(16, 24, 40), bases_per_size=2)
+    by_key = {(row["bits"], row["engine"]): row for row in rows}
+
+    # The reference is only run where it is affordable
+    assert (40, "bruteforce") not in by_key
+    assert by_key[(40, "bsgs")]["N"] < 2**40
+
+    for bits in (16, 24):
+        assert by_key[(bits, "bsgs")]["orders"] == by_key[(bits, "bruteforce")]["orders"]
+    assert by_key[(24, "bsgs")]["seconds"] < by_key[(24, "bruteforce")]["seconds"]
@@ -5,6 +5,8 @@
 # Date Developed: 10/23/2025
 # Last Date Changed: 10/29/2025
 # Revision: fixed the unit test
+import math
+
 import pytest
 from abcapstonefa25team1.backend.rsa.RSA_encrypt import RSA
 
@@ -79,3 +81,186 @@ def test_decrypt(rsa):
 
     assert decrypted == message
 
+
+
+def test_derive_crt_private_key(rsa):
+    """CRT key carries the same d plus the per-prime exponents"""
+    p, q, e = 11, 13, 7
+    n, d = rsa.derive_private_key_from_factors(p, q, e)
+    key = rsa.derive_private_key_from_factors(p, q, e, crt=True)
+    assert (key.d, key.n, key.p, key.q) == (d, n, p, q)
+    assert key.dp == d % (p - 1)
+    assert key.dq == d % (q - 1)
+    assert (key.qinv * q) % p == 1
+
+
+def test_crt_decrypt_matches_plain_decrypt(rsa):
+    """Both private key forms decrypt every block identically"""
+    public_key, private_key, _ = rsa.generate_keys(crt=True)
+    e, n = public_key
+    plain_key = (private_key.d, private_key.n)
+
+    blocks = list(range(n))
+    expected = rsa.decrypt(blocks, plain_key)
+    assert rsa.decrypt(blocks, private_key) == expected
+
+    message = "CRT path, same bytes!"
+    assert rsa.decrypt(rsa.encrypt(message, public_key), private_key) == message
+
+
+def test_lookup_tables_match_pow():
+    """Table and pow() paths agree, including moduli above one byte"""
+    message = "Lookup tables: the same ciphertext! ~" * 40
+    for p, q, e in ((11, 13, 7), (61, 53, 17)):
+        n, d = RSA().derive_private_key_from_factors(p, q, e)
+        with_tables, without = RSA(), RSA(use_tables=False)
+        cipher = with_tables.encrypt(message, (e, n))
+        assert cipher == without.encrypt(message, (e, n))
+        assert with_tables.decrypt(cipher, (d, n)) == message
+        assert {(e, n), (d, n)} <= set(RSA.cached_tables())
+
+
+def test_lookup_table_cache_evicts_least_recently_used():
+    RSA.clear_tables()
+    assert RSA.cached_tables() == []
+
+    rsa = RSA()
+    message = "x" * 200  # enough blocks to build a table for n = 221
+    exponents = [e for e in range(3, 200, 2) if math.gcd(e, 192) == 1]
+    for e in exponents[: RSA.TABLE_CACHE_SIZE + 1]:
+        assert rsa.encrypt(message, (e, 221)) == RSA(use_tables=False).encrypt(message, (e, 221))
+
+    cached = RSA.cached_tables()
+    assert len(cached) == RSA.TABLE_CACHE_SIZE
+    assert (exponents[0], 221) not in cached
+    assert cached[-1] == (exponents[RSA.TABLE_CACHE_SIZE], 221)
+    RSA.clear_tables()
+
+
+def test_lookup_table_still_rejects_large_characters():
+    rsa = RSA()
+    with pytest.raises(ValueError):
+        rsa.encrypt("A" * 100 + "ÿ", (7, 143))
+    with pytest.raises(ValueError):
+        rsa.encrypt("A" * 100 + "€", (7, 143))
+
+
+def test_stream_matches_whole_message(rsa):
+    p, q, e = 61, 53, 17
+    n, d = rsa.derive_private_key_from_factors(p, q, e)
+    message = "Streaming keeps one chunk in memory. " * 10
+    chunks = [message[i : i + 64] for i in range(0, len(message), 64)]
+
+    cipher_chunks = list(rsa.encrypt_stream(chunks, (e, n)))
+    assert [c for chunk in cipher_chunks for c in chunk] == rsa.encrypt(message, (e, n))
+    assert "".join(rsa.decrypt_stream(cipher_chunks, (d, n))) == message
+
+
+def test_parallel_matches_serial():
+    """Chunks are processed on a pool and reassembled in order"""
+    rsa = RSA(use_tables=False)
+    n, d = rsa.derive_private_key_from_factors(61, 53, 17)
+    message = "".join(chr(32 + i % 90) for i in range(5000))
+
+    cipher = rsa.encrypt_parallel(message, (17, n), workers=2, chunk_size=700, min_seconds=0)
+    assert cipher == rsa.encrypt(message, (17, n))
+    assert rsa.decrypt_parallel(cipher, (d, n), workers=2, chunk_size=700, min_seconds=0) == message
+
+
+def _no_pool(monkeypatch):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("process pool should not be used")
+
+    monkeypatch.setattr("abcapstonefa25team1.backend.rsa.RSA_encrypt.ProcessPoolExecutor", no_pool)
+
+
+def test_parallel_falls_back_below_measured_cost(monkeypatch):
+    _no_pool(monkeypatch)
+    rsa = RSA(use_tables=False)
+    n, d = rsa.derive_private_key_from_factors(11, 13, 7)
+    message = "small input" * 100
+    cipher = rsa.encrypt_parallel(message, (7, n), workers=4, chunk_size=100)
+    assert rsa.decrypt_parallel(cipher, (d, n), workers=4, chunk_size=100) == message
+
+
+def test_parallel_stays_serial_on_the_table_path(rsa, monkeypatch):
+    """A lookup table beats any pool, whatever the input size"""
+    _no_pool(monkeypatch)
+    n, d = rsa.derive_private_key_from_factors(11, 13, 7)
+    message = "table path " * 1000
+    cipher = rsa.encrypt_parallel(message, (7, n), workers=4, chunk_size=100, min_seconds=0)
+    assert rsa.decrypt_parallel(cipher, (d, n), workers=4, chunk_size=100, min_seconds=0) == message
+
+
+def test_packed_blocks_hold_several_bytes():
+    """Bytes are packed floor(log256 n) per block and unpacked symmetrically"""
+    from abcapstonefa25team1.backend.rsa import packing
+
+    rsa = RSA()
+    p, q, e = 1000003, 1000033, 65537  # n just above 2^39: 4 bytes per block
+    n, d = rsa.derive_private_key_from_factors(p, q, e)
+    assert packing.bytes_per_block(n) == 4
+
+    data = bytes(range(256)) * 3 + b"\x00\x00"  # binary, ends in zero bytes
+    blocks = rsa.encrypt_bytes(data, (e, n))
+    assert len(blocks) == len(data) // 4 + 1
+    assert rsa.decrypt_bytes(blocks, (d, n)) == data
+    assert rsa.decrypt_bytes(blocks, rsa.derive_private_key_from_factors(p, q, e, crt=True)) == data
+
+    message = "Grüße, 世界!"  # code points above n are fine once UTF-8 encoded
+    cipher = rsa.encrypt(message, (e, n), packed=True)
+    assert rsa.decrypt(cipher, (d, n), packed=True) == message
+
+
+def test_packed_stream_matches_whole_input():
+    from abcapstonefa25team1.backend.rsa import packing
+
+    rsa = RSA()
+    n, d = rsa.derive_private_key_from_factors(61, 53, 17)  # 1 byte per block
+    data = b"stream of bytes " * 50
+    chunks = [data[i : i + 37] for i in range(0, len(data), 37)]
+    streamed = [c for blocks in rsa.encrypt_bytes_stream(chunks, (17, n)) for c in blocks]
+    assert streamed == rsa.encrypt_bytes(data, (17, n))
+
+    block_chunks = [streamed[i : i + 100] for i in range(0, len(streamed), 100)]
+    assert b"".join(rsa.decrypt_bytes_stream(block_chunks, (d, n))) == data
+
+    with pytest.raises(ValueError):
+        packing.pack(b"abc", 255)
+
+
+def test_generate_large_keys():
+    """bits= builds a modulus of exactly that size with e = 65537"""
+    rsa = RSA()
+    (e, n), (d, n2), (p, q) = rsa.generate_keys(bits=1024)
+    assert n == n2 == p * q and p != q
+    assert n.bit_length() == 1024
+    assert e == 65537
+    assert e * d % ((p - 1) * (q - 1)) == 1
+
+    data = "large key round trip".encode()
+    assert rsa.decrypt_bytes(rsa.encrypt_bytes(data, (e, n)), (d, n)) == data
+    # 1024-bit modulus: 127 bytes per block
+    assert len(rsa.encrypt_bytes(bytes(1000), (e, n))) == 8
+
+    _, priv, _ = rsa.generate_keys(bits=256, e=3, crt=True)
+    assert priv.n.bit_length() == 256
+
+    with pytest.raises(ValueError):
+        rsa.generate_keys(bits=512, e=4)
+
+
+def test_cli_rejects_small_key_sizes(tmp_path, monkeypatch, capsys):
+    from abcapstonefa25team1.frontend.cli import app
+
+    monkeypatch.setattr("sys.argv", ["sred", "encrypt", str(tmp_path / "in.txt"), "--bits", "16"])
+    with pytest.raises(SystemExit):
+        app.main()
+    assert "at least 32" in capsys.readouterr().err
+
+
+def test_square_modulus_has_no_private_key(rsa):
+    """N = 169 = 13^2 is accepted by the CLI and factored as (13, 13)"""
+    for crt in (False, True):
+        with pytest.raises(ValueError, match="distinct primes"):
+            rsa.derive_private_key_from_factors(13, 13, 7, crt=crt)
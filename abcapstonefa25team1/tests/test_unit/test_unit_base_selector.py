@@ -0,0 +1,66 @@
+import math
+import random
+
+import pytest
+
+from abcapstonefa25team1.backend.quantum.base_selector import BaseSelector, jacobi
+
+
+@pytest.fixture
+def selector():
+    random.seed(488)
+    return BaseSelector()
+
+
+def test_jacobi_matches_euler_criterion():
+    """For a prime modulus the Jacobi symbol is the Legendre symbol"""
+    p = 101
+    for a in range(1, p):
+        euler = pow(a, (p - 1) // 2, p)
+        assert jacobi(a, p) == (1 if euler == 1 else -1)
+    assert jacobi(21, 221) == jacobi(21, 13) * jacobi(21, 17)
+    assert jacobi(13, 221) == 0
+
+
+def test_bases_are_not_repeated(selector):
+    N = 221
+    drawn = selector.take(N, N)
+    assert len(drawn) == len(set(drawn))
+    assert all(2 <= a <= N - 2 for a in drawn)
+
+
+def test_jacobi_minus_one_bases_come_first(selector):
+    N = 221
+    first = selector.take(N, 20)
+    assert all(jacobi(a, N) == -1 for a in first)
+
+
+def test_shared_factor_bases_are_not_handed_out(selector):
+    """The 28 multiples of 13 or 17 below 219 would factor N by gcd alone"""
+    N = 221
+    drawn = selector.take(N, N)
+    assert all(math.gcd(a, N) == 1 for a in drawn)
+
+
+def test_known_odd_order_base_is_skipped(selector):
+    """4 has order 3 mod 21, so it should never be handed out"""
+    drawn = selector.take(21, 21)
+    assert 4 not in drawn
+    assert 16 not in drawn  # 16 = 4^2, also order 3
+    assert selector.avoided_simulations >= 2
+
+
+def test_failed_bases_are_remembered(selector):
+    N = 221
+    a = selector.next_base(N)
+    selector.record_failure(N, a)
+    assert a not in selector.take(N, N)
+
+
+def test_odd_period_retires_whole_subgroup():
+    selector = BaseSelector(small_order_bound=0)
+    N = 221
+    # 3 has order 48 mod 221, so 3^16 has order 3
+    a = pow(3, 16, N)
+    selector.record_failure(N, a, 3)
+    assert pow(a, 2, N) in selector.failed[N]
@@ -0,0 +1,63 @@
+# Project: TEAM 1
+# Purpose Details: testing batch decryption under one private key
+# Course: CMPSC488
+# Author: Team 1
+# Date Developed: 10/17/2026
+# Last Date Changed: 10/17/2026
+# Revision: Initial version
+
+from abcapstonefa25team1.backend.rsa.RSA_encrypt import RSA
+from abcapstonefa25team1.backend.rsa.batch_decrypt import decrypt_files
+from abcapstonefa25team1.backend.utils.read_write import write_encrypted_binary
+from abcapstonefa25team1.frontend.cli.app import batch_output_path
+
+E = 17
+
+
+def make_files(tmp_path, rsa, n, count):
+    jobs, expected = [], {}
+    for i in range(count):
+        text = f"file {i} " * 200
+        path = tmp_path / f"f{i}.enc"
+        write_encrypted_binary(path, rsa.encrypt(text, (E, n)), n, E)
+        jobs.append((str(path), str(tmp_path / f"f{i}.dec")))
+        expected[str(path)] = text.encode()
+    return jobs, expected
+
+
+def test_decrypts_every_file_with_one_key(tmp_path):
+    rsa = RSA()
+    priv = rsa.derive_private_key_from_factors(61, 53, E, crt=True)
+    jobs, expected = make_files(tmp_path, rsa, priv.n, 3)
+
+    # A packed file and a file for another key in the same batch
+    packed = tmp_path / "packed.enc"
+    write_encrypted_binary(packed, rsa.encrypt_bytes(b"\x00binary\xff", (E, priv.n)), priv.n, E, packed=True)
+    jobs.append((str(packed), str(tmp_path / "packed.dec")))
+    expected[str(packed)] = b"\x00binary\xff"
+    other = tmp_path / "other.enc"
+    write_encrypted_binary(other, [1, 2, 3], 187)
+    jobs.append((str(other), str(tmp_path / "other.dec")))
+
+    results = {r.input_path: r for r in decrypt_files(jobs, priv, E, workers=1)}
+    assert "modulus" in results[str(other)].error
+    for path, data in expected.items():
+        assert results[path].error is None
+        assert results[path].bytes_out == len(data)
+        assert open(results[path].output_path, "rb").read() == data
+
+
+def test_process_pool_matches_serial(tmp_path):
+    rsa = RSA()
+    n, d = rsa.derive_private_key_from_factors(61, 53, E)
+    jobs, expected = make_files(tmp_path, rsa, n, 3)
+
+    results = list(decrypt_files(jobs, (d, n), E, workers=2))
+    assert sorted(r.input_path for r in results) == sorted(expected)
+    for r in results:
+        assert open(r.output_path, "rb").read() == expected[r.input_path]
+
+
+def test_batch_output_path(tmp_path):
+    assert batch_output_path("data/report.enc", None).endswith("report.dec")
+    assert batch_output_path("data/report.bin", str(tmp_path)) == str(tmp_path / "report.bin.dec")
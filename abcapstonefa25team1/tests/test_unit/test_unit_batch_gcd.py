@@ -0,0 +1,42 @@
+import math
+import random
+
+from abcapstonefa25team1.backend.quantum.batch_gcd import BatchGCD, batch_gcd, product_tree
+from abcapstonefa25team1.backend.utils.primality import random_prime
+
+
+def test_batch_gcd_matches_pairwise():
+    rng = random.Random(25)
+    primes = [random_prime(64, rng) for _ in range(30)]
+    moduli = [rng.choice(primes) * rng.choice(primes[:20]) for _ in range(40)]
+    moduli = list(dict.fromkeys(moduli))
+
+    assert product_tree(moduli)[-1] == [math.prod(moduli)]
+    expected = [math.gcd(n, math.prod(m for m in moduli if m != n)) for n in moduli]
+    assert batch_gcd(moduli) == expected
+
+
+def test_shared_primes_skip_the_fallback():
+    p1, p2, p3, p4, p5, p6 = 1000003, 1000033, 1000037, 1000039, 1000081, 1000099
+    moduli = [p1 * p2, p1 * p3, p2 * p4, p5 * p6, p1 * p2]  # p1*p2 shares both primes, and repeats
+    called = []
+
+    def fallback(n):
+        called.append(n)
+        return (p5, p6) if n == p5 * p6 else None
+
+    batch = BatchGCD(fallback=fallback)
+    results = batch.factor(moduli)
+    assert called == [p5 * p6]
+    assert len(results) == 4
+    for n, (p, q, stage) in results.items():
+        assert p * q == n and 1 < p < n
+        assert stage == ("shor" if n == p5 * p6 else "batch-gcd")
+    assert batch.stats["batch-gcd"]["factored"] == 3
+    assert batch.stats["shor"]["moduli"] == 1
+    assert batch.stats["batch-gcd"]["pairwise_estimate"] > 0
+
+
+def test_unfactored_moduli_reported_as_none():
+    batch = BatchGCD(fallback=lambda n: None)
+    assert batch.factor([1000003 * 1000033]) == {1000003 * 1000033: None}
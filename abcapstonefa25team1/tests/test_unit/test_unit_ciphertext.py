@@ -0,0 +1,49 @@
+import pytest
+
+from abcapstonefa25team1.backend.rsa.ciphertext import Ciphertext
+from abcapstonefa25team1.backend.rsa.RSA_encrypt import RSA
+from abcapstonefa25team1.backend.utils.read_write import (
+    read_encrypted_binary,
+    write_encrypted_binary,
+)
+
+
+@pytest.mark.parametrize("n", [187, 3233, 2**23 + 9, 2**40 + 15, 2**64 - 59])
+def test_bytes_round_trip_matches_file_layout(n):
+    blocks = [0, 1, n // 3, n - 1]
+    block_size = (n.bit_length() + 7) // 8
+    expected = b"".join(c.to_bytes(block_size, "big") for c in blocks)
+
+    ciphertext = Ciphertext(blocks, n)
+    assert ciphertext.tobytes() == expected
+    assert Ciphertext.frombuffer(expected, n).tolist() == blocks
+
+
+def test_frombuffer_is_zero_copy():
+    data = bytes(range(100))
+    ciphertext = Ciphertext.frombuffer(data, 3233)
+    assert len(ciphertext) == 50
+    assert not ciphertext.values.flags.owndata
+
+
+def test_invalid_inputs_rejected():
+    with pytest.raises(ValueError):
+        Ciphertext.frombuffer(b"\x00\x01\x02", 3233)
+    with pytest.raises(ValueError):
+        Ciphertext([1], 2**64 + 1)
+
+
+def test_rsa_accepts_ciphertext(tmp_path):
+    rsa = RSA()
+    message = "Compact ciphertext, one allocation. " * 20
+    for p, q, e in ((11, 17, 7), (61, 53, 17)):
+        n, d = rsa.derive_private_key_from_factors(p, q, e)
+        ciphertext = rsa.encrypt(message, (e, n), compact=True)
+        assert ciphertext.tolist() == rsa.encrypt(message, (e, n))
+        assert rsa.decrypt(ciphertext, (d, n)) == message
+        assert rsa.decrypt(ciphertext, rsa.derive_private_key_from_factors(p, q, e, crt=True)) == message
+
+        path = tmp_path / f"{n}.enc"
+        write_encrypted_binary(path, ciphertext, n)
+        assert read_encrypted_binary(path, n) == ciphertext.tolist()
+        assert read_encrypted_binary(path, n, compact=True) == ciphertext
@@ -0,0 +1,56 @@
+import pytest
+from qiskit_aer import AerSimulator
+
+from abcapstonefa25team1.backend.quantum.circuit_cache import CircuitCache
+from abcapstonefa25team1.backend.quantum.quantum_shors import Quantum_Shors
+
+
+@pytest.fixture
+def simulator():
+    return AerSimulator(method="statevector")
+
+
+def test_repeated_base_hits_cache(simulator):
+    """The same (N, a, n_count) should only be transpiled once"""
+    shor = Quantum_Shors()
+    first = shor.get_transpiled_circuit(15, 7, 8, simulator)
+    second = shor.get_transpiled_circuit(15, 7, 8, simulator)
+
+    assert first is second
+    assert shor.cache_misses == 1
+    assert shor.cache_hits == 1
+
+
+def test_different_base_is_a_miss(simulator):
+    shor = Quantum_Shors()
+    shor.get_transpiled_circuit(15, 7, 8, simulator)
+    shor.get_transpiled_circuit(15, 2, 8, simulator)
+    assert shor.cache_misses == 2
+    assert shor.cache_hits == 0
+
+
+def test_lru_eviction():
+    cache = CircuitCache(max_entries=2)
+    cache.put(("a",), "first")
+    cache.put(("b",), "second")
+    cache.get(("a",))  # touch "a" so "b" is the oldest
+    cache.put(("c",), "third")
+
+    assert len(cache) == 2
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == "first"
+
+
+def test_disk_cache_shared_between_instances(tmp_path, simulator):
+    """A second instance pointed at the same directory should load the QPY file"""
+    writer = Quantum_Shors(cache_dir=str(tmp_path))
+    built = writer.get_transpiled_circuit(15, 7, 8, simulator)
+    assert list(tmp_path.glob("*.qpy"))
+
+    reader = Quantum_Shors(cache_dir=str(tmp_path))
+    loaded = reader.get_transpiled_circuit(15, 7, 8, simulator)
+
+    assert reader.cache_hits == 1
+    assert reader.circuit_cache.disk_hits == 1
+    assert loaded.num_qubits == built.num_qubits
+    assert loaded.count_ops() == built.count_ops()
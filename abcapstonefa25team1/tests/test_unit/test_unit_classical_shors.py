@@ -0,0 +1,68 @@
+import math
+
+import pytest
+
+from abcapstonefa25team1.backend.quantum.classical_shors import Classical_Shors
+
+
+@pytest.fixture
+def shor():
+    return Classical_Shors()
+
+
+def test_bsgs_matches_bruteforce(shor):
+    N = 221
+    for a in range(2, N):
+        if math.gcd(a, N) == 1:
+            assert shor._order_bsgs(a, N) == shor._order_bruteforce(a, N, max_iterations=N)
+
+
+def test_bsgs_respects_bound(shor):
+    # 3 has order 48 mod 221
+    assert shor._order_bsgs(3, 221, bound=47) is None
+    assert shor._order_bsgs(3, 221, bound=48) == 48
+
+
+def test_order_reduced_from_known_multiple(shor):
+    assert shor.find_order(3, 221) == 48
+    # 9 = 3^2 divides into the recorded multiple, so no search is needed
+    assert shor.find_order(9, 221) == 24
+    assert shor.find_order(13, 221) is None
+
+
+def test_factors_forty_bit_semiprime():
+    N = 1000003 * 1000033
+    p, q = Classical_Shors().shors_classical(N, tries=20)
+    assert p * q == N
+    assert {p, q} == {1000003, 1000033}
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        Classical_Shors(order_engine="pollard")
+
+
+def test_rho_tier_factors_64_bit_semiprime():
+    p, q = 4294967291, 4294967279  # the two largest 32-bit primes
+    shor = Classical_Shors()
+    assert set(shor.shors_classical(p * q)) == {p, q}
+    assert shor.last_tier == "rho"
+    assert list(shor.tier_timings) == ["trial", "rho"]
+
+
+def test_pm1_tier_finds_smooth_factor():
+    # 1000249 - 1 = 2^3 * 3 * 71 * 587 is 10000-smooth, 1000003 - 1 = 2 * 3 * 166667 is not
+    p, q = 1000249, 1000003
+    shor = Classical_Shors(tiers=("trial", "p-1"))
+    assert set(shor.shors_classical(p * q)) == {p, q}
+    assert shor.last_tier == "p-1"
+
+
+def test_order_tier_still_runs_last():
+    shor = Classical_Shors(tiers=("order",))
+    p, q = shor.shors_classical(1000003 * 1000033, tries=20)
+    assert p * q == 1000003 * 1000033
+    assert shor.last_tier == "order"
+
+    with pytest.raises(ValueError):
+        Classical_Shors(tiers=("trial", "ecm"))
@@ -0,0 +1,187 @@
+# Project: TEAM 1
+# Purpose Details: testing the versioned .enc container format
+# Course: CMPSC488
+# Author: Team 1
+# Date Developed: 10/17/2026
+# Last Date Changed: 10/17/2026
+# Revision: Initial version
+
+import struct
+import zlib
+
+import pytest
+
+from abcapstonefa25team1.backend.utils import enc_container
+from abcapstonefa25team1.backend.utils.enc_container import (
+    HEADER_SIZE,
+    ContainerReader,
+    ContainerWriter,
+    modulus_fingerprint,
+    read_header,
+)
+from abcapstonefa25team1.backend.utils.read_write import (
+    EncryptedFileMap,
+    read_encrypted_binary,
+    read_encrypted_preview,
+    read_encrypted_stream,
+    write_encrypted_binary,
+    write_encrypted_stream,
+)
+
+N = 3233  # 61 * 53, two-byte blocks
+E = 17
+
+
+def test_header_describes_file(tmp_path):
+    file_path = tmp_path / "cipher.enc"
+    blocks = list(range(0, N, 3))
+    write_encrypted_binary(file_path, blocks, N, E)
+
+    header = read_header(file_path)
+    assert header.block_size == 2
+    assert header.exponent == E
+    assert header.block_count == len(blocks)
+    assert file_path.stat().st_size == header.file_size
+    assert read_encrypted_binary(file_path, N, e=E) == blocks
+    assert read_encrypted_binary(file_path, N, compact=True).tolist() == blocks
+
+
+def test_wrong_key_fails_before_reading(tmp_path):
+    file_path = tmp_path / "cipher.enc"
+    write_encrypted_binary(file_path, [1, 2, 3], N, E)
+
+    with pytest.raises(ValueError, match="modulus"):
+        read_encrypted_binary(file_path, 3127)
+    with pytest.raises(ValueError, match="exponent"):
+        read_encrypted_binary(file_path, N, e=65537)
+    with pytest.raises(ValueError, match="modulus"):
+        read_encrypted_preview(file_path, 3127)
+
+
+def test_corrupted_chunk_is_detected(tmp_path):
+    file_path = tmp_path / "cipher.enc"
+    blocks = list(range(1000))
+    with ContainerWriter(file_path, N, E, chunk_blocks=100) as writer:
+        writer.write(b"".join(c.to_bytes(2, "big") for c in blocks))
+
+    data = bytearray(file_path.read_bytes())
+    data[HEADER_SIZE + 2 * 450] ^= 0xFF  # inside chunk 4
+    file_path.write_bytes(bytes(data))
+
+    with ContainerReader(file_path, N) as reader:
+        assert reader.read_chunk(3) == b"".join(c.to_bytes(2, "big") for c in blocks[300:400])
+        with pytest.raises(ValueError, match="chunk 4"):
+            reader.read_chunk(4)
+    with pytest.raises(ValueError, match="Checksum"):
+        read_encrypted_binary(file_path, N)
+    with pytest.raises(ValueError, match="Checksum"):
+        EncryptedFileMap(file_path, N)
+
+
+def test_truncated_file_is_rejected(tmp_path):
+    file_path = tmp_path / "cipher.enc"
+    write_encrypted_binary(file_path, list(range(100)), N)
+    file_path.write_bytes(file_path.read_bytes()[:-10])
+
+    with pytest.raises(ValueError, match="truncated"):
+        read_encrypted_binary(file_path, N)
+
+
+def test_legacy_headerless_files_still_read(tmp_path):
+    file_path = tmp_path / "legacy.enc"
+    blocks = [65, 123, 999, 2024]
+    write_encrypted_binary(file_path, blocks, N, legacy=True)
+
+    assert file_path.stat().st_size == 2 * len(blocks)
+    assert read_header(file_path) is None
+    assert read_encrypted_binary(file_path, N) == blocks
+    assert [c for chunk in read_encrypted_stream(file_path, N) for c in chunk] == blocks
+    with EncryptedFileMap(file_path, N) as mapped:
+        assert mapped.ciphertext.tolist() == blocks
+
+
+def test_streamed_container_matches_whole_file(tmp_path):
+    blocks = list(range(0, N, 7))
+    whole, streamed = tmp_path / "whole.enc", tmp_path / "streamed.enc"
+
+    write_encrypted_binary(whole, blocks, N, E)
+    # Write sizes that do not line up with the chunk boundaries
+    write_encrypted_stream(streamed, [blocks[:13], blocks[13:300], blocks[300:]], N, E)
+    assert whole.read_bytes() == streamed.read_bytes()
+
+    with EncryptedFileMap(streamed, N, E) as mapped:
+        assert mapped.ciphertext.tolist() == blocks
+
+
+def test_failed_stream_leaves_no_container(tmp_path):
+    from abcapstonefa25team1.backend.rsa.RSA_encrypt import RSA
+
+    rsa = RSA()
+    # '€' does not fit n = 221, so encryption fails after the first chunk
+    chunks = rsa.encrypt_stream(["plain ascii chunk", "price: 5€"], (7, 221))
+    file_path = tmp_path / "out.enc"
+    with pytest.raises(ValueError):
+        write_encrypted_stream(file_path, chunks, 221, 7)
+    assert not file_path.exists()
+
+    legacy_path = tmp_path / "legacy.enc"
+    chunks = rsa.encrypt_stream(["plain ascii chunk", "price: 5€"], (7, 221))
+    with pytest.raises(ValueError):
+        write_encrypted_stream(legacy_path, chunks, 221, 7, legacy=True)
+    assert not legacy_path.exists()
+
+
+def test_large_modulus_round_trips(tmp_path):
+    """A 2048-bit modulus has 256-byte blocks, too wide for the version 1 header"""
+    n = (1 << 2047) + 1
+    blocks = [n - 1, 0, 12345678901234567890]
+    file_path = tmp_path / "big.enc"
+    write_encrypted_binary(file_path, blocks, n, 65537)
+
+    header = read_header(file_path)
+    assert (header.block_size, header.version) == (256, enc_container.VERSION)
+    assert read_encrypted_binary(file_path, n, e=65537) == blocks
+
+
+def test_unsupported_block_size_writes_nothing(tmp_path):
+    file_path = tmp_path / "huge.enc"
+    with pytest.raises(ValueError, match="too large"):
+        ContainerWriter(file_path, 1 << (8 * enc_container.MAX_BLOCK_SIZE))
+    assert not file_path.exists()
+
+
+def test_failed_close_leaves_no_file(tmp_path, monkeypatch):
+    def fail(self):
+        raise OSError("disk full")
+
+    file_path = tmp_path / "cipher.enc"
+    monkeypatch.setattr(enc_container.ContainerHeader, "pack", fail)
+    with pytest.raises(OSError):
+        with ContainerWriter(file_path, N, E) as writer:
+            writer.write(b"\x00\x01")
+    assert not file_path.exists()
+
+
+def test_version_1_header_still_reads(tmp_path):
+    blocks = [1, 2, 3]
+    fields = struct.pack(">4sBBH8sQQI", b"SRED", 1, 2, 0, modulus_fingerprint(N), E, 3, 64)
+    data = b"".join(c.to_bytes(2, "big") for c in blocks)
+    file_path = tmp_path / "v1.enc"
+    file_path.write_bytes(
+        fields + struct.pack(">I", zlib.crc32(fields)) + data + struct.pack(">I", zlib.crc32(data))
+    )
+    assert read_header(file_path).version == 1
+    assert read_encrypted_binary(file_path, N, e=E) == blocks
+
+
+def test_damaged_header_is_an_error(tmp_path):
+    file_path = tmp_path / "cipher.enc"
+    write_encrypted_binary(file_path, [1, 2, 3], N, E)
+    data = bytearray(file_path.read_bytes())
+    data[20] ^= 0x01  # inside the exponent field
+    file_path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="corrupted"):
+        read_header(file_path)
+    with pytest.raises(ValueError, match="corrupted"):
+        read_encrypted_binary(file_path, N)
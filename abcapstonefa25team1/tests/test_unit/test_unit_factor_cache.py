@@ -0,0 +1,63 @@
+# Project: TEAM 1
+# Purpose Details: testing the persistent factor cache
+# Course: CMPSC488
+# Author: Team 1
+# Date Developed: 10/17/2026
+# Last Date Changed: 10/17/2026
+# Revision: Initial version
+
+import sqlite3
+
+import pytest
+
+from abcapstonefa25team1.backend.utils.factor_cache import FactorCache, default_cache_dir
+
+
+def test_round_trip_between_instances(tmp_path):
+    path = tmp_path / "factors.sqlite3"
+    n = (2**61 - 1) * (2**89 - 1)  # beyond SQLite's 64-bit integers
+    with FactorCache(path) as writer:
+        assert writer.get(n) is None
+        writer.put(n, 2**61 - 1, 2**89 - 1, "classical:rho")
+
+        # A second connection reads while the first is still open
+        with FactorCache(path) as reader:
+            assert reader.get(n) == (2**61 - 1, 2**89 - 1, "classical:rho")
+            assert (reader.hits, reader.misses) == (1, 0)
+        assert writer.misses == 1
+
+
+def test_bad_factors_rejected_and_dropped(tmp_path):
+    path = tmp_path / "factors.sqlite3"
+    with FactorCache(path) as cache:
+        with pytest.raises(ValueError):
+            cache.put(3233, 1, 3233, "bogus")
+        with pytest.raises(ValueError):
+            cache.put(3233, 61, 54, "bogus")
+
+    # A tampered row is ignored and removed on lookup
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO factors VALUES ('3233', '61', '54', 'edited', 0, 0)")
+    conn.commit()
+    conn.close()
+    with FactorCache(path) as cache:
+        assert cache.get(3233) is None
+        assert len(cache) == 0
+
+
+def test_size_limit_evicts_least_recently_used(tmp_path):
+    with FactorCache(tmp_path / "factors.sqlite3", max_entries=2) as cache:
+        cache.put(15, 3, 5, "classical:trial")
+        cache.put(21, 3, 7, "classical:trial")
+        cache.get(15)  # 21 is now the least recently used
+        cache.put(35, 5, 7, "classical:trial")
+        assert len(cache) == 2
+        assert cache.get(21) is None
+        assert cache.get(15) and cache.get(35)
+
+
+def test_default_dir_override(monkeypatch, tmp_path):
+    monkeypatch.setenv("SRED_CACHE_DIR", str(tmp_path))
+    assert default_cache_dir() == tmp_path
+    with FactorCache() as cache:
+        assert cache.path == tmp_path / "factors.sqlite3"
@@ -0,0 +1,33 @@
+import random
+
+from abcapstonefa25team1.backend.quantum.classical_shors import Classical_Shors
+from abcapstonefa25team1.backend.utils.integer_roots import iroot, perfect_power
+
+
+def test_iroot_is_exact_floor():
+    rng = random.Random(22)
+    for _ in range(200):
+        n = rng.getrandbits(rng.randrange(1, 400))
+        k = rng.randrange(1, 12)
+        r = iroot(n, k)
+        assert r**k <= n < (r + 1) ** k
+    # Beyond float precision: round((x**3) ** (1/3)) is off here
+    x = 2**70 + 1
+    assert iroot(x**3, 3) == x
+    assert iroot(x**3 - 1, 3) == x - 1
+
+
+def test_perfect_power_smallest_base():
+    assert perfect_power(225) == (15, 2)
+    assert perfect_power(2**60) == (2, 60)
+    assert perfect_power(6**35) == (6, 35)
+    assert perfect_power(3**7 * 5**7) == (15, 7)
+    for n in (2, 3, 12, 2**61 - 1, 10**18 + 9):
+        assert perfect_power(n) is None
+
+
+def test_perfect_power_thousands_of_bits():
+    p = 2**521 - 1
+    assert perfect_power(p**5) == (p, 5)
+    assert perfect_power(p**5 + 2) is None
+    assert Classical_Shors()._is_power(p**3) == (p, 3)
@@ -0,0 +1,49 @@
+# Project: TEAM 1
+# Purpose Details: testing the background-refilled RSA key pool
+# Course: CMPSC488
+# Author: Team 1
+# Date Developed: 10/17/2026
+# Last Date Changed: 10/17/2026
+# Revision: Initial version
+
+import time
+
+import pytest
+
+from abcapstonefa25team1.backend.rsa.key_pool import KeyPool
+
+
+def wait_for(condition, timeout=30):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "key pool did not refill in time"
+        time.sleep(0.01)
+
+
+def test_first_get_misses_then_pool_refills():
+    with KeyPool(size=3) as pool:
+        (e, n), (d, n2), (p, q) = pool.get()
+        assert n == n2 == p * q and 123 <= n <= 255
+        assert pool.stats()["misses"] == 1
+
+        wait_for(lambda: pool.available() == 3)
+        keys = [pool.get() for _ in range(3)]
+        stats = pool.stats()
+        assert stats["hits"] == 3 and stats["misses"] == 1
+        assert stats["hit_rate"] == 0.75
+        assert len({id(key) for key in keys}) == 3  # each key handed out once
+
+
+def test_sizes_are_pooled_separately():
+    with KeyPool(size=1) as pool:
+        pool.warm(None, 256)
+        wait_for(lambda: pool.available(256) == 1 and pool.available() == 1)
+
+        (e, n), _, _ = pool.get(256)
+        assert n.bit_length() == 256 and e == 65537
+        assert pool.stats()["hits"] == 1
+
+
+def test_invalid_pool_size_rejected():
+    with pytest.raises(ValueError):
+        KeyPool(size=0)
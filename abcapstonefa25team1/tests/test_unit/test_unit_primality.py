@@ -0,0 +1,50 @@
+import random
+
+from abcapstonefa25team1.backend.utils.primality import (
+    is_prime,
+    order_from_multiple,
+    random_prime,
+    small_primes,
+)
+
+
+def test_sieve_matches_trial_division():
+    expected = [n for n in range(2, 500) if all(n % d for d in range(2, int(n**0.5) + 1))]
+    assert small_primes(499) == expected
+    assert small_primes(1) == []
+
+
+def test_small_numbers():
+    assert [n for n in range(-2, 30) if is_prime(n)] == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+
+def test_strong_pseudoprimes_rejected():
+    # Carmichael numbers and strong pseudoprimes to several small bases
+    for n in (561, 1105, 2047, 3215031751, 3825123056546413051, 318665857834031151167461):
+        assert not is_prime(n)
+
+
+def test_large_primes():
+    assert is_prime(2**61 - 1)
+    assert is_prime(18446744073709551557)  # largest 64-bit prime
+    assert is_prime(2**127 - 1)
+    assert not is_prime((2**61 - 1) * (2**31 - 1))
+
+
+def test_random_prime():
+    rng = random.Random(488)
+    for bits in (8, 64, 512):
+        p = random_prime(bits, rng)
+        assert p.bit_length() == bits and p >> (bits - 2) == 3
+        assert is_prime(p)
+
+    p = random_prime(128, rng, condition=lambda c: c % 3 == 2)
+    assert p % 3 == 2 and is_prime(p)
+
+
+def test_order_from_multiple():
+    # 3 has order 48 mod 221; lambda(221) = 48, and any multiple reduces to it
+    assert order_from_multiple(3, 221, 48 * 35) == 48
+    assert order_from_multiple(3, 221, 48) == 48
+    assert order_from_multiple(4, 21, 6) == 3
+    assert order_from_multiple(1, 221, 96) == 1
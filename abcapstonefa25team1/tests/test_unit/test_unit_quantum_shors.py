@@ -0,0 +1,197 @@
+import pytest
+from qiskit import QuantumCircuit, QuantumRegister
+from qiskit.quantum_info import Statevector
+
+from abcapstonefa25team1.backend.quantum.quantum_shors import Quantum_Shors, _parallel_shors_attempt
+
+
+@pytest.fixture
+def shor():
+    return Quantum_Shors()
+
+
+def test_parallel_mode_finds_factors(shor):
+    """Every base of 15 is tried, so some worker must succeed"""
+    result = shor.run_shors_algorithm(15, max_attempts=12, parallel=True, workers=2)
+    assert result is not None
+    p, q = result
+    assert p * q == 15
+    assert 1 < p < 15
+
+
+def test_parallel_attempt_reports_period():
+    """4 has odd order 3 mod 21; the parent needs r to retire the whole subgroup"""
+    shor = Quantum_Shors(backend="numpy")
+    assert _parallel_shors_attempt(shor._worker_config(), 21, 4) == (4, None, 3)
+
+
+def test_parallel_mode_prime_skips_pool(shor):
+    assert shor.run_shors_algorithm(13, parallel=True, workers=2) is None
+
+
+def test_parallel_mode_even_number(shor):
+    assert shor.run_shors_algorithm(22, parallel=True, workers=2) == (2, 11)
+
+
+def _multiply_basis_state(shor, N, a, y, control):
+    """Run the controlled multiplier on |control⟩|y⟩|0⟩|0⟩ and return the output basis state"""
+    n = N.bit_length()
+    c = QuantumRegister(1, "c")
+    aux = QuantumRegister(n, "aux")
+    work = QuantumRegister(n + 1, "work")
+    flag = QuantumRegister(1, "flag")
+    qc = QuantumCircuit(c, aux, work, flag)
+    if control:
+        qc.x(c[0])
+    for i in range(n):
+        if (y >> i) & 1:
+            qc.x(aux[i])
+    shor.controlled_modular_multiplication(qc, c[0], aux, work, flag[0], a, 1, N)
+
+    probabilities = Statevector(qc).probabilities_dict()
+    (bits, probability), = [(k, v) for k, v in probabilities.items() if v > 1e-6]
+    state = int(bits, 2)
+    return probability, (state >> 1) & (2**n - 1), state >> (n + 1)
+
+
+@pytest.mark.parametrize("y", [1, 2, 7, 11, 14])
+def test_modular_multiplier_maps_basis_states(shor, y):
+    probability, product, scratch = _multiply_basis_state(shor, 15, 7, y, control=True)
+    assert probability == pytest.approx(1.0)
+    assert product == (7 * y) % 15
+    assert scratch == 0  # work register and flag are uncomputed
+
+
+def test_modular_multiplier_respects_control(shor):
+    probability, product, scratch = _multiply_basis_state(shor, 15, 7, 4, control=False)
+    assert probability == pytest.approx(1.0)
+    assert (product, scratch) == (4, 0)
+
+
+def test_period_finding_recovers_order(shor):
+    assert shor.quantum_period_finding(15, 7) == 4
+    assert shor.simulations_run == 1
+
+
+def test_oversized_circuit_falls_back_to_numpy(shor):
+    """N = 221 needs 34 qubits in the full-register layout, too many for Aer"""
+    assert shor.simulation_backend(63) == "aer"  # the largest N the circuit runs for
+    assert shor.simulation_backend(65) == "numpy"
+    assert shor.simulation_backend(221) == "numpy"
+    assert shor.quantum_period_finding(221, 3) == 48
+    assert shor.simulations_run == 1
+    assert shor.cache_misses == 0  # no circuit was transpiled
+
+
+def test_oversized_counting_register_is_an_error(shor):
+    shor.max_qubits = 12
+    assert shor.simulation_backend(221) is None
+    with pytest.raises(ValueError, match="counting qubits"):
+        shor.quantum_period_finding(221, 3)
+    assert shor.simulations_run == 0
+
+
+def test_cli_decrypt_runs_period_finding(tmp_path, monkeypatch):
+    """The default decrypt of N = 221 factors it with a simulated period finding run"""
+    from abcapstonefa25team1.backend.rsa.RSA_encrypt import RSA
+    from abcapstonefa25team1.backend.utils.read_write import write_encrypted_binary
+    from abcapstonefa25team1.frontend.cli import app
+
+    input_path, output_path = tmp_path / "secret.enc", tmp_path / "secret.txt"
+    write_encrypted_binary(input_path, RSA().encrypt("attack at dawn", (7, 221)), 221, 7)
+
+    periods = []
+    period_finding = Quantum_Shors.quantum_period_finding
+
+    def counting_period_finding(self, N, a):
+        periods.append(period_finding(self, N, a))
+        return periods[-1]
+
+    monkeypatch.setattr(Quantum_Shors, "quantum_period_finding", counting_period_finding)
+    monkeypatch.setattr(
+        "sys.argv",
+        ["sred", "decrypt", str(input_path), "-m", "221", "-e", "7", "--no-cache",
+         "-o", str(output_path)],
+    )
+    app.main()
+
+    assert periods and all(r is not None for r in periods)
+    assert output_path.read_text() == "attack at dawn"
+
+
+def test_semiclassical_mode_recovers_order():
+    shor = Quantum_Shors(mode="semiclassical")
+    assert shor.quantum_period_finding(15, 7) == 4
+
+
+def test_semiclassical_mode_uses_fewer_qubits():
+    full = Quantum_Shors()
+    semiclassical = Quantum_Shors(mode="semiclassical")
+    assert full.count_qubits_needed(221, 16) == 34
+    assert semiclassical.count_qubits_needed(221, 16) == 19
+
+    qc = semiclassical.create_semiclassical_shor_circuit(15, 7, 8)
+    assert qc.num_qubits == semiclassical.count_qubits_needed(15, 8)
+    assert qc.num_clbits == 8
+
+
+def test_unknown_mode_rejected():
+    with pytest.raises(ValueError):
+        Quantum_Shors(mode="approximate")
+
+
+def test_numpy_backend_matches_ideal_distribution():
+    """7 has order 4 mod 15, so the 8 counting bits peak at multiples of 64"""
+    shor = Quantum_Shors(backend="numpy")
+    probabilities = shor.permutation_simulator.distribution(15, 7, 8)
+    assert probabilities.sum() == pytest.approx(1.0)
+    for j in (0, 64, 128, 192):
+        assert probabilities[j] == pytest.approx(0.25)
+
+    counts = shor.permutation_simulator.sample(probabilities, 8, 100)
+    assert sum(counts.values()) == 100
+    assert set(counts) <= {"00000000", "01000000", "10000000", "11000000"}
+
+
+def test_numpy_backend_handles_cli_moduli():
+    """N = 221 is too large for the full Aer circuit but cheap as a permutation"""
+    shor = Quantum_Shors(backend="numpy")
+    assert shor.quantum_period_finding(221, 3) == 48
+    assert shor.simulations_run == 1
+    assert shor.cache_misses == 0  # nothing was transpiled
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        Quantum_Shors(backend="qasm")
+
+
+def test_adaptive_shots_stop_early():
+    """A clean signal is verified long before the shot budget is spent"""
+    shor = Quantum_Shors(backend="numpy")
+    assert shor.quantum_period_finding(221, 3) == 48
+    assert shor.last_shots_used == shor.shot_batch
+    assert shor.shots_run == shor.last_shots_used
+
+
+def test_adaptive_shots_respect_budget():
+    """Order 1 gives only the outcome 0, so no period is ever verified"""
+    shor = Quantum_Shors(backend="numpy", max_shots=500)
+    assert shor.quantum_period_finding(21, 1) is None
+    assert shor.last_shots_used == 500
+
+
+@pytest.mark.parametrize("mode, simulations", [("full", 1), ("semiclassical", 5)])
+def test_aer_batches_are_counted_as_simulations(mode, simulations):
+    """Order 1 never verifies a period, so all batches are drawn: 64 + 128 + 256 + 512 + 40"""
+    shor = Quantum_Shors(mode=mode, max_shots=1000)
+    assert shor.quantum_period_finding(15, 1) is None
+    assert shor.last_shots_used == 1000
+    assert shor.simulations_run == simulations
+
+
+def test_batches_are_capped():
+    shor = Quantum_Shors(backend="numpy", max_shots=10**6)
+    shor.max_batches = 3
+    assert shor.quantum_period_finding(21, 1) is None
+    assert shor.last_shots_used == 64 + 128 + 256
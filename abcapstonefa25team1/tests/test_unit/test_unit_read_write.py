@@ -12,6 +12,12 @@ from abcapstonefa25team1.backend.utils.read_write import (
     write_file,
     write_encrypted_binary,
     read_encrypted_binary,
+    read_encrypted_preview,
+    read_encrypted_stream,
+    read_file_chunks,
+    EncryptedFileMap,
+    write_encrypted_stream,
+    write_file_chunks,
 )
 
 
@@ -58,4 +64,55 @@ def test_write_and_read_encrypted_binary(tmp_path):
     assert os.path.exists(file_path)
 
     read_blocks = read_encrypted_binary(file_path, n)
-    assert read_blocks == cipher_blocks
\ No newline at end of file
+    assert read_blocks == cipher_blocks
+
+def test_stream_helpers_match_whole_file_helpers(tmp_path):
+    """Chunked readers/writers produce the same files as the whole-file helpers"""
+    n = 3233
+    cipher_blocks = list(range(0, 3233, 7))
+    whole, streamed = tmp_path / "whole.bin", tmp_path / "streamed.bin"
+
+    write_encrypted_binary(whole, cipher_blocks, n)
+    write_encrypted_stream(streamed, [cipher_blocks[:100], cipher_blocks[100:]], n)
+    assert whole.read_bytes() == streamed.read_bytes()
+
+    chunks = list(read_encrypted_stream(streamed, n, chunk_blocks=64))
+    assert max(len(chunk) for chunk in chunks) == 64
+    assert [c for chunk in chunks for c in chunk] == cipher_blocks
+
+    text_path = tmp_path / "text.txt"
+    write_file_chunks(text_path, ["Hello ", "streaming ", "world"])
+    assert list(read_file_chunks(text_path, chunk_size=5)) == ["Hello", " stre", "aming", " worl", "d"]
+
+
+def test_mapped_file_random_access_and_decrypt(tmp_path):
+    """The mapped view indexes, slices and decrypts without loading a list"""
+    from abcapstonefa25team1.backend.rsa.RSA_encrypt import RSA
+
+    rsa = RSA()
+    n, d = rsa.derive_private_key_from_factors(61, 53, 17)
+    message = "Memory mapped ciphertext " * 40
+    blocks = rsa.encrypt(message, (17, n))
+    file_path = tmp_path / "mapped.enc"
+    write_encrypted_binary(file_path, blocks, n)
+
+    with EncryptedFileMap(file_path, n) as mapped:
+        assert len(mapped) == len(blocks)
+        assert mapped[5] == blocks[5]
+        assert mapped[10:20].tolist() == blocks[10:20]
+        assert rsa.decrypt(mapped.ciphertext, (d, n)) == message
+
+    empty = tmp_path / "empty.enc"
+    empty.write_bytes(b"")
+    with EncryptedFileMap(empty, n) as mapped:
+        assert len(mapped) == 0
+
+
+def test_preview_reads_only_leading_blocks(tmp_path):
+    n = 3233
+    blocks = list(range(5000))
+    file_path = tmp_path / "preview.enc"
+    write_encrypted_binary(file_path, blocks, n)
+
+    preview = read_encrypted_preview(file_path, n, max_bytes=1001)
+    assert preview.tolist() == blocks[:500]